@@ -0,0 +1,396 @@
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_ROOT = os.path.dirname(PACKAGE_DIR)
+PACKAGE = os.path.basename(PACKAGE_DIR)
+
+# Synthetic word list sizes for the manager benchmarks
+LIST_SIZES = (2_000, 20_000, 200_000, 1_000_000)
+QUICK_LIST_SIZES = (2_000, 20_000)
+MANAGER_OPS = (
+    "remove_duplicates",
+    "sort_words",
+    "add_word",
+    "remove_invalid_words",
+    "show_stats",
+)
+# Arguments for each manager benchmark; validation runs in-process so process
+# pool start-up does not swamp the time spent checking words
+MANAGER_OP_ARGS = {
+    "add_word": (("zzzzz",), {}),
+    "remove_invalid_words": ((), {"jobs": 1}),
+}
+# "ww match" patterns, each with the plain regex a scan of the list would use
+MATCH_PATTERNS = {
+    "a?e??": "a.e..",
+    "[^st]r???": "[^st]r...",
+    "????s": "....s",
+    "(re|un).*": "(re|un).*",
+    ".*(ing|ed)": ".*(ing|ed)",
+}
+
+# Each snippet imports the word data and answers one "ww 3 -u" style query
+STARTUP_SNIPPETS = {
+    "words_module": f"""
+from {PACKAGE}.words import word_list
+used = set()
+for word in word_list:
+    if len(set(word)) == len(word) and not any(c in used for c in word):
+        used.update(word)
+""",
+    "words_module_no_pyc": f"""
+import sys
+sys.dont_write_bytecode = True
+import importlib.util
+spec = importlib.util.find_spec("{PACKAGE}.words")
+code = compile(open(spec.origin).read(), spec.origin, "exec")
+namespace = {{}}
+exec(code, namespace)
+used = set()
+for word in namespace["word_list"]:
+    if len(set(word)) == len(word) and not any(c in used for c in word):
+        used.update(word)
+""",
+    "mask_index": f"""
+from {PACKAGE}.index import load_index
+index = load_index()
+masks = index.masks
+used = 0
+for i in index.unique_ids():
+    if not masks[i] & used:
+        used |= masks[i]
+""",
+}
+
+# Fresh "ww" processes, from interpreter start to exit
+CLI_SNIPPETS = {
+    "help": ["--help"],
+    "select": ["3", "-u"],
+    "stats": ["stats"],
+}
+CLI_TEMPLATE = f"""
+import sys
+sys.argv = ["ww"] + {{args!r}}
+from {PACKAGE}.main import main
+try:
+    main()
+except SystemExit:
+    pass
+"""
+
+
+# Cold start of each command above, in seconds over a bare interpreter,
+# that "ww bench --check-startup" enforces
+STARTUP_TARGETS = {"help": 0.06, "select": 0.1, "stats": 0.1}
+
+
+def summarize(timings):
+    return {"median_s": statistics.median(timings), "min_s": min(timings)}
+
+
+def subprocess_env():
+    """Environment for fresh interpreters importing this package"""
+    # Never hand the command to a running daemon
+    env = dict(os.environ, PYTHONPATH=SOURCE_ROOT, WW_NO_DAEMON="1")
+    # Installed packages ship bytecode, so let the warm-up run write it
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def time_subprocess(code, repeat=10):
+    """Wall-clock seconds for fresh interpreters running the snippet"""
+    env = subprocess_env()
+    cmd = [sys.executable, "-c", code]
+    # Warm the OS cache and pyc files
+    subprocess.run(cmd, env=env, check=True, stdout=subprocess.DEVNULL)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=env, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_startup(repeat=10):
+    """Compare cold-start plus first query for each way of loading words"""
+    baseline = time_subprocess("pass", repeat)
+    results = {"interpreter": {"median_s": statistics.median(baseline)}}
+    for name, code in STARTUP_SNIPPETS.items():
+        timings = time_subprocess(code, repeat)
+        results[name] = {
+            "median_s": statistics.median(timings),
+            "min_s": min(timings),
+            "over_interpreter_s": statistics.median(timings)
+            - statistics.median(baseline),
+        }
+    return results
+
+
+def bench_cli(repeat=10):
+    """Cold start of the ww entry point for a few typical commands"""
+    results = {}
+    for name, args in CLI_SNIPPETS.items():
+        timings = time_subprocess(CLI_TEMPLATE.format(args=args), repeat)
+        results[name] = summarize(timings)
+    return results
+
+
+def check_startup(repeat=10, targets=STARTUP_TARGETS):
+    """Cold start of each ww command over a bare interpreter, against targets"""
+    baseline = statistics.median(time_subprocess("pass", repeat))
+    results = {}
+    for name, target in targets.items():
+        code = CLI_TEMPLATE.format(args=CLI_SNIPPETS[name])
+        overhead = statistics.median(time_subprocess(code, repeat)) - baseline
+        results[name] = {
+            "over_interpreter_s": overhead,
+            "target_s": target,
+            "ok": overhead <= target,
+        }
+    return results
+
+
+def profile_startup(argv):
+    """Imports made by a fresh "ww" run of argv, as reported by -X importtime.
+
+    Returns (module, self_us, cumulative_us, depth) tuples in the order the
+    imports finished; depth 0 marks modules imported directly.
+    """
+    code = CLI_TEMPLATE.format(args=list(argv))
+    cmd = [sys.executable, "-X", "importtime", "-c", code]
+    # Warm the OS cache and pyc files first, as time_subprocess does
+    subprocess.run(
+        cmd, env=subprocess_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    completed = subprocess.run(
+        cmd,
+        env=subprocess_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the column header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def print_import_profile(entries, argv, top=15):
+    total = sum(self_us for _, self_us, _, _ in entries)
+    command = " ".join(["ww", *argv])
+    print(f"Imports for '{command}': {len(entries)} modules, {total / 1000:.1f} ms")
+    print("  cumulative      self  module")
+    direct = [entry for entry in entries if entry[3] == 0]
+    for name, self_us, cumulative_us, _ in sorted(
+        direct, key=lambda entry: -entry[2]
+    )[:top]:
+        print(f"  {cumulative_us / 1000:7.1f} ms {self_us / 1000:6.1f} ms  {name}")
+
+
+def _load_words_module():
+    import importlib
+
+    module = importlib.import_module(f"{PACKAGE}.words")
+    # Re-execute the cached bytecode, as a fresh interpreter would
+    spec = module.__spec__
+    code = spec.loader.get_code(spec.name)
+    namespace = {}
+    exec(code, namespace)
+    used = set()
+    for word in namespace["word_list"]:
+        if len(set(word)) == len(word) and not any(c in used for c in word):
+            used.update(word)
+
+
+def _load_mask_index():
+    from .index import WordIndex, load_index, source_digest
+
+    index = WordIndex.from_file()
+    if index.digest != source_digest():
+        # The list changed on disk, so rebuild the index as any command would
+        index = load_index()
+    masks = index.masks
+    used = 0
+    for i in index.unique_ids():
+        if not masks[i] & used:
+            used |= masks[i]
+
+
+def time_call(func, repeat=50):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def bench_first_query(repeat=50):
+    """In-process load plus first query, free of interpreter start-up noise"""
+    from .index import load_index
+
+    load_index()  # make sure the index file exists and is current
+    return {
+        "words_module": time_call(_load_words_module, repeat),
+        "mask_index": time_call(_load_mask_index, repeat),
+    }
+
+
+def bench_selection(repeat=50, index=None):
+    """The default random pass for 1 to 6 words, with and without -u"""
+    from .selection import select_words
+
+    if index is None:
+        from .index import load_index
+
+        index = load_index()
+    rng = random.Random(0)
+    results = {}
+    for num_words in range(1, 7):
+        for unique_letters in (False, True):
+            name = f"n={num_words}{' -u' if unique_letters else ''}"
+            results[name] = time_call(
+                lambda: select_words(num_words, unique_letters, rng=rng, index=index),
+                repeat,
+            )
+    return results
+
+
+def bench_match(repeat=50, index=None, patterns=MATCH_PATTERNS):
+    """ww match patterns against testing every word with re"""
+    import re
+
+    from .match import Pattern, match_words, word_dawg
+
+    if index is None:
+        from .index import load_index
+
+        index = load_index()
+    words = index.words()
+    start = time.perf_counter()
+    word_dawg(index)
+    word_dawg(index, reverse=True)
+    results = {"words": len(words), "dawg_build_s": time.perf_counter() - start}
+    for text, regex in patterns.items():
+        pattern = Pattern(text)
+        matches = len(match_words(index, pattern))
+        compiled = re.compile(regex)
+        timing = time_call(lambda: match_words(index, pattern), repeat)
+        scan = time_call(lambda: [w for w in words if compiled.fullmatch(w)], repeat)
+        median = max(timing["median_s"], 1e-9)  # a clock tick can read as 0
+        results[text] = {
+            **timing,
+            "matches": matches,
+            "queries_per_s": 1 / median,
+            "matches_per_s": matches / median,
+            "re_scan_median_s": scan["median_s"],
+        }
+    return results
+
+
+def synthetic_words(size, length=5, seed=0):
+    """A random word list with about 5% duplicates and 1% invalid entries"""
+    from string import ascii_lowercase
+
+    rng = random.Random(seed)
+    letters = ascii_lowercase
+    word_list = []
+    for _ in range(size):
+        roll = rng.random()
+        if word_list and roll < 0.05:
+            word_list.append(rng.choice(word_list))
+        elif roll < 0.06:
+            word_list.append("".join(rng.choices("bcdfg1", k=length)))
+        else:
+            word = rng.choices(letters, k=length)
+            word[rng.randrange(length)] = rng.choice("aeiou")
+            word_list.append("".join(word))
+    return word_list
+
+
+def time_manager_op(word_list, op, repeat):
+    """Time one WordListManager method on a fresh copy of the list each run"""
+    from .utils import WordListManager
+
+    timings = []
+    for _ in range(repeat):
+        manager = WordListManager(word_list=list(word_list), save_on_change=False)
+        method = getattr(manager, op)
+        args, kwargs = MANAGER_OP_ARGS.get(op, ((), {}))
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            method(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def bench_manager(sizes=LIST_SIZES, repeat=5, ops=MANAGER_OPS):
+    """WordListManager operations over synthetic lists of each size"""
+    results = {}
+    for size in sizes:
+        word_list = synthetic_words(size)
+        results[str(size)] = {op: time_manager_op(word_list, op, repeat) for op in ops}
+    return results
+
+
+def environment():
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("wordle-words")
+    except PackageNotFoundError:  # pragma: no cover - running from a checkout
+        package_version = None
+    return {
+        "package_version": package_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def run_benchmarks(sizes=LIST_SIZES, repeat=5, startup=True):
+    """Every benchmark as one JSON-serializable report"""
+    results = {
+        "environment": environment(),
+        "selection": bench_selection(repeat * 10),
+        "match": bench_match(repeat * 10),
+        "manager": bench_manager(sizes, repeat),
+    }
+    if startup:
+        results["cli"] = bench_cli(repeat * 2)
+        results["startup"] = bench_startup(repeat * 2)
+        results["first_query"] = bench_first_query(repeat * 10)
+    return results
+
+
+def write_report(results, output=None):
+    text = json.dumps(results, indent=2)
+    if output in (None, "-"):
+        print(text)
+    else:
+        with open(output, "w") as f:
+            f.write(text + "\n")
+
+
+def main():  # pragma: no cover
+    write_report(run_benchmarks())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
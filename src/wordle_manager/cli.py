@@ -1,7 +1,14 @@
 import argparse
 
 
-def parse_args():
+def iso_date(text):
+    """argparse type for YYYY-MM-DD, importing datetime only when it is used"""
+    from datetime import date
+
+    return date.fromisoformat(text)
+
+
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(
         prog="wordle-manager",
         description="Examine and modify the Wordle word list",
@@ -25,16 +32,336 @@ def parse_args():
         help="Number of words to generate (default: 3)",
     )
 
+    # Add flags for a complete search or a best-coverage search instead of
+    # a single random pass
+    search_mode = parser.add_mutually_exclusive_group()
+    search_mode.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Search every combination, so a set of NUM words is always found if one exists",
+    )
+    search_mode.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Pick the words covering the most common letters",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        metavar="MS",
+        help="Time limit for --optimize in milliseconds (default: 50)",
+    )
+    parser.add_argument(
+        "--max-overlap",
+        type=int,
+        metavar="N",
+        help="With --optimize, how many letters may repeat across words (default: any)",
+    )
+
+    parser.add_argument(
+        "--seed", type=int, help="Seed the random choices for repeatable output"
+    )
+    parser.add_argument(
+        "--exclude-used",
+        action="store_true",
+        help="Skip words already in the answer history (see ww history)",
+    )
+
+    # Add options constraining which letters the selected words use
+    parser.add_argument(
+        "--require", metavar="LETTERS", help="Letters the selected words must cover"
+    )
+    parser.add_argument(
+        "--exclude", metavar="LETTERS", help="Letters no selected word may contain"
+    )
+    parser.add_argument(
+        "--pattern",
+        help="Letters some word must have in place, e.g. '?r??e'",
+    )
+    parser.add_argument(
+        "--not-at",
+        metavar="LETTER_POS",
+        action="append",
+        help="Letter no word may have at a position, e.g. 'e5' (repeatable)",
+    )
+
+    # Add options selecting which word list to use
+    parser.add_argument(
+        "--lexicon",
+        metavar="NAME",
+        help="Word list to use (default: the bundled list)",
+    )
+    parser.add_argument(
+        "--length",
+        type=int,
+        metavar="LEN",
+        help="Word length of the lexicon (default: 5)",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson"],
+        help="Write results as text, one JSON document, or one JSON record per "
+        "line (default: text, or ndjson for generate)",
+    )
+
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report the slowest imports of this command instead of running it",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report per-phase timings and counters as JSON on stderr "
+        "(also enabled by setting WW_TIMINGS to 1 or a file)",
+    )
+    parser.add_argument(
+        "--timings-file",
+        metavar="FILE",
+        help="Append the --timings report to FILE instead",
+    )
+
     subparsers = parser.add_subparsers(dest="action", required=False)
-    subparsers.add_parser("stats", help="Show statistics")
+    stats_parser = subparsers.add_parser("stats", help="Show statistics")
+    stats_parser.add_argument(
+        "--json", action="store_true", help="Same as --format json"
+    )
     subparsers.add_parser("dedup", help="Remove duplicates")
     subparsers.add_parser("sort", help="Sort the list")
-    subparsers.add_parser("clean", help="Remove invalid words")
+    clean_parser = subparsers.add_parser("clean", help="Remove invalid words")
+    clean_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the words that would be removed and why, without changing the list",
+    )
+    clean_parser.add_argument(
+        "--blocklist",
+        metavar="FILE",
+        help="Also remove the words in FILE, separated by whitespace",
+    )
+    clean_parser.add_argument(
+        "--regex",
+        action="append",
+        metavar="PATTERN",
+        help="Also remove words not fully matching PATTERN (repeatable)",
+    )
+    clean_parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes (default: one per core for large lists)",
+    )
+    subparsers.add_parser("lexicons", help="List available lexicons")
 
     find_parser = subparsers.add_parser("find-scarce", help="Find scarce letters")
     find_parser.add_argument("--num", type=int, default=3)
 
     add_parser = subparsers.add_parser("add", help="Add a word")
     add_parser.add_argument("word", help="Word to add")
-    args = parser.parse_args()
+
+    import_parser = subparsers.add_parser("import", help="Import words from a file")
+    import_parser.add_argument(
+        "file", help="File with words separated by whitespace, or - for stdin"
+    )
+    solve_parser = subparsers.add_parser(
+        "solve", help="List the words that fit the feedback so far"
+    )
+    solve_parser.add_argument(
+        "guesses",
+        nargs="+",
+        metavar="WORD:FEEDBACK",
+        help="A guess and its feedback, one letter per position: "
+        "g (green), y (yellow) or x (gray), e.g. crane:xgyxx",
+    )
+
+    anagrams_parser = subparsers.add_parser(
+        "anagrams", help="Words spelled with exactly the given letters"
+    )
+    anagrams_parser.add_argument("letters")
+    spellable_parser = subparsers.add_parser(
+        "spellable", help="Words that can be spelled from a pool of letters"
+    )
+    spellable_parser.add_argument(
+        "pool", help="Letters to draw from, each usable as often as it appears"
+    )
+    neighbors_parser = subparsers.add_parser(
+        "neighbors", help="Words differing from a word in exactly one letter"
+    )
+    neighbors_parser.add_argument("word")
+    match_parser = subparsers.add_parser(
+        "match", help="Words matching a wildcard pattern or regex"
+    )
+    match_parser.add_argument(
+        "pattern",
+        help="One letter, ? or [class] per position, e.g. 'a?e??' or '[^st]r???', "
+        "or a regex matching the whole word",
+    )
+    match_parser.add_argument(
+        "--regex", action="store_true", help="Read the pattern as a regex"
+    )
+
+    history_parser = subparsers.add_parser(
+        "history", help="List the answers used so far, or record one"
+    )
+    history_parser.add_argument(
+        "--add", metavar="WORD", help="Record WORD as the answer for --date"
+    )
+    history_parser.add_argument(
+        "--date",
+        type=iso_date,
+        metavar="YYYY-MM-DD",
+        help="Date of the --add answer (default: today)",
+    )
+    schedule_parser = subparsers.add_parser(
+        "schedule", help="Pick answers for the coming days from unused words"
+    )
+    schedule_parser.add_argument(
+        "--days", type=int, default=7, help="Days to schedule (default: 7)"
+    )
+    schedule_parser.add_argument(
+        "--start",
+        type=iso_date,
+        metavar="YYYY-MM-DD",
+        help="First date (default: the day after the last one in the history, "
+        "or today)",
+    )
+    schedule_parser.add_argument(
+        "--no-repeat-days",
+        type=int,
+        metavar="N",
+        help="Allow a word again N days after it was last used (default: never)",
+    )
+    schedule_parser.add_argument(
+        "--max-shared",
+        type=int,
+        metavar="K",
+        help="Letters an answer may share with each answer of the week before",
+    )
+    schedule_parser.add_argument(
+        "--seed",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="Seed for a repeatable schedule",
+    )
+    schedule_parser.add_argument(
+        "--save", action="store_true", help="Record the schedule in the history"
+    )
+
+    openers_parser = subparsers.add_parser(
+        "best-openers", help="Rank opening guesses by expected information"
+    )
+    openers_parser.add_argument("--top", type=int, default=10)
+    openers_parser.add_argument(
+        "--jobs", type=int, help="Worker processes (default: one per core)"
+    )
+    openers_parser.add_argument(
+        "--no-cache", action="store_true", help="Recompute instead of using the cache"
+    )
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Stream many distinct word sets as JSON lines"
+    )
+    generate_parser.add_argument(
+        "--count", type=int, default=10, help="Number of distinct sets (default: 10)"
+    )
+    generate_parser.add_argument(
+        "--jobs", type=int, help="Worker processes (default: one per core)"
+    )
+    generate_parser.add_argument(
+        "--seed",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="Seed for repeatable output",
+    )
+
+    simulate_parser = subparsers.add_parser(
+        "simulate",
+        help="Play every word as the answer and report how many guesses it took",
+    )
+    simulate_parser.add_argument(
+        "--strategy",
+        action="append",
+        choices=["random", "entropy", "coverage"],
+        help="Openers to play: NUM random disjoint words, the best entropy "
+        "opener or the best-coverage words (repeatable, default: all)",
+    )
+    simulate_parser.add_argument(
+        "--max-guesses",
+        type=int,
+        default=6,
+        help="Guesses before a game counts as failed (default: 6)",
+    )
+    simulate_parser.add_argument(
+        "--jobs", type=int, help="Worker processes (default: one per core)"
+    )
+    simulate_parser.add_argument(
+        "--seed",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="Seed for the random openers",
+    )
+    simulate_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Start over instead of resuming an interrupted run",
+    )
+
+    freq_parser = subparsers.add_parser(
+        "freq", help="Letter frequency by position, by word and by pair"
+    )
+    freq_limit = freq_parser.add_mutually_exclusive_group()
+    freq_limit.add_argument("--top", type=int, help="Show the N most frequent")
+    freq_limit.add_argument("--bottom", type=int, help="Show the N least frequent")
+    freq_parser.add_argument(
+        "--by",
+        choices=["letters", "documents", "bigrams", "position"],
+        help="Table to rank for --top/--bottom (default: letters, or position "
+        "when --position is given)",
+    )
+    freq_parser.add_argument(
+        "--position", type=int, help="Letter position (from 1) for --by position"
+    )
+    freq_parser.add_argument(
+        "--json", action="store_true", help="Same as --format json"
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Time selection, list operations and start-up as JSON"
+    )
+    bench_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="Synthetic word list sizes (default: 2000 to 1000000)",
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per measurement (default: 5)"
+    )
+    bench_parser.add_argument(
+        "--quick", action="store_true", help="Small lists only, for a fast check"
+    )
+    bench_parser.add_argument(
+        "--no-startup", action="store_true", help="Skip the subprocess start-up timings"
+    )
+    bench_parser.add_argument(
+        "--check-startup",
+        action="store_true",
+        help="Only time cold start of ww and fail if it is over the target",
+    )
+    bench_parser.add_argument(
+        "-o", "--output", help="Write the JSON report to a file instead of stdout"
+    )
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep word lists loaded and answer commands over a socket"
+    )
+    serve_parser.add_argument(
+        "--stop", action="store_true", help="Stop the running daemon"
+    )
+    args = parser.parse_args(argv)
+    # The --budget default is filled in here, so that either flag given
+    # without --optimize can be told apart from an unset one
+    if not args.optimize and (args.budget is not None or args.max_overlap is not None):
+        parser.error("--budget and --max-overlap only apply with --optimize")
+    if args.budget is None:
+        args.budget = 50
     return args
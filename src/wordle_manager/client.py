@@ -0,0 +1,64 @@
+import os
+
+from .storage import cache_dir
+
+# Read-only commands a running daemon answers; None is word selection
+SERVED_ACTIONS = frozenset(
+    {
+        None,
+        "stats",
+        "freq",
+        "find-scarce",
+        "solve",
+        "best-openers",
+        "lexicons",
+        "anagrams",
+        "spellable",
+        "neighbors",
+        "match",
+    }
+)
+TIMEOUT = 30.0
+
+
+def socket_path():
+    """Where ww serve listens, overridable with $WW_SOCKET"""
+    return os.environ.get("WW_SOCKET") or os.path.join(cache_dir(), "ww.sock")
+
+
+def request(message, path=None, timeout=TIMEOUT):
+    """Send one JSON message to the daemon and return its JSON reply.
+
+    Returns None when no daemon is listening, so callers can fall back to
+    doing the work themselves.
+    """
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    # Imported only once a daemon may be listening, to keep start-up fast
+    import json
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def forward(argv, path=None):
+    """Run a command line on the daemon, or return None if it cannot"""
+    if os.environ.get("WW_NO_DAEMON"):
+        return None
+    response = request({"argv": argv}, path)
+    # Stale or unsupported commands are answered without a status
+    if response is None or "status" not in response:
+        return None
+    return response
@@ -0,0 +1,155 @@
+import weakref
+from dataclasses import dataclass
+from string import ascii_lowercase
+
+from .search import word_mask
+
+# Record numbers of the bits set in each byte value, for reading bitsets
+_BYTE_BITS = [tuple(j for j in range(8) if value >> j & 1) for value in range(256)]
+
+_cached_bitsets = weakref.WeakKeyDictionary()
+
+
+class ConstraintError(ValueError):
+    pass
+
+
+def bit_ids(bits):
+    """Word record numbers in an int bitset, in ascending order"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return [
+        offset * 8 + j
+        for offset, value in enumerate(data)
+        if value
+        for j in _BYTE_BITS[value]
+    ]
+
+
+class LetterBitsets:
+    """Inverted indexes of a WordIndex as int bitsets of word record numbers.
+
+    Bit i of positions[p][letter] is set when word i has the letter at
+    position p, and letters[letter] is the union over all positions, so
+    constraints reduce to a handful of AND/OR operations on big integers.
+    """
+
+    def __init__(self, index):
+        count = len(index)
+        size = (count + 7) // 8
+        columns = [{} for _ in range(index.width)]
+        for i, word in enumerate(index.words()):
+            byte, bit = i >> 3, 1 << (i & 7)
+            for column, letter in zip(columns, word):
+                if letter not in column:
+                    column[letter] = bytearray(size)
+                column[letter][byte] |= bit
+
+        self.all = (1 << count) - 1
+        self.positions = [
+            {letter: int.from_bytes(data, "little") for letter, data in column.items()}
+            for column in columns
+        ]
+        self.letters = {}
+        for column in self.positions:
+            for letter, bits in column.items():
+                self.letters[letter] = self.letters.get(letter, 0) | bits
+
+    def at(self, position, letter):
+        return self.positions[position].get(letter, 0)
+
+    def containing(self, letter):
+        return self.letters.get(letter, 0)
+
+
+def letter_bitsets(index):
+    """LetterBitsets for an index, built once per index object"""
+    bitsets = _cached_bitsets.get(index)
+    if bitsets is None:
+        bitsets = _cached_bitsets[index] = LetterBitsets(index)
+    return bitsets
+
+
+def _letters(text, option):
+    letters = text.lower().replace(",", "")
+    if not set(letters) <= set(ascii_lowercase):
+        raise ConstraintError(f"{option} takes letters a-z, got '{text}'")
+    return "".join(sorted(set(letters)))
+
+
+@dataclass(frozen=True)
+class Constraints:
+    """Which letters a disjoint word set must or must not use.
+
+    required letters must appear somewhere in the set and excluded letters
+    nowhere in it. placed holds (position, letter) pairs that the set must
+    have, like green Wordle tiles; misplaced holds pairs no word may have,
+    like yellow ones. Positions count from 0.
+    """
+
+    required: str = ""
+    excluded: str = ""
+    placed: tuple[tuple[int, str], ...] = ()
+    misplaced: tuple[tuple[int, str], ...] = ()
+
+    @classmethod
+    def parse(cls, require=None, exclude=None, pattern=None, not_at=()):
+        """Build constraints from command line text.
+
+        pattern has one character per position, a letter or '?' / '.' / '_'
+        for any letter; not_at entries are a letter and a position from 1,
+        such as 'e5'.
+        """
+        placed = []
+        for position, char in enumerate((pattern or "").lower()):
+            if char in "?._":
+                continue
+            if char not in ascii_lowercase:
+                raise ConstraintError(f"Unexpected '{char}' in pattern '{pattern}'")
+            placed.append((position, char))
+        misplaced = []
+        for entry in not_at or ():
+            letter, position = entry[:1].lower(), entry[1:]
+            if letter not in ascii_lowercase or not position.isdigit():
+                raise ConstraintError(
+                    f"Expected a letter and a position such as 'e5', got '{entry}'"
+                )
+            if int(position) < 1:
+                raise ConstraintError(f"Positions count from 1, got '{entry}'")
+            misplaced.append((int(position) - 1, letter))
+        return cls(
+            _letters(require or "", "--require"),
+            _letters(exclude or "", "--exclude"),
+            tuple(placed),
+            tuple(sorted(misplaced)),
+        )
+
+    def __bool__(self):
+        return bool(self.required or self.excluded or self.placed or self.misplaced)
+
+    @property
+    def required_mask(self):
+        return word_mask(self.required + "".join(letter for _, letter in self.placed))
+
+    @property
+    def excluded_mask(self):
+        return word_mask(self.excluded)
+
+    def candidates(self, bitsets, width):
+        """Bitset of the words that may appear in a set meeting the constraints"""
+        for position, _ in self.placed + self.misplaced:
+            if position >= width:
+                raise ConstraintError(
+                    f"Position {position + 1} is past the end of {width}-letter words"
+                )
+        if self.required_mask & self.excluded_mask:
+            return 0
+        allowed = bitsets.all
+        for letter in self.excluded:
+            allowed &= ~bitsets.containing(letter)
+        for position, letter in self.misplaced:
+            allowed &= ~bitsets.at(position, letter)
+        # Words in a disjoint set never share a letter, so the one word that
+        # holds a placed letter must hold it in that position
+        for position, letter in self.placed:
+            allowed &= ~(bitsets.containing(letter) & ~bitsets.at(position, letter))
+        return allowed
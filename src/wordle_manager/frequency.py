@@ -0,0 +1,158 @@
+import json
+import os
+import zlib
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from string import ascii_lowercase
+
+from .storage import atomic_write, cache_dir
+
+TABLES = ("letters", "documents", "bigrams", "position")
+VERSION = 1
+
+# Analyses of recent list versions kept in memory, by content hash
+MEMORY_CACHE_SIZE = 8
+
+_cached_frequencies = {}
+
+
+class FrequencyError(ValueError):
+    pass
+
+
+def content_hash(word_list):
+    """Checksum of the words and their order, identifying one list version"""
+    crc = 0
+    for start in range(0, len(word_list), 100_000):
+        chunk = "\n".join(word_list[start : start + 100_000]) + "\n"
+        crc = zlib.crc32(chunk.encode(), crc)
+    return f"{len(word_list):x}-{crc:08x}"
+
+
+class LetterFrequency:
+    """Letter counts of a word list by position, by word and by pair.
+
+    positions[letter][i] counts the letter at position i, documents counts
+    the words containing each letter at least once, and bigrams counts
+    adjacent letter pairs inside words.
+    """
+
+    def __init__(self, positions, documents, bigrams, word_count):
+        self.positions = positions
+        self.documents = documents
+        self.bigrams = bigrams
+        self.word_count = word_count
+
+    @classmethod
+    def from_words(cls, word_list):
+        word_list = list(word_list)
+        lengths = set(map(len, word_list)) or {0}
+        width = max(lengths)
+        columns = []
+        for i in range(width):
+            if i < min(lengths):
+                columns.append(Counter(map(itemgetter(i), word_list)))
+            else:
+                columns.append(Counter(w[i] for w in word_list if len(w) > i))
+        letters = sorted(set(ascii_lowercase).union(*columns))
+        positions = {
+            letter: [column[letter] for column in columns] for letter in letters
+        }
+        documents = Counter(chain.from_iterable(map(set, word_list)))
+        bigrams = Counter()
+        for i in range(width - 1):
+            bigrams.update(w[i : i + 2] for w in word_list if len(w) > i + 1)
+        return cls(positions, dict(documents), dict(bigrams), len(word_list))
+
+    @property
+    def width(self):
+        return len(next(iter(self.positions.values()), []))
+
+    def letter_counts(self):
+        """Occurrences of each letter in any position"""
+        return {letter: sum(counts) for letter, counts in self.positions.items()}
+
+    def table(self, name="letters", position=None):
+        """Counts for one table: letters, documents, bigrams or position"""
+        match name:
+            case "letters":
+                return self.letter_counts()
+            case "documents":
+                return self.documents
+            case "bigrams":
+                return self.bigrams
+            case "position":
+                if position is None:
+                    raise FrequencyError("Ranking by position needs a position")
+                if not 0 <= position < self.width:
+                    raise FrequencyError(
+                        f"Position must be between 1 and {self.width}, "
+                        f"got {position + 1}"
+                    )
+                return {letter: c[position] for letter, c in self.positions.items()}
+        raise FrequencyError(f"Unknown table '{name}', expected one of {TABLES}")
+
+    def top(self, n, name="letters", position=None):
+        """The n most frequent entries, most frequent first"""
+        counts = self.table(name, position)
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+    def bottom(self, n, name="letters", position=None):
+        """The n least frequent entries that occur at all, rarest first"""
+        counts = self.table(name, position)
+        present = [item for item in counts.items() if item[1]]
+        return sorted(present, key=lambda item: (item[1], item[0]))[:n]
+
+    def to_dict(self):
+        return {
+            "words": self.word_count,
+            "positions": self.positions,
+            "documents": dict(sorted(self.documents.items())),
+            "bigrams": dict(sorted(self.bigrams.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["positions"], data["documents"], data["bigrams"], data["words"])
+
+
+def frequency_cache_path(name):
+    return os.path.join(cache_dir(), f"{name}.freq.json")
+
+
+def letter_frequency(word_list, name=None):
+    """Frequency analysis of a word list, computed once per list version.
+
+    Results are kept in memory by content hash and, when a name is given,
+    on disk next to the other caches for that list.
+    """
+    key = content_hash(word_list)
+    if key in _cached_frequencies:
+        return _cached_frequencies[key]
+
+    frequency = None
+    path = frequency_cache_path(name) if name else None
+    if path:
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached["key"] == key and cached["version"] == VERSION:
+                frequency = LetterFrequency.from_dict(cached["frequency"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if frequency is None:
+        frequency = LetterFrequency.from_words(word_list)
+        if path:
+            data = {"key": key, "version": VERSION, "frequency": frequency.to_dict()}
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                atomic_write(path, json.dumps(data))
+            except OSError:  # pragma: no cover - no writable cache directory
+                pass
+
+    if len(_cached_frequencies) >= MEMORY_CACHE_SIZE:
+        del _cached_frequencies[next(iter(_cached_frequencies))]
+    _cached_frequencies[key] = frequency
+    return frequency
@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .index import WordIndex
+from .search import DisjointSearch, mask_to_letters, word_mask
+
+# Seeds handed to a worker per task, to keep inter-process traffic small
+BATCH_SIZE = 16
+
+_search = None
+
+
+def _init_worker(index_path, unique_letters):
+    """Build the search once per process from the memory-mapped index.
+
+    Forked workers inherit the parent's search and skip this entirely.
+    """
+    global _search
+    if _search is None:
+        _search = DisjointSearch.from_index(
+            WordIndex.from_file(index_path), unique_letters
+        )
+
+
+def _find_batch(num_words, seeds):
+    sets = []
+    for seed in seeds:
+        words = _search.find(num_words, random.Random(seed))
+        if words is not None:
+            sets.append(words)
+    return sets
+
+
+def _pool_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()  # pragma: no cover
+
+
+def iter_disjoint_sets(
+    lexicon,
+    num_words,
+    count,
+    unique_letters=False,
+    jobs=None,
+    seed=None,
+    max_attempts=None,
+):
+    """Yield up to count distinct disjoint word sets as soon as they are found"""
+    global _search
+    index = lexicon.index
+    _search = DisjointSearch.from_index(index, unique_letters)
+    if _search.find(num_words) is None:
+        return
+
+    seeds = random.Random(seed)
+    max_attempts = max_attempts or count * 20
+    batches = (
+        [seeds.getrandbits(64) for _ in range(BATCH_SIZE)]
+        for _ in range(-(-max_attempts // BATCH_SIZE))
+    )
+    seen = set()
+
+    def unseen(sets):
+        for words in sets:
+            key = tuple(sorted(words))
+            if key not in seen and len(seen) < count:
+                seen.add(key)
+                yield words
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for batch in batches:
+            yield from unseen(_find_batch(num_words, batch))
+            if len(seen) >= count:
+                return
+        return
+
+    with ProcessPoolExecutor(
+        jobs,
+        mp_context=_pool_context(),
+        initializer=_init_worker,
+        initargs=(lexicon.index_path, unique_letters),
+    ) as pool:
+        pending = set()
+        for batch in batches:
+            pending.add(pool.submit(_find_batch, num_words, batch))
+            if len(pending) < jobs * 2:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from unseen(future.result())
+            if len(seen) >= count:
+                break
+        for future in pending:
+            if len(seen) >= count:
+                future.cancel()
+            else:
+                yield from unseen(future.result())
+
+
+def set_record(words):
+    return {"words": words, "letters": mask_to_letters(word_mask("".join(words)))}
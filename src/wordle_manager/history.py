@@ -0,0 +1,129 @@
+import os
+import random
+from datetime import date, timedelta
+
+from .constraints import bit_ids
+from .index import shuffled_ids
+from .storage import append_log, data_dir, read_log
+
+# Days before a scheduled date whose answers count for --max-shared
+DIVERSITY_DAYS = 7
+
+
+class HistoryError(ValueError):
+    pass
+
+
+def history_dir():
+    """Directory holding the answer history of each lexicon"""
+    if path := os.environ.get("WW_HISTORY_DIR"):
+        return path
+    return os.path.join(data_dir(), "history")
+
+
+def history_path(lexicon):
+    return os.path.join(history_dir(), f"{lexicon.name}-{lexicon.length}.history")
+
+
+def id_bitset(ids, count):
+    """Int bitset with the bits of ids set, out of count word records"""
+    data = bytearray((count + 7) // 8)
+    for i in ids:
+        data[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(data, "little")
+
+
+class History:
+    """Answers used, or scheduled, on each date in an append-only file.
+
+    Each line holds an ISO date and a word. Lines are only ever added, so
+    the file is the complete log; a last line torn by an interrupted write
+    has no newline and is ignored, then dropped by the next append.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = []
+        for line in read_log(path):
+            day, _, word = line.partition(" ")
+            try:
+                self.entries.append((date.fromisoformat(day), word))
+            except ValueError:
+                continue
+
+    @classmethod
+    def for_lexicon(cls, lexicon):
+        return cls(history_path(lexicon))
+
+    def record(self, entries):
+        """Append (date, word) pairs to the log in a single write"""
+        entries = list(entries)
+        if not entries:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        append_log(self.path, (f"{day.isoformat()} {word}" for day, word in entries))
+        self.entries.extend(entries)
+
+    def last_date(self):
+        return max((day for day, _ in self.entries), default=None)
+
+    def used_bits(self, index):
+        """Bitset over the index's record numbers of every word in the log"""
+        ids = (index.position(word) for _, word in self.entries)
+        return id_bitset((i for i in ids if i >= 0), len(index))
+
+
+def schedule(
+    index,
+    history,
+    days,
+    start,
+    no_repeat_days=None,
+    max_shared=None,
+    unique_letters=False,
+    seed=None,
+):
+    """Pick an answer for each of days dates from start on.
+
+    A word is passed over if the log, or an earlier pick, has it within
+    no_repeat_days of the date, or at all when no_repeat_days is None. With
+    max_shared, a word may share at most that many letters with each answer
+    of the DIVERSITY_DAYS days before. Repeats are removed from the
+    candidates as one bitset per date; only the letter check looks at words
+    one by one, in random order until one fits. Returns (date, word) pairs.
+    """
+    rng = random.Random(seed)
+    masks = index.masks
+    count = len(index)
+    candidates = (1 << count) - 1
+    if unique_letters:
+        candidates = id_bitset(index.unique_ids(), count)
+    used = [(day, index.position(word)) for day, word in history.entries]
+    used = [(day, i) for day, i in used if i >= 0]
+    if no_repeat_days is None:
+        candidates &= ~id_bitset((i for _, i in used), count)
+
+    picks = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        allowed = candidates
+        if no_repeat_days is not None:
+            recent = (i for d, i in used if abs((day - d).days) < no_repeat_days)
+            allowed &= ~id_bitset(recent, count)
+        shared = []
+        if max_shared is not None:
+            window = timedelta(days=DIVERSITY_DAYS)
+            shared = [masks[i] for d, i in used if day - window <= d < day]
+        for i in shuffled_ids(bit_ids(allowed), rng):
+            if all((masks[i] & mask).bit_count() <= max_shared for mask in shared):
+                break
+        else:
+            raise HistoryError(
+                f"No word fits {day.isoformat()}; allow repeats sooner or "
+                "more shared letters"
+            )
+        picks.append((day, index.word(i)))
+        used.append((day, i))
+        if no_repeat_days is None:
+            candidates &= ~(1 << i)
+    return picks
@@ -0,0 +1,207 @@
+import mmap
+import os
+import struct
+import sys
+
+from .storage import PACKAGE_DIR, atomic_write, default_storage
+
+MAGIC = b"WWIX"
+VERSION = 1
+# magic, version, word width, word count, source digest
+HEADER = struct.Struct("<4sBBI16s")
+FLAG_REPEATS = 0x01
+# Digest of indexes built from a word list in memory rather than from storage
+NO_DIGEST = b"\0" * 16
+
+INDEX_FILE = os.path.join(PACKAGE_DIR, "words.idx")
+
+_cached_indexes = {}
+
+
+def source_digest():
+    """Size and checksum of the persisted word list, to detect a stale index"""
+    return default_storage.digest()
+
+
+def _pack(word_list, width):
+    from array import array
+
+    records = sorted({w for w in word_list if len(w) == width and w.isascii()})
+    records = [w for w in records if w.isalpha() and w.islower()]
+    masks = array("I")
+    flags = bytearray()
+    for word in records:
+        mask = 0
+        for letter in word:
+            mask |= 1 << (ord(letter) - 97)
+        masks.append(mask)
+        flags.append(FLAG_REPEATS if mask.bit_count() != len(word) else 0)
+    if sys.byteorder != "little":  # pragma: no cover
+        masks.byteswap()
+    return records, masks, bytes(flags)
+
+
+def build_index(word_list, digest, width=5):
+    """Serialize the word list into the on-disk index layout"""
+    records, masks, flags = _pack(word_list, width)
+    body = "".join(records).encode("ascii")
+    padding = b"\0" * (-(HEADER.size + len(body)) % 4)
+    header = HEADER.pack(MAGIC, VERSION, width, len(records), digest)
+    return header + body + padding + masks.tobytes() + flags
+
+
+def write_index(word_list, path=INDEX_FILE, digest=None, width=5):
+    """Write the index atomically so readers never see a partial file"""
+    if digest is None:
+        digest = source_digest()
+    data = build_index(word_list, digest, width)
+    atomic_write(path, data)
+    return data
+
+
+class WordIndex:
+    """Read-only view over a packed word index.
+
+    Words are fixed-width ASCII records in sorted order, followed by a
+    parallel uint32 array of letter masks and a byte of flags per word.
+    Nothing is decoded into Python objects until it is asked for.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, width, count, digest = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a word index")
+        self.width = width
+        self.digest = digest
+        self._content_key = None
+        self._count = count
+        start = HEADER.size
+        end = start + width * count
+        self._records = view[start:end]
+        start = end + (-end % 4)
+        end = start + 4 * count
+        if sys.byteorder == "little":
+            self.masks = view[start:end].cast("I")
+        else:  # pragma: no cover
+            from array import array
+
+            self.masks = array("I", view[start:end])
+            self.masks.byteswap()
+        self.flags = view[end : end + count]
+
+    @classmethod
+    def from_file(cls, path=INDEX_FILE):
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_words(cls, word_list, width=5, digest=NO_DIGEST):
+        return cls(build_index(word_list, digest, width))
+
+    @property
+    def content_key(self):
+        """Identifies the words of the index, for caching results over them.
+
+        The source digest when there is one; indexes built in memory all
+        share NO_DIGEST, so theirs is a hash of the records instead.
+        """
+        if self._content_key is None:
+            if self.digest != NO_DIGEST:
+                self._content_key = self.digest
+            else:
+                from hashlib import blake2b
+
+                self._content_key = blake2b(self._records, digest_size=16).digest()
+        return self._content_key
+
+    def __len__(self):
+        return self._count
+
+    def word(self, i):
+        start = i * self.width
+        return str(self._records[start : start + self.width], "ascii")
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        return self.word(i)
+
+    def __iter__(self):
+        return (self.word(i) for i in range(self._count))
+
+    def position(self, word):
+        """Return the record number of a word, or -1 if absent"""
+        if len(word) != self.width:
+            return -1
+        key = word.encode("ascii", "replace")
+        lo, hi = 0, self._count
+        width = self.width
+        records = self._records
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if records[mid * width : (mid + 1) * width].tobytes() < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and records[lo * width : (lo + 1) * width] == key:
+            return lo
+        return -1
+
+    def __contains__(self, word):
+        return self.position(word) >= 0
+
+    def has_repeats(self, i):
+        return bool(self.flags[i] & FLAG_REPEATS)
+
+    def unique_ids(self):
+        """Record numbers of words with no repeating letters"""
+        flags = self.flags
+        return [i for i in range(self._count) if not flags[i] & FLAG_REPEATS]
+
+    def words(self):
+        text = str(self._records, "ascii")
+        width = self.width
+        return [text[i : i + width] for i in range(0, len(text), width)]
+
+
+def load_index(path=INDEX_FILE, rebuild=True, storage=default_storage, width=5):
+    """Load an index, regenerating it if its word list has changed"""
+    digest = storage.digest()
+    cached = _cached_indexes.get(path)
+    if cached is not None and cached.digest == digest:
+        return cached
+    try:
+        index = WordIndex.from_file(path)
+        if index.digest == digest and index.width == width:
+            _cached_indexes[path] = index
+            return index
+    except (OSError, ValueError, struct.error):
+        pass
+    if not rebuild:
+        return None
+
+    word_list = storage.load()
+    try:
+        data = write_index(word_list, path=path, digest=digest, width=width)
+    except OSError:  # pragma: no cover - read-only installs
+        data = build_index(word_list, digest, width)
+    _cached_indexes[path] = WordIndex(data)
+    return _cached_indexes[path]
+
+
+def shuffled_ids(ids, rng):
+    """Lazily yield ids in random order without shuffling the whole range"""
+    if isinstance(ids, int):
+        ids = range(ids)
+    swapped = {}
+    n = len(ids)
+    for i in range(n):
+        j = rng.randrange(i, n)
+        pick = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        yield ids[pick]
+
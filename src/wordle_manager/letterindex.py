@@ -0,0 +1,124 @@
+import weakref
+from collections import Counter
+from string import ascii_lowercase
+
+from .search import word_mask
+
+_cached_indexes = weakref.WeakKeyDictionary()
+
+
+class LetterQueryError(ValueError):
+    pass
+
+
+def _letters(text, what):
+    letters = text.lower()
+    if not letters or not set(letters) <= set(ascii_lowercase):
+        raise LetterQueryError(f"{what} takes letters a-z, got '{text}'")
+    return letters
+
+
+class LetterIndex:
+    """Hash tables over a WordIndex for letter puzzle lookups.
+
+    signatures maps a word's letters in sorted order to the words spelled
+    with exactly those letters, by_mask maps a letter mask to the words
+    using exactly that set of letters, and wildcards maps a word with one
+    position blanked out, such as 'cr?ne', to the words fitting it. Each
+    table is built the first time a query needs it, and lookups return
+    record numbers in ascending order, so words come back sorted.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._signatures = None
+        self._by_mask = None
+        self._wildcards = None
+
+    @property
+    def signatures(self):
+        if self._signatures is None:
+            table = {}
+            for i, word in enumerate(self.index.words()):
+                table.setdefault("".join(sorted(word)), []).append(i)
+            self._signatures = table
+        return self._signatures
+
+    @property
+    def by_mask(self):
+        if self._by_mask is None:
+            table = {}
+            for i, mask in enumerate(self.index.masks):
+                table.setdefault(mask, []).append(i)
+            self._by_mask = table
+        return self._by_mask
+
+    @property
+    def wildcards(self):
+        if self._wildcards is None:
+            table = {}
+            for i, word in enumerate(self.index.words()):
+                for j in range(len(word)):
+                    table.setdefault(f"{word[:j]}?{word[j + 1 :]}", []).append(i)
+            self._wildcards = table
+        return self._wildcards
+
+    def _words(self, ids):
+        return [self.index.word(i) for i in ids]
+
+    def anagrams(self, letters):
+        """Words using exactly these letters, each as often as given"""
+        letters = _letters(letters, "anagrams")
+        return self._words(self.signatures.get("".join(sorted(letters)), ()))
+
+    def spellable(self, pool):
+        """Words whose letters can all be taken from the pool.
+
+        A letter can be used as often as it appears in the pool. Candidate
+        masks are the subsets of the pool's mask, found by walking those
+        subsets when there are fewer of them than masks in the table.
+        """
+        pool = _letters(pool, "spellable")
+        pool_mask = word_mask(pool)
+        by_mask = self.by_mask
+        if 1 << pool_mask.bit_count() < len(by_mask):
+            ids = []
+            subset = pool_mask
+            while subset:
+                ids.extend(by_mask.get(subset, ()))
+                subset = (subset - 1) & pool_mask
+        else:
+            ids = [
+                i
+                for mask, group in by_mask.items()
+                if not mask & ~pool_mask
+                for i in group
+            ]
+        available = Counter(pool)
+        index = self.index
+
+        def enough(i):
+            # A word without repeats needs each letter once, which the mask
+            # test already guarantees
+            if not index.has_repeats(i):
+                return True
+            return all(available[c] >= n for c, n in Counter(index.word(i)).items())
+
+        return self._words(sorted(filter(enough, ids)))
+
+    def neighbors(self, word):
+        """Words differing from word in exactly one position"""
+        word = _letters(word, "neighbors")
+        wildcards = self.wildcards
+        ids = set()
+        for j in range(len(word)):
+            ids.update(wildcards.get(f"{word[:j]}?{word[j + 1 :]}", ()))
+        return [other for other in self._words(sorted(ids)) if other != word]
+
+
+def letter_index(index):
+    """LetterIndex for an index, built once per index object"""
+    letters = _cached_indexes.get(index)
+    if letters is None:
+        letters = _cached_indexes[index] = LetterIndex(index)
+    return letters
@@ -0,0 +1,104 @@
+import os
+import re
+
+from .index import INDEX_FILE, load_index
+from .storage import TextStorage, data_dir, default_storage
+
+DEFAULT_LEXICON = "default"
+DEFAULT_LENGTH = 5
+LEXICON_FILE = re.compile(r"^(?P<name>[\w.]+)-(?P<length>\d+)\.txt$")
+
+_lexicons = {}
+
+
+class LexiconNotFoundError(LookupError):
+    pass
+
+
+def lexicon_dir():
+    """Directory holding extra lexicons as NAME-LENGTH.txt files"""
+    if path := os.environ.get("WW_LEXICON_DIR"):
+        return path
+    return os.path.join(data_dir(), "lexicons")
+
+
+class Lexicon:
+    """A named word list of a single word length.
+
+    Nothing is read from disk until words or index is first accessed, so
+    selecting one lexicon never pays for loading another.
+    """
+
+    def __init__(self, name, length, storage, index_path):
+        self.name = name
+        self.length = length
+        self.storage = storage
+        self.index_path = index_path
+
+    def __repr__(self):
+        return f"Lexicon({self.name!r}, {self.length})"
+
+    @classmethod
+    def from_file(cls, path):
+        match = LEXICON_FILE.match(os.path.basename(path))
+        if match is None:
+            raise ValueError(f"Lexicon files are named NAME-LENGTH.txt, got {path}")
+        return cls(
+            match["name"],
+            int(match["length"]),
+            TextStorage(path),
+            os.path.splitext(path)[0] + ".idx",
+        )
+
+    @property
+    def words(self):
+        return self.storage.load()
+
+    @property
+    def index(self):
+        return load_index(self.index_path, storage=self.storage, width=self.length)
+
+
+BUNDLED = Lexicon(DEFAULT_LEXICON, DEFAULT_LENGTH, default_storage, INDEX_FILE)
+
+
+def list_lexicons():
+    """Every available (name, length) pair, without loading any word lists"""
+    found = {(BUNDLED.name, BUNDLED.length)}
+    try:
+        filenames = os.listdir(lexicon_dir())
+    except FileNotFoundError:
+        filenames = []
+    for filename in filenames:
+        if match := LEXICON_FILE.match(filename):
+            found.add((match["name"], int(match["length"])))
+    return sorted(found)
+
+
+def get_lexicon(name=None, length=None):
+    """Return the lexicon for a name and word length, loading nothing yet"""
+    name = name or DEFAULT_LEXICON
+    if length is None:
+        lengths = [n for lexicon_name, n in list_lexicons() if lexicon_name == name]
+        if DEFAULT_LENGTH in lengths or not lengths:
+            length = DEFAULT_LENGTH
+        elif len(lengths) == 1:
+            length = lengths[0]
+        else:
+            choices = ", ".join(map(str, lengths))
+            raise LexiconNotFoundError(
+                f"Lexicon '{name}' has several word lengths ({choices}); pick one with --length"
+            )
+
+    key = (name, length)
+    if key not in _lexicons:
+        if key == (BUNDLED.name, BUNDLED.length):
+            _lexicons[key] = BUNDLED
+        else:
+            path = os.path.join(lexicon_dir(), f"{name}-{length}.txt")
+            if not os.path.exists(path):
+                raise LexiconNotFoundError(
+                    f"No {length}-letter lexicon named '{name}' in {lexicon_dir()}"
+                )
+            _lexicons[key] = Lexicon.from_file(path)
+    return _lexicons[key]
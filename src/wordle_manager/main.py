@@ -1,36 +1,138 @@
-import random
 import sys
-from string import ascii_lowercase
 
+from . import output, timings
 from .cli import parse_args
-from .utils import WordListManager, has_repeating_letters
-from .words import word_list
+from .lexicons import LexiconNotFoundError, get_lexicon, list_lexicons
 
+# Everything else is imported by the command that needs it, so "ww --help"
+# and the other light commands start without loading the word list or the
+# search, solver and benchmark modules. Lexicons load their words lazily.
 
-def run(num_words=3, unique_letters=None):
-    used_letters = set()
-    selected_words = []
 
-    # Filter word list if unique letters flag is set
-    available_words = word_list
-    if unique_letters is not None:
-        available_words = [
-            word for word in word_list if not has_repeating_letters(word)
+def __getattr__(name):
+    # WordListManager stays a module attribute that callers can replace,
+    # but utils is only imported the first time it is used
+    if name == "WordListManager":
+        from .utils import WordListManager
+
+        globals()[name] = WordListManager
+        return WordListManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def selection_lines(selection, constraints=None):
+    if not selection.words:
+        requirement = "that meets the constraints" if constraints else "exists"
+        return [
+            f"No set of {selection.requested} words without shared letters "
+            f"{requirement}"
         ]
-    for word in random.sample(available_words, len(available_words)):
-        if not any(letter in used_letters for letter in word):
-            selected_words.append(word)
-            used_letters.update(word)
+    return [
+        f"Selected words: {list(selection.words)}",
+        f"Used letters: {selection.used_letters}",
+    ]
+
+
+def print_selection(selection, constraints=None):
+    output.result(selection.to_dict(), *selection_lines(selection, constraints))
+
+
+def print_simulation(result):
+    openers = ", ".join(result.openers) or "none"
+    print(f"Strategy: {result.strategy} (openers: {openers})")
+    print(f"  Games:           {result.games:,}")
+    print(f"  Average guesses: {result.average:.3f}")
+    print(f"  Failed:          {result.failed:,} ({result.failure_rate:.2%})")
+    print("  Guess distribution:")
+    rows = [*result.distribution.items(), ("X", result.failed)]
+    for guesses, count in rows:
+        share = count / result.games if result.games else 0.0
+        bar = "#" * round(share * 40)
+        print(f"    {guesses}: {count:>7,}  {share:>6.1%}  {bar}".rstrip())
+
+
+def used_bits(lexicon, length, index):
+    """Bitset of the index's words that the answer history has used"""
+    from .history import History
+
+    return History.for_lexicon(get_lexicon(lexicon, length)).used_bits(index)
 
-        if len(selected_words) == num_words:
-            break
 
-    used_letters = "".join(
-        letter if letter in used_letters else "_" for letter in ascii_lowercase
+def run(
+    num_words=3,
+    unique_letters=None,
+    lexicon=None,
+    length=None,
+    seed=None,
+    constraints=None,
+    exclude_used=False,
+):
+    with timings.phase("import"):
+        from .selection import select_words
+    with timings.phase("load"):
+        index = get_lexicon(lexicon, length).index
+        exclude = used_bits(lexicon, length, index) if exclude_used else 0
+    selection = select_words(
+        num_words,
+        unique_letters,
+        seed=seed,
+        index=index,
+        constraints=constraints,
+        exclude=exclude,
     )
+    with timings.phase("output"):
+        print_selection(selection, constraints)
 
-    print("Selected words:", selected_words)
-    print("Used letters:", used_letters.upper())
+
+def run_exhaustive(
+    num_words=3,
+    unique_letters=False,
+    lexicon=None,
+    length=None,
+    seed=None,
+    constraints=None,
+    exclude_used=False,
+):
+    with timings.phase("import"):
+        from .selection import select_words
+    with timings.phase("load"):
+        index = get_lexicon(lexicon, length).index
+        exclude = used_bits(lexicon, length, index) if exclude_used else 0
+    selection = select_words(
+        num_words,
+        unique_letters,
+        seed=seed,
+        index=index,
+        exhaustive=True,
+        constraints=constraints,
+        exclude=exclude,
+    )
+    with timings.phase("output"):
+        print_selection(selection, constraints)
+
+
+def run_optimized(
+    num_words=3,
+    unique_letters=False,
+    lexicon=None,
+    length=None,
+    budget=50,
+    max_overlap=None,
+):
+    with timings.phase("import"):
+        from .optimize import optimize_coverage
+    with timings.phase("load"):
+        index = get_lexicon(lexicon, length).index
+    with timings.phase("search"):
+        coverage = optimize_coverage(
+            index, num_words, unique_letters, budget / 1000, max_overlap
+        )
+    with timings.phase("output"):
+        lines = selection_lines(coverage)
+        if coverage.words:
+            status = "optimal" if coverage.optimal else f"best found in {budget:g} ms"
+            lines.append(f"Coverage score: {coverage.score:.3f} ({status})")
+        output.result(coverage.to_dict(), *lines)
 
 
 def main():
@@ -42,32 +144,428 @@ def main():
 
     args = parse_args()
 
+    # Time the imports of the same command line in a fresh interpreter
+    if "--profile-startup" in sys.argv[1:]:
+        from .bench import print_import_profile, profile_startup
+
+        argv = [arg for arg in sys.argv[1:] if arg != "--profile-startup"]
+        print_import_profile(profile_startup(argv), argv)
+        return
+
+    # Read from the namespace so commands built without the flags still work
+    options = vars(args)
+    target = timings.destination(options.get("timings"), options.get("timings_file"))
+    if target is not None:
+        # Time the command here rather than in a daemon
+        timings.start()
+        try:
+            run_command(args)
+        finally:
+            timings.report(timings.stop(), target, args.action or "select")
+        return
+
+    from .client import SERVED_ACTIONS, forward
+
+    # Let a running "ww serve" answer read-only commands from its warm state
+    if args.action in SERVED_ACTIONS:
+        response = forward(sys.argv[1:])
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            if response["status"]:
+                sys.exit(response["status"])
+            return
+
+    run_command(args)
+
+
+def user_errors():
+    """Errors reported as a one-line message instead of a traceback"""
+    from .constraints import ConstraintError
+    from .frequency import FrequencyError
+    from .history import HistoryError
+    from .letterindex import LetterQueryError
+    from .match import PatternError
+    from .solver import FeedbackError, TableSizeError
+    from .validation import ValidationError
+
+    return (
+        LexiconNotFoundError,
+        FeedbackError,
+        FrequencyError,
+        ConstraintError,
+        ValidationError,
+        LetterQueryError,
+        PatternError,
+        HistoryError,
+        TableSizeError,
+    )
+
+
+def output_format(args):
+    """--format, else JSON lines for generate and text for everything else"""
+    chosen = vars(args).get("format")
+    if chosen is not None:
+        return chosen
+    # The older stats --json and freq --json flags stand for --format json
+    if vars(args).get("json"):
+        return "json"
+    return "ndjson" if args.action == "generate" else "text"
+
+
+def run_command(args, get_manager=None):
+    with output.using(output_format(args)):
+        try:
+            dispatch(args, get_manager)
+        # The except clause is only evaluated once something has been raised
+        except user_errors() as e:
+            if not output.reported(e):
+                output.error(str(e))
+            sys.exit(1)
+        except BrokenPipeError:
+            # The reader stopped early, as "ww match ... | head" does; point
+            # stdout at /dev/null so the interpreter's final flush stays quiet
+            import os
+
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+
+
+def print_words(heading):
+    """Text renderer printing a heading and the list of words after it"""
+    return lambda words: print(f"{heading} ({len(words):,}):", words)
+
+
+def word_record(word):
+    return {"word": word}
+
+
+def dispatch(args, get_manager=None):
     # If no action specified, run word selection
     if not args.action:
+        from .constraints import ConstraintError, Constraints
+
         num_words = args.num_words
-        run(num_words, unique_letters=args.u)
+        constraints = Constraints.parse(
+            args.require, args.exclude, args.pattern, args.not_at
+        )
+        options = {
+            "lexicon": args.lexicon,
+            "length": args.length,
+            "seed": args.seed,
+            "constraints": constraints or None,
+        }
+        # Only passed when set, keeping the call the same for commands
+        # built without the flag
+        if vars(args).get("exclude_used"):
+            options["exclude_used"] = True
+        if args.optimize:
+            if constraints or "exclude_used" in options:
+                raise ConstraintError(
+                    "--optimize cannot be combined with constraints or --exclude-used"
+                )
+            run_optimized(
+                num_words,
+                unique_letters=args.u,
+                lexicon=args.lexicon,
+                length=args.length,
+                budget=args.budget,
+                max_overlap=args.max_overlap,
+            )
+        elif args.exhaustive:
+            run_exhaustive(num_words, unique_letters=args.u, **options)
+        else:
+            run(num_words, unique_letters=args.u, **options)
+        return
+
+    if args.action == "lexicons":
+        def print_lexicons(lexicons):
+            for name, length in lexicons:
+                print(f"  {name} ({length} letters)")
+
+        output.records(
+            "lexicons",
+            list_lexicons(),
+            print_lexicons,
+            record=lambda item: {"name": item[0], "length": item[1]},
+        )
+        return
+
+    if args.action == "solve":
+        with timings.phase("import"):
+            from .solver import parse_guess, solve
+
+        lexicon = get_lexicon(args.lexicon, args.length)
+        guesses = [parse_guess(text, lexicon.length) for text in args.guesses]
+        with timings.phase("filter"):
+            remaining = solve(lexicon, guesses)
+        with timings.phase("output"):
+            output.records(
+                "candidates",
+                remaining,
+                print_words("Remaining candidates"),
+                record=word_record,
+                fields={"count": len(remaining)},
+            )
+        return
+
+    if args.action in ("anagrams", "spellable", "neighbors"):
+        from .letterindex import letter_index
+
+        letters = letter_index(get_lexicon(args.lexicon, args.length).index)
+        if args.action == "anagrams":
+            query = args.letters
+            found = letters.anagrams(query)
+            heading = f"Anagrams of '{query}'"
+        elif args.action == "spellable":
+            query = args.pool
+            found = letters.spellable(query)
+            heading = f"Words spelled from '{query}'"
+        else:
+            query = args.word
+            found = letters.neighbors(query)
+            heading = f"Neighbors of '{query}'"
+        output.records(
+            "words",
+            found,
+            print_words(heading),
+            record=word_record,
+            fields={"query": query, "count": len(found)},
+        )
+        return
+
+    if args.action == "match":
+        from .match import match_words
+
+        index = get_lexicon(args.lexicon, args.length).index
+        found = match_words(index, args.pattern, regex=args.regex or None)
+        output.records(
+            "words",
+            found,
+            print_words(f"Matches for '{args.pattern}'"),
+            record=word_record,
+            fields={"pattern": args.pattern, "count": len(found)},
+        )
+        return
+
+    if args.action in ("history", "schedule"):
+        from datetime import date, timedelta
+
+        from .history import History, HistoryError, schedule
+
+        lexicon = get_lexicon(args.lexicon, args.length)
+        history = History.for_lexicon(lexicon)
+        today = date.today()
+        if args.action == "history" and args.add:
+            word = args.add.lower()
+            if lexicon.index.position(word) < 0:
+                raise HistoryError(f"'{word}' is not in the word list")
+            entries = [(args.date or today, word)]
+            history.record(entries)
+        elif args.action == "history":
+            entries = history.entries
+        else:
+            start = args.start
+            if start is None:
+                last = history.last_date()
+                start = today if last is None else max(today, last + timedelta(1))
+            entries = schedule(
+                lexicon.index,
+                history,
+                args.days,
+                start,
+                no_repeat_days=args.no_repeat_days,
+                max_shared=args.max_shared,
+                unique_letters=args.u,
+                seed=args.seed,
+            )
+            if args.save:
+                history.record(entries)
+
+        def print_entries(entries):
+            for day, word in entries:
+                print(f"  {day.isoformat()}  {word}")
+
+        output.records(
+            "entries",
+            entries,
+            print_entries,
+            record=lambda entry: {"date": entry[0].isoformat(), "word": entry[1]},
+        )
+        return
+
+    if args.action == "best-openers":
+        from .openers import best_openers
+
+        lexicon = get_lexicon(args.lexicon, args.length)
+        ranking = best_openers(
+            lexicon, top=args.top, jobs=args.jobs, use_cache=not args.no_cache
+        )
+
+        def print_ranking(ranked):
+            print("Best openers by expected information:")
+            for rank, word, bits in ranked:
+                print(f"  {rank:>3}. {word}  {bits:.3f} bits")
+
+        output.records(
+            "openers",
+            ((rank, word, bits) for rank, (word, bits) in enumerate(ranking, 1)),
+            print_ranking,
+            record=lambda item: dict(zip(("rank", "word", "bits"), item)),
+        )
+        return
+
+    if args.action == "generate":
+        from .generate import iter_disjoint_sets, set_record
+
+        lexicon = get_lexicon(args.lexicon, args.length)
+        sets = iter_disjoint_sets(
+            lexicon,
+            args.num_words,
+            args.count,
+            unique_letters=args.u,
+            jobs=args.jobs,
+            seed=args.seed,
+        )
+        written = 0
+
+        def counted():
+            nonlocal written
+            for words in sets:
+                written += 1
+                yield words
+
+        def print_sets(found):
+            for words in found:
+                print(" ".join(words), flush=True)
+
+        output.records("sets", counted(), print_sets, record=set_record, flush=True)
+        if written < args.count:
+            print(
+                f"Found {written} distinct sets of {args.num_words} words",
+                file=sys.stderr,
+            )
+        return
+
+    if args.action == "simulate":
+        from .simulate import STRATEGIES, simulate
+
+        lexicon = get_lexicon(args.lexicon, args.length)
+        results = (
+            simulate(
+                lexicon,
+                strategy,
+                args.num_words,
+                unique_letters=args.u,
+                seed=args.seed,
+                jobs=args.jobs,
+                max_guesses=args.max_guesses,
+                resume=not args.fresh,
+            )
+            for strategy in args.strategy or STRATEGIES
+        )
+
+        def print_simulations(finished):
+            for result in finished:
+                print_simulation(result)
+
+        try:
+            output.records(
+                "results",
+                results,
+                print_simulations,
+                record=lambda result: result.to_dict(),
+                flush=True,
+            )
+        except KeyboardInterrupt:
+            output.note("Interrupted; run the same command again to resume")
+            sys.exit(130)
+        return
+
+    if args.action == "bench":
+        from .bench import (
+            LIST_SIZES,
+            QUICK_LIST_SIZES,
+            check_startup,
+            run_benchmarks,
+            write_report,
+        )
+
+        if args.check_startup:
+            results = check_startup(args.repeat * 2)
+            write_report({"startup_check": results}, args.output)
+            if not all(result["ok"] for result in results.values()):
+                sys.exit(1)
+            return
+        sizes = args.sizes or (QUICK_LIST_SIZES if args.quick else LIST_SIZES)
+        results = run_benchmarks(sizes, args.repeat, startup=not args.no_startup)
+        write_report(results, args.output)
+        return
+
+    if args.action == "serve":
+        from .server import DaemonError, restart, serve, stop_daemon
+
+        if args.stop:
+            stopped = stop_daemon()
+            output.result(
+                {"stopped": stopped},
+                "Daemon stopped" if stopped else "No daemon is running",
+            )
+            return
+        try:
+            stale = serve(run_command, args.lexicon, args.length)
+        except DaemonError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if stale:
+            print("Word list changed on disk, restarting", file=sys.stderr)
+            restart()
         return
 
     # Handle management actions
-    manager = WordListManager()
+    if get_manager is None:
+        # Looked up on the module so the lazy import above applies
+        with timings.phase("import"):
+            manager_class = sys.modules[__name__].WordListManager
+        manager = manager_class(lexicon=args.lexicon, length=args.length)
+    else:
+        manager = get_manager(lexicon=args.lexicon, length=args.length)
 
     match args.action:
         case "stats":
             manager.show_stats()
         case "find-scarce":
             manager.find_scarce_letters(args.num)
+        case "freq":
+            manager.show_frequency(
+                top=args.top,
+                bottom=args.bottom,
+                by=args.by,
+                position=args.position,
+            )
         case "dedup":
             manager.remove_duplicates()
         case "sort":
             manager.sort_words()
         case "add":
             if not args.word:
-                print("Error: No word provided to add.")
+                output.error("No word provided to add.")
                 sys.exit(1)
             manager.add_word(args.word)
+        case "import":
+            if args.file == "-":
+                manager.import_words(sys.stdin)
+            else:
+                with open(args.file) as f:
+                    manager.import_words(f)
         case "clean":
-            manager.remove_invalid_words()
-            print("Clean operation completed")
+            manager.remove_invalid_words(
+                dry_run=args.dry_run,
+                jobs=args.jobs,
+                blocklist_file=args.blocklist,
+                patterns=args.regex,
+            )
+            output.note("Clean operation completed")
         case _:
             num_words = args.num_words
             run(num_words)
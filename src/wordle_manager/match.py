@@ -0,0 +1,530 @@
+import re
+import weakref
+from string import ascii_lowercase
+
+ALPHABET = frozenset(ascii_lowercase)
+WILDCARDS = "?._"
+# Patterns of letters, wildcards and bracket classes, one per position;
+# anything else is read as a regular expression
+WILDCARD_PATTERN = re.compile(r"(?:[a-z?._]|\[\^?[a-z-]+\])+", re.IGNORECASE)
+# Largest {m,n} bound expanded into the automaton
+MAX_REPEAT = 64
+# Letters a pattern may start (or end) with, above which walking the DAWG
+# prunes too little to beat testing every word with re
+SCAN_BRANCHING = 13
+
+_cached_dawgs = weakref.WeakKeyDictionary()
+
+
+class PatternError(ValueError):
+    pass
+
+
+class _Unsupported(Exception):
+    """Regex syntax the automaton cannot express; matched with re instead"""
+
+
+class _Parser:
+    """Recursive descent over the regex subset that describes sets of words.
+
+    Produces a tree of ("set", letters), ("cat", items), ("alt", branches)
+    and ("rep", item, min, max) nodes. Backreferences, lookarounds and
+    anchors other than a leading ^ or trailing $ raise _Unsupported.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def peek(self):
+        return self.text[self.pos] if self.pos < len(self.text) else None
+
+    def parse(self):
+        node = self.alternation()
+        if self.pos != len(self.text):
+            raise _Unsupported
+        return node
+
+    def alternation(self):
+        branches = [self.concatenation()]
+        while self.peek() == "|":
+            self.pos += 1
+            branches.append(self.concatenation())
+        return branches[0] if len(branches) == 1 else ("alt", branches)
+
+    def concatenation(self):
+        items = []
+        while self.peek() not in (None, "|", ")"):
+            items.append(self.repetition())
+        return ("cat", items)
+
+    def repetition(self):
+        node = self.atom()
+        while (char := self.peek()) is not None and char in "*+?{":
+            if char == "{":
+                bounds = self.bounds()
+                if bounds is None:
+                    break  # a literal brace, as re reads it
+                low, high = bounds
+            else:
+                self.pos += 1
+                low, high = {"*": (0, None), "+": (1, None), "?": (0, 1)}[char]
+            if self.peek() in ("?", "+"):
+                self.pos += 1  # lazy and possessive forms match the same words
+            node = ("rep", node, low, high)
+        return node
+
+    def bounds(self):
+        found = re.compile(r"\{(\d*)(,?)(\d*)\}").match(self.text, self.pos)
+        if found is None or not (found[1] or found[3]):
+            return None
+        self.pos = found.end()
+        low = int(found[1] or 0)
+        high = int(found[3]) if found[3] else (None if found[2] else low)
+        if max(low, high or 0) > MAX_REPEAT:
+            raise _Unsupported
+        return low, high
+
+    def atom(self):
+        char = self.text[self.pos]
+        self.pos += 1
+        if char == "(":
+            if self.text.startswith("?:", self.pos):
+                self.pos += 2
+            elif self.peek() == "?":
+                raise _Unsupported  # lookarounds, named groups and flags
+            node = self.alternation()
+            self.pos += 1  # re has already checked the parentheses balance
+            return node
+        if char == ".":
+            return ("set", ALPHABET)
+        if char == "[":
+            return ("set", self.char_class())
+        if char == "\\":
+            return ("set", self.escape())
+        if char in "^$":
+            raise _Unsupported
+        return ("set", frozenset(char.lower()))
+
+    def escape(self):
+        char = self.text[self.pos]
+        self.pos += 1
+        # Words are only letters: \w and \S match any, \d, \s and \W none
+        if char in "wSD":
+            return ALPHABET
+        if char in "dsW":
+            return frozenset()
+        if char.isalnum():
+            raise _Unsupported  # backreferences, \b, \A and the like
+        return frozenset(char)
+
+    def char_class(self):
+        negate = self.peek() == "^"
+        if negate:
+            self.pos += 1
+        letters = set()
+        first = True
+        while True:
+            char = self.text[self.pos]
+            self.pos += 1
+            if char == "]" and not first:
+                break
+            first = False
+            if char == "\\":
+                letters |= self.escape()
+                continue
+            if self.peek() == "-" and self.text[self.pos + 1] != "]":
+                end = self.text[self.pos + 1]
+                self.pos += 2
+                if end < char:
+                    raise PatternError(
+                        f"Bad range '{char}-{end}' in pattern '{self.text}'"
+                    )
+                letters.update(chr(c).lower() for c in range(ord(char), ord(end) + 1))
+            else:
+                letters.add(char.lower())
+        letters = frozenset(letters)
+        return ALPHABET - letters if negate else letters
+
+
+def _parse_wildcards(text):
+    """Tree for a pattern with one letter, wildcard or class per position"""
+    items = []
+    pos = 0
+    while pos < len(text):
+        char = text[pos].lower()
+        if char == "[":
+            parser = _Parser(text)
+            parser.pos = pos + 1
+            items.append(("set", parser.char_class()))
+            pos = parser.pos
+            continue
+        items.append(("set", ALPHABET if char in WILDCARDS else frozenset(char)))
+        pos += 1
+    return ("cat", items)
+
+
+def _positions(node):
+    """Letters allowed at each position if node matches one length only"""
+    kind = node[0]
+    if kind == "set":
+        return [node[1]]
+    if kind == "cat":
+        positions = []
+        for item in node[1]:
+            more = _positions(item)
+            if more is None:
+                return None
+            positions += more
+        return positions
+    if kind == "rep" and node[2] == node[3]:
+        more = _positions(node[1])
+        return None if more is None else more * node[2]
+    return None
+
+
+def _reverse(node):
+    """Tree matching every word of node spelled backwards"""
+    kind = node[0]
+    if kind == "set":
+        return node
+    if kind == "cat":
+        return ("cat", [_reverse(item) for item in reversed(node[1])])
+    if kind == "alt":
+        return ("alt", [_reverse(branch) for branch in node[1]])
+    return ("rep", _reverse(node[1]), node[2], node[3])
+
+
+class Pattern:
+    """A word pattern compiled to an automaton stepped one letter at a time.
+
+    The parse tree becomes an NFA, and sets of NFA states are numbered as
+    they are reached, so walking a trie only ever looks up a transition
+    table: an automaton built on the fly instead of testing whole words.
+    Regexes the automaton cannot express are kept as compiled re objects,
+    for which fallback is set.
+    """
+
+    def __init__(self, text, regex=None):
+        self.text = text
+        if regex is None:
+            regex = WILDCARD_PATTERN.fullmatch(text) is None
+        self.compiled = self.fallback = None
+        if regex:
+            try:
+                self.compiled = re.compile(text, re.IGNORECASE)
+            except re.error as e:
+                raise PatternError(f"Invalid pattern '{text}': {e}") from None
+            # Every match covers the whole word, so end anchors add nothing
+            body = text.removeprefix("^")
+            if body.endswith("$") and not body.endswith("\\$"):
+                body = body[:-1]
+            try:
+                tree = _Parser(body).parse()
+            except _Unsupported:
+                self.fallback = self.compiled
+                return
+        else:
+            try:
+                tree = _parse_wildcards(text)
+            except IndexError:
+                raise PatternError(f"Unclosed '[' in pattern '{text}'") from None
+        self.tree = tree
+        self.positions = _positions(tree)
+        self._compile(tree)
+
+    def reversed(self):
+        """The same pattern read from the last letter to the first"""
+        pattern = Pattern.__new__(Pattern)
+        pattern.text = self.text
+        pattern.compiled = pattern.fallback = pattern.positions = None
+        pattern.tree = _reverse(self.tree)
+        pattern._compile(pattern.tree)
+        return pattern
+
+    def _compile(self, tree):
+        self._sets = []
+        self._next = []
+        self._eps = []
+        start, self._accept = self._build(tree)
+        self._closures = {}
+        self._ids = {}
+        self._states = []
+        self._accepting = []
+        self._rows = {}
+        self.start = self._state(self._closure([start]))
+
+    def _new(self):
+        self._sets.append(None)
+        self._next.append(None)
+        self._eps.append([])
+        return len(self._sets) - 1
+
+    def _build(self, node):
+        """Thompson construction; returns the (start, end) states of a node"""
+        kind = node[0]
+        start = end = self._new()
+        if kind == "set":
+            end = self._new()
+            self._sets[start] = node[1]
+            self._next[start] = end
+        elif kind == "cat":
+            for item in node[1]:
+                first, last = self._build(item)
+                self._eps[end].append(first)
+                end = last
+        elif kind == "alt":
+            end = self._new()
+            for branch in node[1]:
+                first, last = self._build(branch)
+                self._eps[start].append(first)
+                self._eps[last].append(end)
+        else:
+            _, item, low, high = node
+            for _ in range(low):
+                first, last = self._build(item)
+                self._eps[end].append(first)
+                end = last
+            done = self._new()
+            if high is None:
+                first, last = self._build(item)
+                self._eps[end] += [first, done]
+                self._eps[last].append(end)
+            else:
+                for _ in range(high - low):
+                    first, last = self._build(item)
+                    self._eps[end] += [first, done]
+                    end = last
+                self._eps[end].append(done)
+            end = done
+        return start, end
+
+    def _closure(self, states):
+        closure = set()
+        stack = list(states)
+        while stack:
+            state = stack.pop()
+            if state not in closure:
+                closure.add(state)
+                stack.extend(self._eps[state])
+        return frozenset(closure)
+
+    def _state(self, nfa_states):
+        """Number of the automaton state for a set of NFA states, None if empty"""
+        if not nfa_states:
+            return None
+        number = self._ids.get(nfa_states)
+        if number is None:
+            number = self._ids[nfa_states] = len(self._states)
+            self._states.append(nfa_states)
+            self._accepting.append(self._accept in nfa_states)
+        return number
+
+    def transitions(self, state):
+        """Letters after which a match is still possible, with the next state"""
+        row = self._rows.get(state)
+        if row is None:
+            reached = {}
+            for s in self._states[state]:
+                letters = self._sets[s]
+                if letters:
+                    closure = self._closure_of(self._next[s])
+                    for letter in letters & ALPHABET:
+                        reached[letter] = reached.get(letter, frozenset()) | closure
+            row = self._rows[state] = {
+                letter: self._state(states) for letter, states in reached.items()
+            }
+        return row
+
+    def step(self, state, letter):
+        """State after reading letter, or None once nothing can match"""
+        return self.transitions(state).get(letter)
+
+    def _closure_of(self, state):
+        closure = self._closures.get(state)
+        if closure is None:
+            closure = self._closures[state] = self._closure([state])
+        return closure
+
+    def accepts(self, state):
+        return self._accepting[state]
+
+    def matches(self, word):
+        if self.fallback is not None:
+            return self.fallback.fullmatch(word) is not None
+        state = self.start
+        for letter in word:
+            state = self.step(state, letter)
+            if state is None:
+                return False
+        return self.accepts(state)
+
+
+class _Node:
+    __slots__ = ("edges", "final")
+
+    def __init__(self):
+        self.edges = {}
+        self.final = False
+
+    def key(self):
+        """Identical keys mean identical sets of suffixes below the node"""
+        # Children are already registered, so their identity stands for them
+        edges = tuple((letter, id(node)) for letter, node in self.edges.items())
+        return self.final, edges
+
+
+class Dawg:
+    """Minimal acyclic automaton (DAWG) of a sorted word list.
+
+    Words sharing a prefix share a path from the root, and words sharing a
+    suffix share the nodes that spell it, so the bundled list needs far
+    fewer nodes than letters. Node 0 is the root; edges[n] holds
+    (letter, node) pairs in letter order and final[n] marks word ends.
+    """
+
+    def __init__(self, words):
+        root = _Node()
+        register = {}
+        unchecked = []  # (parent, letter, child) not yet merged
+        previous = ""
+
+        def minimize(down_to):
+            while len(unchecked) > down_to:
+                parent, letter, child = unchecked.pop()
+                key = child.key()
+                if key in register:
+                    parent.edges[letter] = register[key]
+                else:
+                    register[key] = child
+
+        # Daciuk's incremental construction: once a word is added, the part
+        # of the previous word past their common prefix can never change
+        count = 0
+        for word in words:
+            if count and word <= previous:
+                continue  # duplicates and words out of order
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else root
+            for letter in word[common:]:
+                child = node.edges[letter] = _Node()
+                unchecked.append((node, letter, child))
+                node = child
+            node.final = True
+            previous = word
+            count += 1
+        minimize(0)
+
+        numbers = {id(root): 0}
+        nodes = [root]
+        for node in nodes:
+            for child in node.edges.values():
+                if id(child) not in numbers:
+                    numbers[id(child)] = len(nodes)
+                    nodes.append(child)
+        self.edges = [
+            tuple((letter, numbers[id(child)]) for letter, child in node.edges.items())
+            for node in nodes
+        ]
+        self.final = [node.final for node in nodes]
+        self.word_count = count
+
+    def __len__(self):
+        return len(self.edges)
+
+    def match(self, pattern):
+        """Words accepted by a Pattern, in sorted order.
+
+        A branch is dropped as soon as the automaton rejects its prefix.
+        Nodes shared by many prefixes are explored once per automaton
+        state, and their matching suffixes reused.
+        """
+        edges = self.edges
+        final = self.final
+        transitions = pattern.transitions
+        accepts = pattern.accepts
+        found = {}
+
+        def suffixes(node, state):
+            key = (node, state)
+            result = found.get(key)
+            if result is None:
+                result = [""] if final[node] and accepts(state) else []
+                row = transitions(state)
+                for letter, child in edges[node]:
+                    after = row.get(letter)
+                    if after is not None:
+                        result += [letter + rest for rest in suffixes(child, after)]
+                found[key] = result
+            return result
+
+        return suffixes(0, pattern.start)
+
+
+def word_dawg(index, reverse=False):
+    """Dawg of an index's words, or of the words reversed, built once"""
+    dawgs = _cached_dawgs.get(index)
+    if dawgs is None:
+        dawgs = _cached_dawgs[index] = {}
+    dawg = dawgs.get(reverse)
+    if dawg is None:
+        words = index.words()
+        if reverse:
+            words = sorted(word[::-1] for word in words)
+        dawg = dawgs[reverse] = Dawg(words)
+    return dawg
+
+
+def _match_positions(index, positions):
+    from .constraints import bit_ids, letter_bitsets
+
+    if len(positions) != index.width:
+        return []
+    bitsets = letter_bitsets(index)
+    bits = bitsets.all
+    for position, letters in enumerate(positions):
+        if letters >= ALPHABET:
+            continue
+        allowed = 0
+        for letter in letters:
+            allowed |= bitsets.at(position, letter)
+        bits &= allowed
+    if bits == bitsets.all:
+        return list(index.words())
+    return [index.word(i) for i in bit_ids(bits)]
+
+
+def match_words(index, pattern, regex=None):
+    """Words of a WordIndex matching a wildcard pattern or regex, sorted.
+
+    Wildcard patterns have one letter, '?' (or '.' / '_'), or bracket
+    class such as [^st] per position; anything else, or any pattern when
+    regex is True, is a regex that must match the whole word.
+
+    Patterns of one fixed length intersect the per-position letter
+    bitsets. Other regexes walk the DAWG, or the DAWG of the reversed
+    words when the pattern narrows the last letter more than the first,
+    as in '.*ing'. re only tests every word when the pattern leaves
+    almost any letter open at both ends, where a walk could prune
+    nothing, or uses syntax the automaton lacks.
+    """
+    if not isinstance(pattern, Pattern):
+        pattern = Pattern(pattern, regex)
+    if pattern.fallback is not None:
+        return [word for word in index.words() if pattern.fallback.fullmatch(word)]
+    if pattern.positions is not None:
+        return _match_positions(index, pattern.positions)
+    backward = pattern.reversed()
+    first = len(pattern.transitions(pattern.start))
+    last = len(backward.transitions(backward.start))
+    if min(first, last) > SCAN_BRANCHING:
+        return [word for word in index.words() if pattern.compiled.fullmatch(word)]
+    if last < first:
+        words = word_dawg(index, reverse=True).match(backward)
+        return sorted(word[::-1] for word in words)
+    return word_dawg(index).match(pattern)
@@ -0,0 +1,126 @@
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import log2
+
+from .solver import PatternTable, load_pattern_table, pattern_table_path
+from .storage import atomic_write, cache_dir
+
+# Cells handled per NumPy batch, which bounds its temporary arrays
+BATCH_CELLS = 1 << 22
+# Lexicons with fewer words are ranked in-process
+PARALLEL_MIN = 500
+
+_worker_table = None
+
+
+def entropy(counts, total):
+    """Expected information in bits from feedback bucket sizes"""
+    if not total:
+        return 0.0
+    return log2(total) - sum(c * log2(c) for c in counts if c) / total
+
+
+def row_entropies(table, guess_ids):
+    """Pure-Python entropy of each guess row against every answer"""
+    count = table.count
+    return [entropy(Counter(table.row(g)).values(), count) for g in guess_ids]
+
+
+def numpy_entropies(table, guess_ids=None):
+    """Vectorized entropy of a range of rows, all by default.
+
+    Returns None when NumPy is unavailable.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    n = table.count
+    if guess_ids is None:
+        guess_ids = range(n)
+    num_patterns = 3**table.width
+    cells = np.asarray(table.cells).reshape(n, n)
+    block = max(1, BATCH_CELLS // max(n, num_patterns))
+    entropies = []
+    for start in range(guess_ids.start, guess_ids.stop, block):
+        stop = min(start + block, guess_ids.stop)
+        patterns = cells[start:stop].astype(np.int64)
+        rows = len(patterns)
+        # Offset each row into its own run of buckets so one bincount covers all
+        patterns += np.arange(rows, dtype=np.int64)[:, None] * num_patterns
+        counts = np.bincount(patterns.ravel(), minlength=rows * num_patterns)
+        counts = counts.reshape(rows, num_patterns)
+        weighted = counts * np.log2(np.maximum(counts, 1))
+        entropies.extend((np.log2(n) - weighted.sum(axis=1) / n).tolist())
+    return entropies
+
+
+def _init_worker(path):
+    global _worker_table
+    _worker_table = PatternTable.from_file(path)
+
+
+def _worker_entropies(guess_ids, use_numpy):
+    entropies = numpy_entropies(_worker_table, guess_ids) if use_numpy else None
+    if entropies is None:
+        entropies = row_entropies(_worker_table, guess_ids)
+    return entropies
+
+
+def parallel_entropies(table, path, jobs, use_numpy=False):
+    """Split the guesses across processes that each map the cached table.
+
+    With use_numpy each process scores its rows with NumPy when it can.
+    """
+    ids = range(table.count)
+    chunk = -(-len(ids) // (jobs * 4)) or 1
+    chunks = [ids[i : i + chunk] for i in range(0, len(ids), chunk)]
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(path,)) as pool:
+        parts = pool.map(_worker_entropies, chunks, repeat(use_numpy))
+        return [e for part in parts for e in part]
+
+
+def rank_openers(lexicon, jobs=None, use_numpy=True):
+    """Every word of the lexicon with its expected information, best first"""
+    index = lexicon.index
+    table = load_pattern_table(lexicon)
+    jobs = jobs or os.cpu_count() or 1
+    path = pattern_table_path(lexicon)
+    if jobs > 1 and table.count >= PARALLEL_MIN and os.path.exists(path):
+        entropies = parallel_entropies(table, path, jobs, use_numpy)
+    else:
+        entropies = numpy_entropies(table) if use_numpy else None
+        if entropies is None:
+            entropies = row_entropies(table, range(table.count))
+    ranked = sorted(zip(index.words(), entropies), key=lambda x: (-x[1], x[0]))
+    return [(word, round(bits, 6)) for word, bits in ranked]
+
+
+def openers_cache_path(lexicon):
+    return os.path.join(cache_dir(), f"{lexicon.name}-{lexicon.length}.openers.json")
+
+
+def best_openers(lexicon, top=10, jobs=None, use_cache=True):
+    """Top openers by entropy, cached on disk per word list version"""
+    key = lexicon.index.digest.hex()
+    path = openers_cache_path(lexicon)
+    if use_cache:
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached["key"] == key:
+                return [tuple(item) for item in cached["ranking"][:top]]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    ranking = rank_openers(lexicon, jobs)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, json.dumps({"key": key, "ranking": ranking}))
+    except OSError:  # pragma: no cover - no writable cache directory
+        pass
+    return ranking[:top]
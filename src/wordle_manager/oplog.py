@@ -0,0 +1,198 @@
+from array import array
+from itertools import islice
+
+# Operations kept for undo; older ones are forgotten
+LOG_LIMIT = 100
+
+
+def _words(count):
+    return f"{count:,} word{'' if count == 1 else 's'}"
+
+
+class Append:
+    """Words added to the end of the list, by add_word or import_words"""
+
+    __slots__ = ("words",)
+    name = "add"
+
+    def __init__(self, words):
+        self.words = list(words)
+
+    def __str__(self):
+        return f"add {_words(len(self.words))}"
+
+    def apply(self, word_list):
+        word_list.extend(self.words)
+
+    def revert(self, word_list):
+        del word_list[len(word_list) - len(self.words) :]
+
+
+class Remove:
+    """Words removed from the list, with the positions they were removed from"""
+
+    __slots__ = ("removed",)
+    name = "remove"
+
+    def __init__(self, removed):
+        self.removed = removed
+
+    def __str__(self):
+        return f"removal of {_words(len(self.removed))}"
+
+    @property
+    def words(self):
+        return [word for _, word in self.removed]
+
+    def apply(self, word_list):
+        drop = {i for i, _ in self.removed}
+        word_list[:] = [word for i, word in enumerate(word_list) if i not in drop]
+
+    def revert(self, word_list):
+        restored = []
+        current = iter(word_list)
+        removed = iter(self.removed)
+        position, word = next(removed, (None, None))
+        for i in range(len(word_list) + len(self.removed)):
+            if i == position:
+                restored.append(word)
+                position, word = next(removed, (None, None))
+            else:
+                restored.append(next(current))
+        word_list[:] = restored
+
+
+class Sort:
+    """A sort, with the permutation needed to restore the previous order"""
+
+    __slots__ = ("order",)
+    name = "sort"
+
+    def __init__(self, order):
+        self.order = order
+
+    @classmethod
+    def capture(cls, word_list):
+        if all(a <= b for a, b in zip(word_list, islice(word_list, 1, None))):
+            return cls(None)  # already sorted, nothing to restore
+        if hasattr(word_list, "sorted_ids"):
+            return cls(word_list.sorted_ids())
+        return cls(array("I", sorted(range(len(word_list)), key=word_list.__getitem__)))
+
+    def __str__(self):
+        return "sort"
+
+    def apply(self, word_list):
+        word_list.sort()
+
+    def revert(self, word_list):
+        if self.order is None:
+            return
+        restored = [None] * len(word_list)
+        for word, i in zip(word_list, self.order):
+            restored[i] = word
+        word_list[:] = restored
+
+
+def removed_positions(original, kept):
+    """(position, word) pairs of the words in original missing from kept.
+
+    kept must be original with some words left out, in the same order.
+    """
+    removed = []
+    kept = iter(kept)
+    missing = object()
+    expected = next(kept, missing)
+    for i, word in enumerate(original):
+        if word == expected:
+            expected = next(kept, missing)
+        else:
+            removed.append((i, word))
+    return removed
+
+
+class OperationLog:
+    """Undo and redo stacks of list operations, and what is still unsaved.
+
+    Operations since the last save are pending. While they are all appends
+    the storage can add just those words; anything else, including an undo
+    past the last save, means the whole list has to be written again.
+    """
+
+    def __init__(self, limit=LOG_LIMIT):
+        self.limit = limit
+        self.done = []
+        self.undone = []
+        self._pending = []
+        self._rewrite = False
+        self._sessions = 0
+
+    def __len__(self):
+        return len(self.done)
+
+    @property
+    def unsaved(self):
+        return self._rewrite or bool(self._pending)
+
+    def record(self, operation):
+        self.done.append(operation)
+        self.undone.clear()
+        self._pending.append(operation)
+        self._trim()
+
+    def _trim(self):
+        # Open sessions may still roll back, so keep everything until they end
+        if not self._sessions and len(self.done) > self.limit:
+            del self.done[: len(self.done) - self.limit]
+
+    def begin(self):
+        """Start a session; returns the checkpoint to roll back to"""
+        self._sessions += 1
+        return len(self.done)
+
+    def end(self):
+        self._sessions = max(self._sessions - 1, 0)
+        self._trim()
+
+    def rollback(self, word_list, checkpoint):
+        """Undo every operation recorded after the checkpoint"""
+        while len(self.done) > checkpoint:
+            self.undo(word_list)
+
+    def undo(self, word_list):
+        """Revert the last operation; returns it, or None if there is none"""
+        if not self.done:
+            return None
+        operation = self.done.pop()
+        operation.revert(word_list)
+        self.undone.append(operation)
+        if self._pending and self._pending[-1] is operation:
+            self._pending.pop()
+        else:
+            self._rewrite = True
+        return operation
+
+    def redo(self, word_list):
+        """Apply the last undone operation again; returns it, or None"""
+        if not self.undone:
+            return None
+        operation = self.undone.pop()
+        operation.apply(word_list)
+        self.done.append(operation)
+        self._pending.append(operation)
+        return operation
+
+    def pending_additions(self):
+        """Words appended since the last save, or None if a rewrite is needed"""
+        if self._rewrite:
+            return None
+        added = []
+        for operation in self._pending:
+            if not isinstance(operation, Append):
+                return None
+            added.extend(operation.words)
+        return added
+
+    def mark_saved(self):
+        self._pending = []
+        self._rewrite = False
@@ -0,0 +1,187 @@
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from . import timings
+from .search import LETTER_BITS
+from .selection import Selection
+
+# Default time budget for the search, in seconds
+BUDGET = 0.05
+# Nodes visited between checks of the clock
+CHECK_EVERY = 16
+
+
+@dataclass(frozen=True)
+class Coverage(Selection):
+    """A Selection scored by the frequency-weighted letters it covers"""
+
+    score: float = 0.0
+    optimal: bool = False
+
+    def to_dict(self):
+        return {**super().to_dict(), "score": self.score, "optimal": self.optimal}
+
+
+def letter_weights(masks):
+    """Share of words containing each letter, indexed by bit position"""
+    counts = Counter(masks)
+    total = sum(counts.values()) or 1
+    weights = [0.0] * len(LETTER_BITS)
+    for mask, count in counts.items():
+        while mask:
+            low = mask & -mask
+            weights[low.bit_length() - 1] += count
+            mask ^= low
+    return [weight / total for weight in weights]
+
+
+class CoverageSearch:
+    """Branch and bound for the n words covering the most letter weight.
+
+    Words are reduced to distinct letter masks sorted by their own weight,
+    so once the bound computed from one mask cannot beat the best set found
+    so far, neither can any mask after it. A greedy pass supplies the first
+    best set, which keeps the bound tight from the start.
+    """
+
+    def __init__(self, masks, weights, max_overlap=None):
+        self.max_overlap = max_overlap
+        # Mask weights from two 13-bit lookup tables instead of bit loops
+        self._low = self._weight_table(weights[:13])
+        self._high = self._weight_table(weights[13:])
+        self.masks = sorted(set(masks), key=lambda m: (-self.weight(m), m))
+        self.total = self.weight((1 << len(LETTER_BITS)) - 1)
+
+    @staticmethod
+    def _weight_table(weights):
+        table = [0.0] * (1 << len(weights))
+        for mask in range(1, len(table)):
+            low = mask & -mask
+            table[mask] = table[mask ^ low] + weights[low.bit_length() - 1]
+        return table
+
+    def weight(self, mask):
+        return self._low[mask & 0x1FFF] + self._high[mask >> 13]
+
+    def greedy(self, num_words):
+        """Repeatedly take the word adding the most uncovered weight"""
+        chosen = []
+        covered = overlap = 0
+        for _ in range(num_words):
+            best = None
+            best_gain = -1.0
+            for mask in self.masks:
+                if mask in chosen:
+                    continue
+                shared = (mask & covered).bit_count()
+                if self.max_overlap is not None and overlap + shared > self.max_overlap:
+                    continue
+                gain = self.weight(mask & ~covered)
+                if gain > best_gain:
+                    best, best_gain = mask, gain
+            if best is None:
+                break
+            chosen.append(best)
+            overlap += (best & covered).bit_count()
+            covered |= best
+        return chosen, covered
+
+    def search(self, num_words, budget=BUDGET):
+        """Return (masks, covered, optimal) for the best set found in budget.
+
+        Sets sharing no letters get the first half of the budget: they meet
+        any overlap limit, and a good one found early prunes the larger
+        search that follows.
+        """
+        start = time.perf_counter()
+        best = self.greedy(num_words)[0]
+        if self.max_overlap != 0:
+            best = self._branch_and_bound(num_words, start + budget / 2, best, 0)[0]
+        return self._branch_and_bound(
+            num_words, start + budget, best, self.max_overlap
+        )
+
+    def _branch_and_bound(self, num_words, deadline, best_masks, max_overlap):
+        best_covered = _union(best_masks)
+        best_score = self.weight(best_covered)
+        if len(best_masks) < num_words:
+            best_score = -1.0  # any complete set beats a partial one
+
+        weight = self.weight
+        chosen = []
+        nodes = 0
+
+        class OutOfTime(Exception):
+            pass
+
+        def visit(candidates, covered, overlap, score):
+            nonlocal best_masks, best_covered, best_score, nodes
+            nodes += 1
+            if nodes % CHECK_EVERY == 0 and time.perf_counter() > deadline:
+                raise OutOfTime
+            needed = num_words - len(chosen)
+            for j in range(len(candidates) - needed + 1):
+                # Candidates stay in order of their own weight, which bounds
+                # what any of them can add, so the next few bound the rest
+                bound = score + sum(map(weight, candidates[j : j + needed]))
+                if bound <= best_score:
+                    return
+                mask = candidates[j]
+                gain = weight(mask & ~covered)
+                if bound - weight(mask) + gain <= best_score:
+                    continue
+                chosen.append(mask)
+                if needed == 1:
+                    best_masks, best_covered = list(chosen), covered | mask
+                    best_score = score + gain
+                else:
+                    new_covered = covered | mask
+                    new_overlap = overlap + (mask & covered).bit_count()
+                    rest = candidates[j + 1 :]
+                    if max_overlap is not None:
+                        spare = max_overlap - new_overlap
+                        rest = [m for m in rest if (m & new_covered).bit_count() <= spare]
+                    visit(rest, new_covered, new_overlap, score + gain)
+                chosen.pop()
+
+        try:
+            visit(self.masks, 0, 0, 0.0)
+        except OutOfTime:
+            return best_masks, best_covered, False
+        finally:
+            timings.count("nodes", nodes)
+        return best_masks, best_covered, True
+
+
+def _union(masks):
+    covered = 0
+    for mask in masks:
+        covered |= mask
+    return covered
+
+
+def optimize_coverage(
+    index, num_words=3, unique_letters=False, budget=BUDGET, max_overlap=None
+):
+    """Pick num_words words covering the most frequency-weighted letters.
+
+    Letters are weighted by the share of words containing them, so common
+    letters count for more. max_overlap caps how many letters may repeat
+    across the set (0 asks for fully disjoint words, None allows any).
+    The best set found within budget seconds is returned, with optimal set
+    when the search finished and proved nothing better exists. Like the
+    default selection, it may hold fewer words than asked for when no
+    complete set turned up in time.
+    """
+    masks = index.masks
+    ids = index.unique_ids() if unique_letters else range(len(index))
+    words_by_mask = {}
+    for i in ids:
+        words_by_mask.setdefault(masks[i], i)
+    weights = letter_weights(masks[i] for i in ids)
+    search = CoverageSearch(words_by_mask, weights, max_overlap)
+    chosen, covered, optimal = search.search(num_words, budget)
+    words = tuple(index.word(words_by_mask[mask]) for mask in chosen)
+    score = search.weight(covered) / search.total if search.total else 0.0
+    return Coverage(words, covered, num_words, round(score, 6), optimal)
@@ -0,0 +1,126 @@
+import contextlib
+import sys
+from contextvars import ContextVar
+
+FORMATS = ("text", "json", "ndjson")
+
+# Per thread, so daemon requests running side by side keep their own format
+_format = ContextVar("format", default="text")
+# An exception already written inside a JSON document by records()
+_reported = ContextVar("reported", default=None)
+
+# json is imported by the functions writing it, so text commands start
+# without it
+
+
+@contextlib.contextmanager
+def using(name):
+    """Write results in the given format until the block exits"""
+    token = _format.set(name)
+    reported = _reported.set(None)
+    try:
+        yield
+    finally:
+        _reported.reset(reported)
+        _format.reset(token)
+
+
+def current():
+    return _format.get()
+
+
+def structured():
+    """Whether results go out as JSON, keeping stdout free of prose"""
+    return _format.get() != "text"
+
+
+def result(record, *lines):
+    """One result: the lines as text, or the record as JSON"""
+    import json
+
+    name = _format.get()
+    if name == "text":
+        for line in lines:
+            print(line)
+    elif name == "json":
+        print(json.dumps(record, indent=2))
+    else:
+        print(json.dumps(record))
+
+
+def records(key, items, text, record=None, fields=None, flush=False):
+    """A result made of many records, written as each one arrives.
+
+    Text mode hands the items to text(items) to print. json writes one
+    document holding fields followed by the records under key, ndjson a
+    line with the fields, if any, then one line per record. record turns
+    an item into its JSON record. With flush, each record reaches the
+    reader at once, for items that are slow to produce.
+
+    If items raises part way, json still closes the document and reports
+    the error under "error" inside it; see reported().
+    """
+    name = _format.get()
+    if name == "text":
+        text(items)
+        return
+    import json
+
+    if record is None:
+        record = _same
+    stream = sys.stdout
+    if name == "ndjson":
+        if fields:
+            stream.write(json.dumps(fields) + "\n")
+        for item in items:
+            stream.write(json.dumps(record(item)) + "\n")
+            if flush:
+                stream.flush()
+        return
+    written = 0
+    failure = None
+    stream.write("{\n")
+    for field, value in (fields or {}).items():
+        stream.write(f"  {json.dumps(field)}: {json.dumps(value)},\n")
+    stream.write(f"  {json.dumps(key)}: [")
+    try:
+        for item in items:
+            stream.write(("," if written else "") + "\n    " + json.dumps(record(item)))
+            written += 1
+            if flush:
+                stream.flush()
+    except Exception as e:
+        failure = e
+        raise
+    finally:
+        # Nothing more can reach a reader that has gone away
+        if not isinstance(failure, BrokenPipeError):
+            end = "\n  ]" if written else "]"
+            if failure is not None:
+                end += f',\n  "error": {json.dumps(str(failure))}'
+                _reported.set(failure)
+            stream.write(end + "\n}\n")
+
+
+def _same(item):
+    return item
+
+
+def reported(exception):
+    """Whether records() already wrote the exception into its document"""
+    return _reported.get() is exception
+
+
+def note(message):
+    """A status message, kept off stdout when results are JSON"""
+    print(message, file=sys.stderr if structured() else sys.stdout)
+
+
+def error(message):
+    """An error, as an "error" record when results are JSON"""
+    if structured():
+        import json
+
+        print(json.dumps({"error": message}))
+    else:
+        print(f"Error: {message}")
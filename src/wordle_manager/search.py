@@ -0,0 +1,229 @@
+import random
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import product
+from string import ascii_lowercase
+
+from . import timings
+
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ascii_lowercase)}
+
+
+def word_mask(word: str) -> int:
+    """Return a 26-bit mask with one bit set per distinct letter in the word"""
+    mask = 0
+    for letter in word:
+        mask |= LETTER_BITS[letter]
+    return mask
+
+
+def mask_to_letters(mask: int) -> str:
+    return "".join(letter for letter, bit in LETTER_BITS.items() if mask & bit)
+
+
+class DisjointSearch:
+    """Exhaustive search for sets of words that share no letters.
+
+    Words are reduced to letter masks and anagrams collapse into a single
+    mask. Each mask is filed under its rarest letter, so any disjoint set
+    takes at most one mask per letter group and can be built by walking
+    the letters from rarest to most common exactly once.
+    """
+
+    def __init__(self, word_list: Iterable[str], unique_letters: bool = False):
+        self.words_by_mask: dict[int, list[str]] = defaultdict(list)
+        for word in word_list:
+            # Masks only cover a-z, so accented letters are skipped like digits
+            if not word.isascii() or not word.isalpha() or not word.islower():
+                continue
+            mask = word_mask(word)
+            if unique_letters and mask.bit_count() != len(word):
+                continue
+            self.words_by_mask[mask].append(word)
+        self._prepare()
+
+    @classmethod
+    def from_index(
+        cls, index, unique_letters: bool = False, ids: Iterable[int] | None = None
+    ) -> "DisjointSearch":
+        """Build the search from a WordIndex, reusing its precomputed masks.
+
+        ids limits the search to those word records, for example the
+        candidates left after applying constraints.
+        """
+        search = cls.__new__(cls)
+        search.words_by_mask = defaultdict(list)
+        masks = index.masks
+        if ids is None:
+            ids = index.unique_ids() if unique_letters else range(len(index))
+        elif unique_letters:
+            ids = set(ids).intersection(index.unique_ids())
+        for i in ids:
+            search.words_by_mask[masks[i]].append(index.word(i))
+        search._prepare()
+        return search
+
+    def _prepare(self) -> None:
+        letter_counts = Counter()
+        for mask in self.words_by_mask:
+            letter_counts.update(mask_to_letters(mask))
+        # Rarest letters first; letters absent from every word are dropped
+        self.letter_order = [
+            LETTER_BITS[letter]
+            for letter in sorted(letter_counts, key=lambda x: (letter_counts[x], x))
+        ]
+
+        self.groups: list[list[int]] = [[] for _ in self.letter_order]
+        for mask in self.words_by_mask:
+            for i, bit in enumerate(self.letter_order):
+                if mask & bit:
+                    self.groups[i].append(mask)
+                    break
+
+        # suffix_letters[i] holds every letter that can still appear once the
+        # search has moved past the first i letter groups
+        self.suffix_letters = [0] * (len(self.letter_order) + 1)
+        for i in range(len(self.letter_order) - 1, -1, -1):
+            self.suffix_letters[i] = self.suffix_letters[i + 1] | self.letter_order[i]
+        self.min_letters = min((m.bit_count() for m in self.words_by_mask), default=0)
+
+    def iter_mask_sets(
+        self,
+        num_words: int,
+        rng: random.Random | None = None,
+        used: int = 0,
+        required: int = 0,
+        dead: set[tuple[int, int, int]] | None = None,
+    ) -> Iterator[tuple[int, ...]]:
+        """Yield every set of num_words pairwise disjoint masks.
+
+        With an rng the order inside each letter group is shuffled, so the
+        first result is a random pick rather than the alphabetically first.
+        Letters in used are treated as already taken, and every letter in
+        required must be covered by used or the chosen masks. dead records
+        the subtrees that held no set, keyed by letters used and words still
+        needed; passing the same set to later calls with the same required
+        letters lets them skip those subtrees.
+        """
+        if num_words <= 0:
+            if not required & ~used:
+                yield ()
+            return
+        if not self.words_by_mask:
+            return
+
+        groups = self.groups
+        if rng is not None:
+            groups = [rng.sample(group, len(group)) for group in groups]
+        letter_order = self.letter_order
+        suffix_letters = self.suffix_letters
+        min_letters = self.min_letters
+        num_groups = len(letter_order)
+        chosen: list[int] = []
+        backtracks = 0
+
+        def search(start: int, used: int) -> Iterator[tuple[int, ...]]:
+            # One per subtree, which the search backs out of once exhausted
+            nonlocal backtracks
+            backtracks += 1
+            needed = num_words - len(chosen)
+            # Groups from start on only hold letters in suffix_letters[start],
+            # so earlier letters matter only as far as required ones are met
+            key = (start, used & (suffix_letters[start] | required), needed)
+            if dead is not None and key in dead:
+                return
+            found = False
+            for i in range(start, num_groups):
+                # Every remaining word draws only from letters at or after i
+                free = suffix_letters[i] & ~used
+                if free.bit_count() < needed * min_letters:
+                    break
+                if required & ~used & ~suffix_letters[i]:
+                    break
+                if used & letter_order[i]:
+                    continue
+                for mask in groups[i]:
+                    if mask & used:
+                        continue
+                    chosen.append(mask)
+                    if needed == 1:
+                        if not required & ~(used | mask):
+                            found = True
+                            yield tuple(chosen)
+                    else:
+                        for masks in search(i + 1, used | mask):
+                            found = True
+                            yield masks
+                    chosen.pop()
+            if dead is not None and not found:
+                dead.add(key)
+
+        try:
+            yield from search(0, used)
+        finally:
+            timings.count("backtracks", backtracks)
+
+    def iter_sets(
+        self, num_words: int, rng: random.Random | None = None
+    ) -> Iterator[list[str]]:
+        """Yield every set of num_words words with no letter in common"""
+        for masks in self.iter_mask_sets(num_words, rng):
+            options = [self.words_by_mask[mask] for mask in masks]
+            for words in product(*options):
+                yield list(words)
+
+    def find(
+        self, num_words: int, rng: random.Random | None = None, required: int = 0
+    ) -> list[str] | None:
+        """Return one disjoint set of num_words words, or None if none exists.
+
+        With an rng the first word is drawn at random and the rest of the
+        set is completed by the exhaustive search, so results vary widely
+        instead of always starting from the rarest letters. If that first
+        word leads nowhere it falls back to the ordered search, which
+        settles whether any set exists at all and skips the dead ends the
+        first attempt already found. Letters in required must all appear
+        in the set.
+        """
+        masks = None
+        dead = set()
+        if rng is not None and num_words > 1 and self.words_by_mask:
+            first = rng.choice(list(self.words_by_mask))
+            rest = self.iter_mask_sets(num_words - 1, rng, first, required, dead)
+            rest = next(rest, None)
+            if rest is not None:
+                masks = (first, *rest)
+        if masks is None:
+            masks = next(self.iter_mask_sets(num_words, rng, 0, required, dead), None)
+        if masks is None:
+            return None
+        if rng is None:
+            return [self.words_by_mask[mask][0] for mask in masks]
+        return [rng.choice(self.words_by_mask[mask]) for mask in masks]
+
+    def count(self, num_words: int) -> int:
+        """Count every disjoint word set of the given size"""
+        total = 0
+        for masks in self.iter_mask_sets(num_words):
+            combinations = 1
+            for mask in masks:
+                combinations *= len(self.words_by_mask[mask])
+            total += combinations
+        return total
+
+
+def find_disjoint_sets(
+    word_list: Iterable[str], num_words: int, unique_letters: bool = False
+) -> Iterator[list[str]]:
+    """Enumerate all sets of num_words words that share no letters"""
+    return DisjointSearch(word_list, unique_letters).iter_sets(num_words)
+
+
+def find_disjoint_set(
+    word_list: Iterable[str],
+    num_words: int,
+    unique_letters: bool = False,
+    rng: random.Random | None = None,
+) -> list[str] | None:
+    """Return one set of num_words disjoint words, or None if none exists"""
+    return DisjointSearch(word_list, unique_letters).find(num_words, rng)
@@ -0,0 +1,135 @@
+import random
+from dataclasses import dataclass
+from string import ascii_lowercase
+
+from . import timings
+from .constraints import bit_ids, letter_bitsets
+from .index import shuffled_ids
+from .lexicons import get_lexicon
+from .search import LETTER_BITS, DisjointSearch, mask_to_letters, word_mask
+
+# Seeded selections are pure, so repeat calls are answered from here
+CACHE_SIZE = 256
+
+_cached_selections = {}
+
+
+@dataclass(frozen=True)
+class Selection:
+    """Words picked by select_words and the letters they cover"""
+
+    words: tuple[str, ...]
+    used_mask: int
+    requested: int
+
+    @property
+    def complete(self):
+        return len(self.words) == self.requested
+
+    @property
+    def used_letters(self):
+        """Alphabet with unused letters blanked out, e.g. 'AB_D...'"""
+        return "".join(
+            letter.upper() if self.used_mask & LETTER_BITS[letter] else "_"
+            for letter in ascii_lowercase
+        )
+
+    @property
+    def coverage(self):
+        """Fraction of the alphabet covered by the selected words"""
+        return self.used_mask.bit_count() / len(ascii_lowercase)
+
+    def to_dict(self):
+        return {
+            "requested": self.requested,
+            "words": list(self.words),
+            "letters": mask_to_letters(self.used_mask),
+        }
+
+
+def select_words(
+    num_words=3,
+    unique_letters=False,
+    *,
+    seed=None,
+    rng=None,
+    index=None,
+    exhaustive=False,
+    constraints=None,
+    exclude=0,
+):
+    """Pick up to num_words words that share no letters.
+
+    The result depends only on the arguments and the word list: pass a seed
+    or a random.Random for repeatable picks, and an index to skip loading
+    the default lexicon. The default single random pass may return fewer
+    words than asked for; exhaustive=True returns a full set whenever one
+    exists and an empty selection otherwise. Seeded results are cached per
+    word list version.
+
+    Constraints narrow the candidates through the index's letter bitsets
+    before searching, and always use the exhaustive search so that required
+    letters are never missed. exclude is a bitset of word record numbers
+    that may not be picked, such as History.used_bits().
+    """
+    if index is None:
+        index = get_lexicon().index
+    options = (num_words, unique_letters, index, exhaustive, constraints or None)
+    options += (exclude,)
+    if rng is not None or seed is None:
+        return _select(rng or random.Random(), *options)
+
+    key = (seed, num_words, bool(unique_letters), exhaustive, constraints or None)
+    key += (index.content_key, len(index), exclude)
+    selection = _cached_selections.get(key)
+    if selection is None:
+        if len(_cached_selections) >= CACHE_SIZE:
+            del _cached_selections[next(iter(_cached_selections))]
+        selection = _select(random.Random(seed), *options)
+        _cached_selections[key] = selection
+    return selection
+
+
+def _select(rng, num_words, unique_letters, index, exhaustive, constraints, exclude):
+    if constraints is not None:
+        with timings.phase("filter"):
+            bits = constraints.candidates(letter_bitsets(index), index.width)
+            bits &= ~exclude
+            timings.count("candidates", bits.bit_count())
+        with timings.phase("search"):
+            search = DisjointSearch.from_index(
+                index, bool(unique_letters), bit_ids(bits)
+            )
+            words = search.find(num_words, rng, constraints.required_mask) or []
+        return Selection(tuple(words), word_mask("".join(words)), num_words)
+
+    if exhaustive:
+        ids = None
+        if exclude:
+            with timings.phase("filter"):
+                ids = bit_ids(((1 << len(index)) - 1) & ~exclude)
+        with timings.phase("search"):
+            search = DisjointSearch.from_index(index, bool(unique_letters), ids)
+            words = search.find(num_words, rng) or []
+        return Selection(tuple(words), word_mask("".join(words)), num_words)
+
+    masks = index.masks
+    used_mask = 0
+    words = []
+    scanned = 0
+    # Excluded words are looked up a byte at a time, without shifting the
+    # whole bitset for every word
+    skip = exclude.to_bytes((len(index) + 7) // 8, "little") if exclude else None
+    with timings.phase("sample"):
+        available_ids = index.unique_ids() if unique_letters else len(index)
+        for i in shuffled_ids(available_ids, rng):
+            if len(words) == num_words:
+                break
+            scanned += 1
+            if skip is not None and skip[i >> 3] >> (i & 7) & 1:
+                continue
+            if not masks[i] & used_mask:
+                words.append(index.word(i))
+                used_mask |= masks[i]
+    timings.count("words_scanned", scanned)
+    return Selection(tuple(words), used_mask, num_words)
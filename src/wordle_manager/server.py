@@ -0,0 +1,219 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .cli import parse_args
+from .client import SERVED_ACTIONS, request, socket_path
+from .lexicons import LexiconNotFoundError, get_lexicon
+from .utils import WordListManager
+
+# Commands run at once; further requests wait for a free thread, while
+# the event loop keeps accepting clients and answering pings
+WORKERS = 4
+
+
+class DaemonError(RuntimeError):
+    pass
+
+
+class RequestStream:
+    """Stands in for sys.stdout or sys.stderr while the daemon serves.
+
+    Writes from a thread running a request go to that request's buffer, and
+    writes from any other thread to the stream it replaced.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    @classmethod
+    def install(cls, name):
+        """The stream standing in for sys.<name>, put in place if need be"""
+        stream = getattr(sys, name)
+        if not isinstance(stream, cls):
+            stream = cls(stream)
+            setattr(sys, name, stream)
+        return stream
+
+    def target(self):
+        buffer = getattr(self.local, "buffer", None)
+        return self.stream if buffer is None else buffer
+
+    def write(self, text):
+        return self.target().write(text)
+
+    def flush(self):
+        self.target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.target(), name)
+
+
+@contextlib.contextmanager
+def captured(stdout, stderr):
+    """Send what the current thread prints to the stdout and stderr buffers"""
+    streams = [RequestStream.install("stdout"), RequestStream.install("stderr")]
+    for stream, buffer in zip(streams, (stdout, stderr)):
+        stream.local.buffer = buffer
+    try:
+        yield
+    finally:
+        for stream in streams:
+            stream.local.buffer = None
+
+
+class Daemon:
+    """Answers read-only ww commands over a Unix socket from a warm process.
+
+    Word lists, indexes and statistics stay loaded between requests. Clients
+    are accepted and read on the event loop, and commands run on a pool of
+    WORKERS threads, each printing into buffers of its own request, so a
+    slow command does not hold up the others or a ping. Data built on first
+    use, such as a pattern table, may be built by two requests at once.
+    When a word list changes on disk the request gets a "stale" reply and
+    the daemon stops, so the client answers it locally and the daemon can
+    restart with fresh data.
+    """
+
+    def __init__(self, execute, path=None):
+        self.execute = execute
+        self.path = path or socket_path()
+        self.digests = {}
+        self.managers = {}
+        self.served = 0
+        self.stale = False
+        self.server = None
+        self.loop = None
+        self.executor = None
+
+    def get_manager(self, lexicon=None, length=None):
+        key = (lexicon, length)
+        if key not in self.managers:
+            self.managers[key] = WordListManager(
+                lexicon=lexicon, length=length, save_on_change=False
+            )
+        return self.managers[key]
+
+    def warm(self, lexicon=None, length=None):
+        """Load a word list and everything derived from it ahead of requests"""
+        self.is_current(lexicon, length)
+        get_lexicon(lexicon, length).index
+        manager = self.get_manager(lexicon, length)
+        manager.stats
+        manager.frequency()
+
+    def is_current(self, lexicon=None, length=None):
+        """Whether a word list is unchanged since it was first served"""
+        try:
+            digest = get_lexicon(lexicon, length).storage.digest()
+        except LexiconNotFoundError:
+            return True  # the command reports the error itself
+        return self.digests.setdefault((lexicon, length), digest) == digest
+
+    def run(self, argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        status = 0
+        with captured(stdout, stderr):
+            try:
+                args = parse_args(argv)
+                if args.action not in SERVED_ACTIONS:
+                    return {"unsupported": True}
+                if not self.is_current(args.lexicon, args.length):
+                    self.stop(stale=True)
+                    return {"stale": True}
+                self.execute(args, self.get_manager)
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else 1
+            except Exception as e:  # one bad request must not stop the daemon
+                print(f"Error: {e}", file=sys.stderr)
+                status = 1
+        self.served += 1
+        return {
+            "status": status,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    async def respond(self, message):
+        match message.get("command", "run"):
+            case "run":
+                argv = list(message.get("argv", []))
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, self.run, argv)
+            case "ping":
+                return {"pid": os.getpid(), "served": self.served}
+            case "shutdown":
+                self.stop()
+                return {"stopped": True}
+        return {"error": f"Unknown command {message.get('command')!r}"}
+
+    def stop(self, stale=False):
+        """Stop accepting clients; safe to call from a request thread"""
+        self.stale = self.stale or stale
+        if self.server is not None:
+            self.loop.call_soon_threadsafe(self.server.close)
+
+    async def handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    reply = await self.respond(json.loads(line))
+                except (ValueError, AttributeError):
+                    reply = {"error": "Expected one JSON object per line"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # client went away, or the daemon is stopping
+        finally:
+            writer.close()
+
+    def claim_socket(self):
+        """Remove a socket left by a daemon that died, refusing a live one"""
+        if os.path.exists(self.path):
+            if request({"command": "ping"}, self.path, timeout=1.0) is not None:
+                raise DaemonError(f"A daemon is already listening on {self.path}")
+            os.remove(self.path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+    async def serve_forever(self, ready=None):
+        self.claim_socket()
+        self.loop = asyncio.get_running_loop()
+        self.executor = ThreadPoolExecutor(WORKERS, thread_name_prefix="ww-request")
+        self.server = await asyncio.start_unix_server(self.handle, self.path)
+        os.chmod(self.path, 0o600)
+        if ready is not None:
+            ready()
+        try:
+            async with self.server:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self.server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
+
+
+def serve(execute, lexicon=None, length=None, path=None):
+    """Run a daemon until stopped; returns True if it stopped on stale data"""
+    daemon = Daemon(execute, path)
+    daemon.warm(lexicon, length)
+    print(f"Serving on {daemon.path}", file=sys.stderr)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(daemon.serve_forever())
+    return daemon.stale
+
+
+def restart():  # pragma: no cover - replaces the running process
+    """Start this daemon over in a fresh interpreter that reloads every list"""
+    os.execv(sys.executable, [sys.executable, *sys.orig_argv[1:]])
+
+
+def stop_daemon(path=None):
+    """Ask a running daemon to exit; returns False if none was listening"""
+    return request({"command": "shutdown"}, path, timeout=5.0) is not None
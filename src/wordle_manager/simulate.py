@@ -0,0 +1,301 @@
+import json
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+from .generate import _pool_context
+from .openers import entropy
+from .solver import (
+    PatternTable,
+    check_table_size,
+    load_pattern_table,
+    pattern_table_path,
+)
+from .storage import append_log, atomic_write, cache_dir, read_log
+
+STRATEGIES = ("random", "entropy", "coverage")
+MAX_GUESSES = 6
+CHECKPOINT_VERSION = 2
+
+_table = None
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """How many guesses a strategy needed for every answer of a lexicon"""
+
+    strategy: str
+    openers: tuple[str, ...]
+    distribution: dict[int, int]
+    failed: int
+    max_guesses: int = MAX_GUESSES
+
+    @property
+    def games(self):
+        return sum(self.distribution.values()) + self.failed
+
+    @property
+    def solved(self):
+        return self.games - self.failed
+
+    @property
+    def average(self):
+        """Mean guesses over the games that were solved"""
+        if not self.solved:
+            return 0.0
+        total = sum(guesses * n for guesses, n in self.distribution.items())
+        return total / self.solved
+
+    @property
+    def failure_rate(self):
+        return self.failed / self.games if self.games else 0.0
+
+    @classmethod
+    def from_guesses(cls, strategy, openers, guesses, max_guesses=MAX_GUESSES):
+        """Summarize guess counts per answer, where 0 means unsolved"""
+        counts = Counter(guesses)
+        failed = counts.pop(0, 0)
+        distribution = {n: counts.get(n, 0) for n in range(1, max_guesses + 1)}
+        return cls(strategy, tuple(openers), distribution, failed, max_guesses)
+
+    def to_dict(self):
+        return {
+            "strategy": self.strategy,
+            "openers": list(self.openers),
+            "games": self.games,
+            "average": self.average,
+            "failed": self.failed,
+            "failure_rate": self.failure_rate,
+            "distribution": {str(n): count for n, count in self.distribution.items()},
+        }
+
+
+def best_guess(table, candidates):
+    """The candidate whose feedback splits the candidates most evenly.
+
+    Only candidates are considered, so every guess could still win.
+    """
+    total = len(candidates)
+    best, best_bits = candidates[0], -1.0
+    for guess in candidates:
+        row = table.row(guess)
+        bits = entropy(Counter(map(row.__getitem__, candidates)).values(), total)
+        if bits > best_bits:
+            best, best_bits = guess, bits
+    return best
+
+
+def play_tree(table, candidates, openers, turn=0, max_guesses=MAX_GUESSES):
+    """Play every answer in candidates at once; returns {answer id: guesses}.
+
+    The next guess depends only on the feedback so far, so games are played
+    as one decision tree: the answers are split by the feedback to each
+    guess and every group continues on its own. A lone candidate is guessed
+    at once; otherwise the openers are played in order, and then the
+    candidate with the most expected information. Answers still unsolved
+    after max_guesses get 0.
+    """
+    results = {}
+    solved = 3**table.width - 1
+    stack = [(candidates, tuple(openers), turn)]
+    while stack:
+        candidates, openers, turn = stack.pop()
+        if turn >= max_guesses:
+            results.update(dict.fromkeys(candidates, 0))
+            continue
+        if len(candidates) == 1:
+            guess = candidates[0]
+        elif openers:
+            guess, openers = openers[0], openers[1:]
+        else:
+            guess = best_guess(table, candidates)
+        for pattern, group in split(table, guess, candidates).items():
+            if pattern == solved:
+                results.update(dict.fromkeys(group, turn + 1))
+            else:
+                stack.append((group, openers, turn + 1))
+    return results
+
+
+def split(table, guess, candidates):
+    """Group candidate answer ids by the feedback they give to guess"""
+    row = table.row(guess)
+    groups = {}
+    for j in candidates:
+        groups.setdefault(row[j], []).append(j)
+    return groups
+
+
+def _init_worker(path):
+    """Map the cached table once per process; forked workers inherit it"""
+    global _table
+    if _table is None:
+        _table = PatternTable.from_file(path)
+
+
+def _play_group(pattern, candidates, openers, max_guesses):
+    return pattern, play_tree(_table, candidates, openers, 1, max_guesses)
+
+
+def choose_openers(lexicon, strategy, num_words=3, unique_letters=False, seed=None):
+    """Opening guesses for a strategy.
+
+    random plays a set of words sharing no letters, as `ww` picks them,
+    coverage the set covering the most common letters, and entropy the
+    single opener with the most expected information.
+    """
+    index = lexicon.index
+    if strategy == "random":
+        from .selection import select_words
+
+        selection = select_words(num_words, unique_letters, seed=seed, index=index)
+        return list(selection.words)
+    if strategy == "coverage":
+        from .optimize import optimize_coverage
+
+        return list(optimize_coverage(index, num_words, unique_letters).words)
+    if strategy == "entropy":
+        from .openers import best_openers
+
+        return [word for word, _ in best_openers(lexicon, top=1)]
+    raise ValueError(f"Unknown strategy '{strategy}'")
+
+
+def checkpoint_path(lexicon, strategy):
+    name = f"{lexicon.name}-{lexicon.length}.simulate-{strategy}.journal"
+    return os.path.join(cache_dir(), name)
+
+
+def load_checkpoint(path, key):
+    """The openers and finished groups saved for a run, or None.
+
+    The checkpoint is an append-only log: a JSON header with the run's key
+    and openers, then one [pattern, [[answer id, guesses], ...]] line per
+    finished group.
+    """
+    lines = read_log(path)
+    try:
+        header = json.loads(lines[0])
+        if header["key"] != key:
+            return None
+        state = {"openers": header["openers"], "done": [], "results": {}}
+        for line in lines[1:]:
+            pattern, results = json.loads(line)
+            state["done"].append(pattern)
+            state["results"].update(results)
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+    return state
+
+
+def start_checkpoint(path, key, openers):
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        atomic_write(path, json.dumps({"key": key, "openers": openers}) + "\n")
+    except OSError:  # pragma: no cover - no writable cache directory
+        pass
+
+
+def save_group(path, pattern, results):
+    """Append one finished group, in time proportional to its size"""
+    try:
+        append_log(path, [json.dumps([pattern, list(results.items())])])
+    except OSError:  # pragma: no cover - no writable cache directory
+        pass
+
+
+def simulate(
+    lexicon,
+    strategy,
+    num_words=3,
+    unique_letters=False,
+    seed=None,
+    jobs=None,
+    max_guesses=MAX_GUESSES,
+    checkpoint=None,
+    resume=True,
+):
+    """Play every word of the lexicon as the answer and summarize the games.
+
+    After the first guess each feedback group is an independent subtree,
+    played in parallel by processes sharing the memory-mapped pattern
+    table. Finished groups are appended to the checkpoint file, so an
+    interrupted run picks up where it stopped; the file is removed once
+    every game is played. The openers are saved with the progress, which
+    keeps a resumed run on the same openers even when choosing them again
+    would not.
+    """
+    global _table
+    index = lexicon.index
+    check_table_size(index)  # before any work, not after choosing openers
+    table = load_pattern_table(lexicon)
+    path = checkpoint or checkpoint_path(lexicon, strategy)
+    key = {
+        "version": CHECKPOINT_VERSION,
+        "digest": index.digest.hex(),
+        "strategy": strategy,
+        "num_words": num_words,
+        "unique_letters": bool(unique_letters),
+        "seed": seed,
+        "max_guesses": max_guesses,
+    }
+    state = load_checkpoint(path, key) if resume else None
+    if state is None:
+        openers = choose_openers(lexicon, strategy, num_words, unique_letters, seed)
+        state = {"openers": openers, "done": [], "results": {}}
+        start_checkpoint(path, key, openers)
+    openers = state["openers"]
+    opener_ids = [index.position(word) for word in openers]
+    results = state["results"]
+
+    def record(pattern, group_results):
+        results.update(group_results)
+        save_group(path, pattern, group_results)
+
+    candidates = list(range(len(index)))
+    if candidates:
+        first = opener_ids[0] if opener_ids else best_guess(table, candidates)
+        done = set(state["done"])
+        groups = []
+        for pattern, group in split(table, first, candidates).items():
+            if pattern in done:
+                continue
+            if pattern == 3**table.width - 1:
+                record(pattern, dict.fromkeys(group, 1))
+            else:
+                groups.append((pattern, group))
+        rest = opener_ids[1:]
+        jobs = jobs or os.cpu_count() or 1
+        table_file = pattern_table_path(lexicon)
+        if jobs > 1 and len(groups) > 1 and os.path.exists(table_file):
+            _table = table
+            try:
+                with ProcessPoolExecutor(
+                    jobs,
+                    mp_context=_pool_context(),
+                    initializer=_init_worker,
+                    initargs=(table_file,),
+                ) as pool:
+                    # Largest groups first, so one is not left running alone
+                    groups.sort(key=lambda item: -len(item[1]))
+                    pending = {
+                        pool.submit(_play_group, p, g, rest, max_guesses)
+                        for p, g in groups
+                    }
+                    while pending:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            record(*future.result())
+            finally:
+                _table = None
+        else:
+            for pattern, group in groups:
+                record(pattern, play_tree(table, group, rest, 1, max_guesses))
+
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    guesses = [results.get(j, 0) for j in range(len(index))]
+    return SimulationResult.from_guesses(strategy, openers, guesses, max_guesses)
@@ -0,0 +1,299 @@
+import mmap
+import os
+import struct
+import sys
+
+from .storage import atomic_write, cache_dir
+
+GRAY, YELLOW, GREEN = 0, 1, 2
+FEEDBACK_CODES = {
+    "g": GREEN,
+    "2": GREEN,
+    "y": YELLOW,
+    "1": YELLOW,
+    "x": GRAY,
+    "b": GRAY,
+    "-": GRAY,
+    ".": GRAY,
+    "0": GRAY,
+}
+
+MAGIC = b"WWPT"
+VERSION = 1
+# magic, version, word width, bytes per pattern, word count, source digest
+HEADER = struct.Struct("<4sBBBxI16s")
+TYPECODES = {1: "B", 2: "H", 4: "I"}
+# Most words a pattern table is built for, overridable with
+# $WW_MAX_TABLE_WORDS; the table holds one cell per pair of words
+MAX_TABLE_WORDS = 20_000
+
+
+class FeedbackError(ValueError):
+    pass
+
+
+class TableSizeError(ValueError):
+    pass
+
+
+def score(guess, answer):
+    """Wordle feedback for a guess as a base-3 number, one digit per letter.
+
+    Digit i is 2 for green, 1 for yellow and 0 for gray, weighted by 3**i.
+    """
+    unmatched = {}
+    for g, a in zip(guess, answer):
+        if g != a:
+            unmatched[a] = unmatched.get(a, 0) + 1
+    pattern = 0
+    weight = 1
+    for g, a in zip(guess, answer):
+        if g == a:
+            pattern += GREEN * weight
+        elif unmatched.get(g):
+            pattern += YELLOW * weight
+            unmatched[g] -= 1
+        weight *= 3
+    return pattern
+
+
+def encode_feedback(text):
+    """Turn feedback such as 'gy..x' into its base-3 pattern"""
+    pattern = 0
+    for i, char in enumerate(text.lower()):
+        if char not in FEEDBACK_CODES:
+            raise FeedbackError(
+                f"Unknown feedback '{char}' in '{text}' (use g, y and x)"
+            )
+        pattern += FEEDBACK_CODES[char] * 3**i
+    return pattern
+
+
+def decode_pattern(pattern, width):
+    digits = []
+    for _ in range(width):
+        pattern, digit = divmod(pattern, 3)
+        digits.append("xyg"[digit])
+    return "".join(digits)
+
+
+def parse_guess(text, width):
+    """Parse 'WORD:FEEDBACK' into (word, pattern)"""
+    word, sep, feedback = text.replace("=", ":").partition(":")
+    word = word.lower()
+    if not sep or len(word) != width or len(feedback) != width:
+        raise FeedbackError(
+            f"Expected WORD:FEEDBACK with {width} letters each, got '{text}'"
+        )
+    return word, encode_feedback(feedback)
+
+
+def pattern_typecode(width):
+    """Smallest array typecode that holds every pattern for a word width"""
+    for itemsize, typecode in TYPECODES.items():
+        if 3**width <= 256**itemsize:
+            return typecode
+    raise ValueError(f"Words of {width} letters are too long for a pattern table")
+
+
+class PatternRows:
+    """Scores guesses against every word of an index at once.
+
+    Instead of scoring pairs, letters without a repeat in the guess add
+    their weight to every answer containing them (yellow) and again to
+    every answer with them in the same position (green). Repeated guess
+    letters are settled per answer from the answer's own letter counts.
+    """
+
+    def __init__(self, answers, width):
+        self.answers = answers
+        self.width = width
+        self.by_letter = {}
+        self.by_position = [{} for _ in range(width)]
+        for j, word in enumerate(answers):
+            for letter in set(word):
+                self.by_letter.setdefault(letter, []).append(j)
+            for i, letter in enumerate(word):
+                self.by_position[i].setdefault(letter, []).append(j)
+
+    def row(self, guess, typecode="B"):
+        from array import array
+
+        row = array(typecode, bytes(len(self.answers) * array(typecode).itemsize))
+        repeated = {letter for letter in guess if guess.count(letter) > 1}
+        for i, letter in enumerate(guess):
+            if letter in repeated:
+                continue
+            weight = 3**i
+            for j in self.by_letter.get(letter, ()):
+                row[j] += weight
+            for j in self.by_position[i].get(letter, ()):
+                row[j] += weight
+
+        answers = self.answers
+        for letter in repeated:
+            positions = [(i, 3**i) for i, g in enumerate(guess) if g == letter]
+            for j in self.by_letter.get(letter, ()):
+                answer = answers[j]
+                unmatched = answer.count(letter)
+                for i, _ in positions:
+                    if answer[i] == letter:
+                        unmatched -= 1
+                for i, weight in positions:
+                    if answer[i] == letter:
+                        row[j] += GREEN * weight
+                    elif unmatched > 0:
+                        row[j] += YELLOW * weight
+                        unmatched -= 1
+        return row
+
+
+def build_pattern_table(words, width, digest):
+    """Serialize the full guess x answer pattern matrix for a word list"""
+    from array import array
+
+    typecode = pattern_typecode(width)
+    itemsize = array(typecode).itemsize
+    rows = PatternRows(words, width)
+    parts = [HEADER.pack(MAGIC, VERSION, width, itemsize, len(words), digest)]
+    for guess in words:
+        row = rows.row(guess, typecode)
+        if sys.byteorder != "little":  # pragma: no cover
+            row.byteswap()
+        parts.append(row.tobytes())
+    return b"".join(parts)
+
+
+class PatternTable:
+    """Memory-mapped matrix of feedback patterns, one row per guess"""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, width, itemsize, count, digest = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a pattern table")
+        self.width = width
+        self.count = count
+        self.digest = digest
+        typecode = TYPECODES[itemsize]
+        body = view[HEADER.size : HEADER.size + count * count * itemsize]
+        if itemsize > 1 and sys.byteorder != "little":  # pragma: no cover
+            from array import array
+
+            body = array(typecode, body)
+            body.byteswap()
+            body = memoryview(body)
+        self.cells = body.cast(typecode)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def row(self, guess_id):
+        start = guess_id * self.count
+        return self.cells[start : start + self.count]
+
+    def pattern(self, guess_id, answer_id):
+        return self.cells[guess_id * self.count + answer_id]
+
+
+def max_table_words():
+    value = os.environ.get("WW_MAX_TABLE_WORDS")
+    if not value:
+        return MAX_TABLE_WORDS
+    try:
+        return int(value)
+    except ValueError:
+        raise TableSizeError(
+            f"WW_MAX_TABLE_WORDS must be a number of words, got '{value}'"
+        ) from None
+
+
+def check_table_size(index):
+    """Raise TableSizeError if a pattern table for index would be too large"""
+    from array import array
+
+    count = len(index)
+    limit = max_table_words()
+    if count > limit:
+        size = count * count * array(pattern_typecode(index.width)).itemsize
+        raise TableSizeError(
+            f"A pattern table for {count:,} words would take "
+            f"{size / 2**20:,.0f} MB; the limit is {limit:,} words "
+            "(set WW_MAX_TABLE_WORDS to raise it)"
+        )
+
+
+def pattern_table_path(lexicon):
+    return os.path.join(cache_dir(), f"{lexicon.name}-{lexicon.length}.patterns")
+
+
+def load_pattern_table(lexicon, rebuild=True):
+    """Load the cached pattern table for a lexicon, building it if stale.
+
+    Raises TableSizeError rather than build a table for more words than
+    max_table_words().
+    """
+    index = lexicon.index
+    path = pattern_table_path(lexicon)
+    try:
+        table = PatternTable.from_file(path)
+        if table.digest == index.digest and table.count == len(index):
+            return table
+    except (OSError, ValueError, struct.error):
+        pass
+    if not rebuild:
+        return None
+
+    check_table_size(index)
+    data = build_pattern_table(index.words(), index.width, index.digest)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, data)
+    except OSError:  # pragma: no cover - no writable cache directory
+        pass
+    return PatternTable(data)
+
+
+class Solver:
+    """Narrows the answers of a lexicon down as feedback comes in.
+
+    Without a pattern table every guess is scored on the fly.
+    """
+
+    def __init__(self, index, table):
+        self.index = index
+        self.table = table
+        self.candidates = range(len(index))
+        self._rows = None
+
+    def guess_row(self, guess):
+        position = self.index.position(guess)
+        if position >= 0 and self.table is not None:
+            return self.table.row(position)
+        # Guesses outside the list are scored on the fly
+        if self._rows is None:
+            self._rows = PatternRows(self.index.words(), self.index.width)
+        return self._rows.row(guess, pattern_typecode(self.index.width))
+
+    def apply(self, guess, pattern):
+        row = self.guess_row(guess)
+        self.candidates = [j for j in self.candidates if row[j] == pattern]
+        return len(self.candidates)
+
+    def remaining(self):
+        return [self.index.word(j) for j in self.candidates]
+
+
+def solve(lexicon, guesses):
+    """Return the words of a lexicon consistent with every (guess, pattern)"""
+    try:
+        table = load_pattern_table(lexicon)
+    except TableSizeError:
+        table = None  # a few guesses are quicker to score than the table
+    solver = Solver(lexicon.index, table)
+    for guess, pattern in guesses:
+        solver.apply(guess, pattern)
+    return solver.remaining()
@@ -0,0 +1,161 @@
+import json
+import os
+from collections import Counter
+from itertools import islice
+from operator import gt, itemgetter
+
+from .storage import atomic_write, cache_dir
+
+
+class WordStats:
+    """Word list statistics kept current as words are added and removed.
+
+    Counts, duplicates, sortedness and per-position letter histograms are
+    all maintained in place, so reading them never walks the list again.
+    Statistics restored with from_state have no word counts and can only
+    be read; build them afresh before tracking changes.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.total = 0
+        self.positions = []
+        # Adjacent pairs that are out of order; the list is sorted when zero
+        self.descents = 0
+        self.last = None
+
+    @classmethod
+    def from_words(cls, word_list):
+        stats = cls()
+        stats.extend(word_list)
+        return stats
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.counts = None
+        stats.total = state["total"]
+        stats._unique = state["unique"]
+        stats.descents = state["descents"]
+        stats.last = state["last"]
+        stats.positions = [Counter(counts) for counts in state["positions"]]
+        return stats
+
+    def to_state(self):
+        """The counters behind the report, without the words themselves"""
+        return {
+            "total": self.total,
+            "unique": self.unique,
+            "descents": self.descents,
+            "last": self.last,
+            "positions": [dict(counter) for counter in self.positions],
+        }
+
+    @property
+    def unique(self):
+        return self._unique if self.counts is None else len(self.counts)
+
+    @property
+    def duplicates(self):
+        return self.total - self.unique
+
+    @property
+    def is_sorted(self):
+        return self.descents == 0
+
+    def add(self, word):
+        """Account for a word appended to the end of the list"""
+        if self.last is not None and self.last > word:
+            self.descents += 1
+        self.last = word
+        self.counts[word] += 1
+        self.total += 1
+        self._count_letters([word], Counter.update)
+
+    def extend(self, word_list):
+        """Account for several appended words in one pass per statistic"""
+        if not word_list:
+            return
+        if self.last is not None and self.last > word_list[0]:
+            self.descents += 1
+        self.descents += sum(map(gt, word_list, islice(word_list, 1, None)))
+        self.last = word_list[-1]
+        self.counts.update(word_list)
+        self.total += len(word_list)
+        self._count_letters(word_list, Counter.update)
+
+    def _count_letters(self, word_list, apply):
+        lengths = set(map(len, word_list))
+        while len(self.positions) < max(lengths):
+            self.positions.append(Counter())
+        for i, counter in enumerate(self.positions[: max(lengths)]):
+            if min(lengths) > i:
+                letters = map(itemgetter(i), word_list)
+            else:
+                letters = (word[i] for word in word_list if len(word) > i)
+            apply(counter, letters)
+
+    def remove(self, removed, word_list):
+        """Account for words removed from anywhere in word_list.
+
+        Removing words keeps a sorted list sorted, so the order is only
+        recounted when the list was unsorted to begin with.
+        """
+        if removed:
+            self.counts.subtract(removed)
+            self.total -= len(removed)
+            self._count_letters(removed, Counter.subtract)
+            # Drop words and letters whose count fell to zero
+            for word in set(removed):
+                if self.counts[word] <= 0:
+                    del self.counts[word]
+            for counter in self.positions:
+                counter += Counter()
+        self.last = word_list[-1] if word_list else None
+        if self.descents:
+            self.descents = sum(map(gt, word_list, islice(word_list, 1, None)))
+
+    def mark_sorted(self, word_list):
+        self.descents = 0
+        self.last = word_list[-1] if word_list else None
+
+    def letter_counts(self):
+        """Occurrences of each letter over all positions"""
+        total = Counter()
+        for counter in self.positions:
+            total.update(counter)
+        return total
+
+    def to_dict(self):
+        return {
+            "total": self.total,
+            "unique": self.unique,
+            "duplicates": self.duplicates,
+            "sorted": self.is_sorted,
+            "letters": dict(sorted(self.letter_counts().items())),
+            "positions": [dict(sorted(counter.items())) for counter in self.positions],
+        }
+
+
+def stats_cache_path(lexicon):
+    return os.path.join(cache_dir(), f"{lexicon.name}-{lexicon.length}.stats.json")
+
+
+def load_stats(path, key):
+    """Statistics saved for the word list version key, or None"""
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return WordStats.from_state(cached["stats"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def save_stats(path, key, stats):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, json.dumps({"key": key, "stats": stats.to_state()}))
+    except OSError:  # pragma: no cover - no writable cache directory
+        pass
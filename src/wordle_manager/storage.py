@@ -0,0 +1,284 @@
+import ast
+import os
+import re
+import struct
+import zlib
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORDS_FILE = os.path.join(PACKAGE_DIR, "words.py")
+JOURNAL_FILE = os.path.join(PACKAGE_DIR, "words.journal")
+
+_journal_replayed = set()
+# A quoted word in words.py
+QUOTED = re.compile(r"'([^'\\]*)'|\"([^\"\\]*)\"")
+
+# Read while the process has a single thread: os.umask can only be read by
+# setting it
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def cache_dir():
+    """Directory for derived data that can be rebuilt at any time"""
+    if path := os.environ.get("WW_CACHE_DIR"):
+        return path
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "wordle-words")
+
+
+def data_dir():
+    """Directory for data kept across runs, such as lexicons and history"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(data_home, "wordle-words")
+
+
+def format_module(word_list):
+    """Render the word list as the source of words.py"""
+    parts = ["word_list = [\n"]
+    for i, word in enumerate(word_list):
+        if i % 10 == 0 and i > 0:
+            parts.append("\n")
+        parts.append(f" '{word}',")
+    parts.append("\n]\n")
+    return "".join(parts)
+
+
+def atomic_write(path, data):
+    """Write to a temporary file and rename it over path.
+
+    Readers see either the old or the new file, never a partial one. Each
+    write has a temporary file of its own, so concurrent writers of the
+    same path cannot mix their data, and the last rename wins.
+    """
+    # Imported here so commands that never write skip loading tempfile
+    import tempfile
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with open(fd, "w" if isinstance(data, str) else "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+def _file_mode(path):
+    """Permissions for a new version of path: those of the old one, if any"""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        return 0o666 & ~_umask
+
+
+def _fsync_dir(directory):
+    """Make a rename within directory survive a crash"""
+    if os.name != "posix":  # pragma: no cover - directories cannot be opened
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_bytes(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
+def file_checksum(path):
+    data = read_bytes(path)
+    return len(data), zlib.crc32(data)
+
+
+def read_log(path):
+    """The complete lines of an append-only log, without their newlines.
+
+    A last line with no newline is a record torn by an interrupted append,
+    and is left out.
+    """
+    try:
+        with open(path) as f:
+            lines = f.read().split("\n")
+    except FileNotFoundError:
+        return []
+    # The last element is either empty or a torn write without a newline
+    return lines[:-1]
+
+
+def append_log(path, lines):
+    """Append lines to a log in a single write and sync it to disk"""
+    records = "".join(f"{line}\n" for line in lines).encode()
+    with open(path, "ab+") as f:
+        f.seek(0)
+        # Drop any torn record left behind by an interrupted append
+        f.truncate(f.read().rfind(b"\n") + 1)
+        f.write(records)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class ModuleStorage:
+    """Persist the word list by regenerating words.py in full"""
+
+    def __init__(self, words_file=WORDS_FILE):
+        self.words_file = words_file
+
+    def load(self):
+        if self.words_file == WORDS_FILE:
+            from . import words
+
+            return words.word_list
+        with open(self.words_file) as f:
+            source = f.read()
+        return ast.literal_eval(source.partition("=")[2].strip())
+
+    def size(self):
+        """Bytes of words stored, at least the letters and a separator per word"""
+        return os.path.getsize(self.words_file)
+
+    def stream(self):
+        """Yield the words of words.py one at a time, without importing it"""
+        with open(self.words_file) as f:
+            for line in f:
+                for single, double in QUOTED.findall(line):
+                    yield single or double
+
+    def save(self, word_list, added=None):
+        """Write word_list; added lists words appended since the last save"""
+        self.compact(word_list)
+
+    def compact(self, word_list):
+        atomic_write(self.words_file, format_module(word_list))
+
+    def digest(self):
+        """Identifies the persisted state, for caches derived from it"""
+        return struct.pack("<QQ", *file_checksum(self.words_file))
+
+
+class JournalStorage(ModuleStorage):
+    """Append added words to a journal and fold them into words.py later.
+
+    Each journal starts with a header naming the checksum of the words.py it
+    extends. Compaction rewrites words.py first and removes the journal
+    second, so a crash in between leaves a journal whose header no longer
+    matches and is ignored rather than replayed twice.
+    """
+
+    def __init__(
+        self, words_file=WORDS_FILE, journal_file=JOURNAL_FILE, compact_every=1000
+    ):
+        super().__init__(words_file)
+        self.journal_file = journal_file
+        self.compact_every = compact_every
+
+    def _base_header(self):
+        size, crc = file_checksum(self.words_file)
+        return f"# base {size} {crc}\n"
+
+    def read_journal(self):
+        """Return the journaled words that still apply to words.py"""
+        lines = read_log(self.journal_file)
+        if not lines or lines[0] + "\n" != self._base_header():
+            return []
+        return [line[1:] for line in lines[1:] if line.startswith("+")]
+
+    def load(self):
+        word_list = super().load()
+        key = (self.words_file, self.journal_file)
+        if key not in _journal_replayed:
+            _journal_replayed.add(key)
+            word_list.extend(self.read_journal())
+        return word_list
+
+    def size(self):
+        try:
+            journal_size = os.path.getsize(self.journal_file)
+        except FileNotFoundError:
+            journal_size = 0
+        return super().size() + journal_size
+
+    def stream(self):
+        yield from super().stream()
+        yield from self.read_journal()
+
+    def save(self, word_list, added=None):
+        if added is None:
+            self.compact(word_list)
+            return
+        if not added:
+            return
+        pending = self.read_journal()
+        if len(pending) + len(added) >= self.compact_every:
+            self.compact(word_list)
+            return
+        if not pending:
+            atomic_write(self.journal_file, self._base_header())
+        append_log(self.journal_file, (f"+{word}" for word in added))
+
+    def compact(self, word_list):
+        super().compact(word_list)
+        try:
+            os.remove(self.journal_file)
+        except FileNotFoundError:
+            pass
+
+    def digest(self):
+        words_data = read_bytes(self.words_file)
+        journal_data = read_bytes(self.journal_file)
+        crc = zlib.crc32(journal_data, zlib.crc32(words_data))
+        return struct.pack("<QQ", len(words_data) + len(journal_data), crc)
+
+
+class TextStorage:
+    """Persist a word list as a plain text file with one word per line"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        with open(self.path) as f:
+            return f.read().split()
+
+    def size(self):
+        return os.path.getsize(self.path)
+
+    def stream(self):
+        with open(self.path) as f:
+            for line in f:
+                yield from line.split()
+
+    def save(self, word_list, added=None):
+        if added is None:
+            atomic_write(self.path, "".join(f"{word}\n" for word in word_list))
+            return
+        if not added:
+            return
+        records = "".join(f"{word}\n" for word in added).encode()
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                records = b"\n" + records
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def digest(self):
+        return struct.pack("<QQ", *file_checksum(self.path))
+
+
+default_storage = JournalStorage()
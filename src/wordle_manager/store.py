@@ -0,0 +1,289 @@
+from array import array
+from heapq import merge
+from itertools import islice
+from operator import eq
+
+# Words encoded or decoded at a time, which bounds the temporary objects
+BATCH = 16_384
+
+
+class WordStore:
+    """A word list packed into one buffer of fixed-width byte records.
+
+    Each word is UTF-8 encoded and padded with NUL bytes to the width of the
+    longest word, so a million 5-letter words take about 5 MB instead of
+    tens of megabytes of str objects. Padding sorts before every letter, so
+    comparing records orders words the same way as comparing strings.
+
+    The store reads like a list of str. Membership is a binary search, over
+    the records themselves while they are sorted and otherwise over a sorted
+    array of record numbers that is kept up to date as words are appended.
+    sort() and dedup() rearrange the records in place, with no more than
+    BATCH of them copied out as separate objects at a time.
+    """
+
+    __slots__ = ("_data", "_width", "_count", "_sorted", "_order")
+
+    def __init__(self, words=(), width=0):
+        self._data = bytearray()
+        self._width = width
+        self._count = 0
+        self._sorted = True
+        self._order = None
+        self.extend(words)
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def nbytes(self):
+        """Memory held by the records and the membership index"""
+        order = self._order
+        return len(self._data) + (order.itemsize * len(order) if order else 0)
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"<WordStore {self._count:,} words, width {self._width}>"
+
+    def _record(self, i):
+        start = i * self._width
+        return bytes(self._data[start : start + self._width])
+
+    def _key(self, word):
+        """The record a word would be stored as, or None if it cannot fit"""
+        encoded = word.encode()
+        if len(encoded) > self._width:
+            return None
+        return encoded.ljust(self._width, b"\0")
+
+    def _decode(self, record):
+        return record.rstrip(b"\0").decode()
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._count)
+            if step == 1:
+                return list(self._decode_range(start, stop))
+            return [self._decode(self._record(j)) for j in range(start, stop, step)]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        return self._decode(self._record(i))
+
+    def __iter__(self):
+        return self._decode_range(0, self._count)
+
+    def _decode_range(self, start, stop):
+        """Yield the words in records start to stop, decoding in batches"""
+        width = self._width
+        if not width:
+            yield from [""] * max(stop - start, 0)
+            return
+        for first in range(start, stop, BATCH):
+            last = min(first + BATCH, stop)
+            chunk = bytes(self._data[first * width : last * width])
+            if chunk.isascii():
+                text = chunk.decode("ascii")
+                for j in range(0, len(text), width):
+                    yield text[j : j + width].rstrip("\0")
+            else:
+                for j in range(0, len(chunk), width):
+                    yield self._decode(chunk[j : j + width])
+
+    def __eq__(self, other):
+        if isinstance(other, WordStore):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return len(self) == len(other) and all(map(eq, self, other))
+        return NotImplemented
+
+    def tolist(self):
+        return list(self)
+
+    def copy(self):
+        store = WordStore(width=self._width)
+        store._data = self._data[:]
+        store._count = self._count
+        store._sorted = self._sorted
+        store._order = self._order[:] if self._order is not None else None
+        return store
+
+    def _widen(self, width):
+        """Re-pad every record to a larger width"""
+        old = self._width
+        if old:
+            records = (self._data[i : i + old] for i in range(0, len(self._data), old))
+            self._data = bytearray(b"".join(r.ljust(width, b"\0") for r in records))
+        else:
+            self._data = bytearray(width * self._count)
+        self._width = width
+
+    def _search(self, key):
+        """Return (position in sorted order, whether key is there)"""
+        lo, hi = 0, self._count
+        if self._sorted:
+            record = self._record
+        else:
+            order = self._sorted_order()
+            record = lambda k: self._record(order[k])  # noqa: E731
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if record(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo, lo < self._count and record(lo) == key
+
+    def _sorted_order(self):
+        if self._order is None:
+            self._order = self.sorted_ids()
+        return self._order
+
+    def sorted_ids(self):
+        """Record numbers in sorted order, equal records in list order.
+
+        Each batch of records is sorted on its own and the runs are merged,
+        so only a batch of keys, and one per run, exist at once.
+        """
+        if self._order is not None:
+            return self._order[:]
+        record = self._record
+        count = self._count
+        runs = [
+            array("I", sorted(range(first, min(first + BATCH, count)), key=record))
+            for first in range(0, count, BATCH)
+        ]
+        if len(runs) <= 1:
+            return runs[0] if runs else array("I")
+        # merge is stable, so equal records keep the order of their runs
+        return array("I", merge(*runs, key=record))
+
+    def __contains__(self, word):
+        if not isinstance(word, str):
+            return False
+        key = self._key(word)
+        return key is not None and self._search(key)[1]
+
+    def append(self, word):
+        encoded = word.encode()
+        if len(encoded) > self._width:
+            self._widen(len(encoded))
+        key = encoded.ljust(self._width, b"\0")
+        if self._count and self._sorted and key < self._record(self._count - 1):
+            self._sorted = False
+        elif self._order is not None:
+            # Keep the membership index current with one memmove
+            self._order.insert(self._search(key)[0], self._count)
+        self._data += key
+        self._count += 1
+
+    def extend(self, words):
+        if isinstance(words, WordStore):
+            words = list(words)
+        words = iter(words)
+        while batch := [word.encode() for word in islice(words, BATCH)]:
+            self._extend_encoded(batch)
+
+    def _extend_encoded(self, encoded):
+        width = max(map(len, encoded))
+        if width > self._width:
+            self._widen(width)
+        width = self._width
+        keys = [e.ljust(width, b"\0") for e in encoded]
+        if self._sorted:
+            previous = self._record(self._count - 1) if self._count else b""
+            self._sorted = previous <= keys[0] and all(
+                map(bytes.__le__, keys, keys[1:])
+            )
+        self._order = None
+        self._data += b"".join(keys)
+        self._count += len(keys)
+
+    def __setitem__(self, index, words):
+        if not isinstance(index, slice) or index != slice(None):
+            raise TypeError("WordStore only supports replacing every word: [:]")
+        words = list(words)
+        self.clear()
+        self.extend(words)
+
+    def __delitem__(self, index):
+        if not isinstance(index, slice) or index.stop is not None or index.step:
+            raise TypeError("WordStore only supports deleting trailing words: [n:]")
+        start = index.indices(self._count)[0]
+        del self._data[start * self._width :]
+        self._count = start
+        self._order = None
+
+    def clear(self):
+        self._data = bytearray()
+        self._count = 0
+        self._sorted = True
+        self._order = None
+
+    def sort(self, order=None):
+        """Sort the words in place.
+
+        order, from sorted_ids(), saves working it out again. The records
+        are moved along the cycles of the permutation, one at a time.
+        """
+        if self._sorted:
+            return
+        if order is None:
+            order = self._sorted_order()
+        data = self._data
+        width = self._width
+        moved = bytearray(self._count)
+        for start in range(self._count):
+            if moved[start]:
+                continue
+            held = data[start * width : (start + 1) * width]
+            target = start
+            while True:
+                moved[target] = 1
+                source = order[target]
+                if source == start:
+                    data[target * width : (target + 1) * width] = held
+                    break
+                data[target * width : (target + 1) * width] = data[
+                    source * width : (source + 1) * width
+                ]
+                target = source
+        self._sorted = True
+        self._order = None
+
+    def dedup(self):
+        """Drop repeated words in place, keeping first occurrences in order.
+
+        Returns (record number, word) pairs for the removed words.
+        """
+        width = self._width
+        data = self._data
+        record = self._record
+        if self._sorted:
+            repeats = range(1, self._count)
+            repeated = [i for i in repeats if record(i) == record(i - 1)]
+        else:
+            # Equal records are neighbours in sorted order, first occurrence first
+            order = self._sorted_order()
+            flags = bytearray(self._count)
+            for previous, i in zip(order, islice(order, 1, None)):
+                if record(i) == record(previous):
+                    flags[i] = 1
+            repeated = [i for i, flag in enumerate(flags) if flag]
+        if not repeated:
+            return []
+        removed = [(i, self._decode(record(i))) for i in repeated]
+        # Close the gaps left by the repeats, moving each kept run down once
+        write = repeated[0] * width
+        for i, end in zip(repeated, [*repeated[1:], self._count]):
+            run = data[(i + 1) * width : end * width]
+            data[write : write + len(run)] = run
+            write += len(run)
+        del data[write:]
+        self._count -= len(repeated)
+        self._order = None
+        return removed
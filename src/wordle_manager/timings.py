@@ -0,0 +1,128 @@
+import os
+import sys
+from time import perf_counter
+
+# Set to 1 (or "-") to report timings on stderr, or to a file path
+ENV_VAR = "WW_TIMINGS"
+
+_active = None
+
+
+class _NoPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+# Returned by phase() while timings are off, so a disabled phase costs one
+# global lookup and an empty with block
+_NO_PHASE = _NoPhase()
+
+
+class _Phase:
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timings.add(self.name, perf_counter() - self.start)
+        return False
+
+
+class Timings:
+    """Wall-clock time per phase and event counters for one command.
+
+    A phase entered more than once accumulates its time and call count.
+    Phases may nest, in which case the inner time is included in both.
+    """
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.phases = {}
+        self.calls = {}
+        self.counters = {}
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self, command=None):
+        return {
+            "command": command,
+            "total_ms": round((perf_counter() - self.started) * 1000, 3),
+            "phases": {
+                name: {"ms": round(seconds * 1000, 3), "calls": self.calls[name]}
+                for name, seconds in self.phases.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+
+def phase(name):
+    """Context manager timing a phase, or doing nothing while timings are off"""
+    if _active is None:
+        return _NO_PHASE
+    return _active.phase(name)
+
+
+def count(name, n=1):
+    if _active is not None:
+        _active.count(name, n)
+
+
+def enabled():
+    return _active is not None
+
+
+def start():
+    """Start recording; phases and counts before this are not kept"""
+    global _active
+    _active = Timings()
+    return _active
+
+
+def stop():
+    global _active
+    timings, _active = _active, None
+    return timings
+
+
+def destination(flag=False, path=None, environ=os.environ):
+    """Where to report: --timings-file, --timings, then the environment.
+
+    Returns None when timings are off and "-" for stderr.
+    """
+    if path:
+        return path
+    if flag:
+        return "-"
+    value = environ.get(ENV_VAR, "")
+    if value.lower() in ("", "0", "false", "no"):
+        return None
+    return "-" if value.lower() in ("1", "true", "yes") else value
+
+
+def report(timings, target, command=None):
+    """Write the timings as one line of JSON to stderr or append it to a file"""
+    import json
+
+    line = json.dumps(timings.to_dict(command)) + "\n"
+    if target == "-":
+        sys.stderr.write(line)
+    else:
+        with open(target, "a") as f:
+            f.write(line)
@@ -1,123 +1,441 @@
-import os
-from collections import Counter
+import time
+from itertools import islice
+from string import ascii_lowercase
 
-from . import words
+from . import output, timings
+from .frequency import letter_frequency
+from .lexicons import DEFAULT_LENGTH, get_lexicon
+from .oplog import Append, OperationLog, Remove, Sort, removed_positions
+from .stats import WordStats, load_stats, save_stats, stats_cache_path
+from .store import WordStore
+from .validation import VOWELS, Blocklist, default_pipeline
+
+# Word lists loaded from storage with at least this many words are kept in a
+# compact WordStore instead of a list of str
+COMPACT_MIN = 100_000
 
 
 def has_repeating_letters(word):
     return len(set(word)) != len(word)
 
 
+def is_valid_word(word, length=DEFAULT_LENGTH):
+    return len(word) == length and word.isalpha() and any(c in VOWELS for c in word)
+
+
+def iter_words(lines, chunk_size=10_000):
+    """Yield lists of lower-cased words from a text stream, chunk_size lines at a time"""
+    lines = iter(lines)
+    while chunk := list(islice(lines, chunk_size)):
+        yield [word.lower() for line in chunk for word in line.split()]
+
+
 class WordListManager:
     def __init__(
-        self, word_list: list[str] | None = None, save_on_change: bool = True
+        self,
+        word_list: list[str] | None = None,
+        save_on_change: bool = True,
+        storage=None,
+        lexicon: str | None = None,
+        length: int | None = None,
+        compact: bool | None = None,
     ) -> None:
-        if word_list is None:
-            self.word_list = words.word_list
-        else:
-            self.word_list = word_list
+        self.lexicon = get_lexicon(lexicon, length)
+        self.word_length = self.lexicon.length
+        self.storage = self.lexicon.storage if storage is None else storage
+        # Whether word_list is what storage holds once pending changes are saved
+        self._from_storage = word_list is None
+        with timings.phase("load"):
+            if word_list is None:
+                word_list = self._load(compact)
+            elif compact and not isinstance(word_list, WordStore):
+                word_list = WordStore(word_list, width=self.word_length)
+        self.word_list = word_list
         self.save_on_change = save_on_change
-        self._initial_state = None
+        self.log = OperationLog()
+        self._in_session = False
+        self._checkpoint = None
+        self._stats = None
+        self._stats_key = None
+
+    def _load(self, compact):
+        """Read the list from storage, streaming large ones into a WordStore.
+
+        Words stream straight into the store's buffer, so a large list never
+        exists as a list of str as well.
+        """
+        stream = getattr(self.storage, "stream", None)
+        if compact is None and stream is not None:
+            # Every word takes at least its letters and a separator, so a
+            # smaller file cannot hold enough words to be worth compacting
+            if self.storage.size() < COMPACT_MIN * (self.word_length + 1):
+                compact = False
+        if stream is None or compact is False:
+            word_list = self.storage.load()
+            if compact or (compact is None and len(word_list) >= COMPACT_MIN):
+                return WordStore(word_list, width=self.word_length)
+            return word_list
+        store = WordStore(stream(), width=self.word_length)
+        if compact is None and len(store) < COMPACT_MIN:
+            return store.tolist()
+        return store
+
+    @property
+    def stats(self):
+        """Statistics for the list, built once and then updated in place"""
+        key = (id(self.word_list), len(self.word_list))
+        if self._stats is None or self._stats_key != key:
+            self._stats = self._load_stats()
+        self._stats_key = key
+        return self._stats
+
+    def _stored_digest(self):
+        """Digest of the saved list while word_list matches it, else None"""
+        digest = getattr(self.storage, "digest", None)
+        if digest is None or not self._from_storage or self.has_unsaved_changes():
+            return None
+        try:
+            return digest().hex()
+        except OSError:
+            return None
+
+    def _load_stats(self):
+        """Statistics saved by an earlier run for this version of the list.
+
+        Otherwise they are gathered in one pass and saved for the next run.
+        """
+        digest = self._stored_digest()
+        path = stats_cache_path(self.lexicon)
+        if digest is not None:
+            stats = load_stats(path, digest)
+            if stats is not None and stats.total == len(self.word_list):
+                return stats
+        stats = WordStats.from_words(self.word_list)
+        if digest is not None:
+            save_stats(path, digest, stats)
+        return stats
+
+    def _track(self, update):
+        """Apply an update to the statistics if they have been built"""
+        if self._stats is None or self._stats_key[0] != id(self.word_list):
+            return
+        if self._stats.counts is None:  # restored, so rebuild when next read
+            self._stats = None
+            return
+        update(self._stats)
+        if self._stats.total == len(self.word_list):
+            self._stats_key = (id(self.word_list), len(self.word_list))
+        else:  # the list was also edited directly, so start over
+            self._stats = None
 
     def __enter__(self):
-        """Context manager entry - save initial state"""
-        self._initial_state = self.word_list.copy()
+        """Context manager entry - defer saving until exit"""
+        self._in_session = True
+        self._checkpoint = self.log.begin()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - save changes if any were made"""
-        if self.save_on_change:
-            if self._initial_state != self.word_list:
-                self.save_to_file()
-                print("Changes saved automatically")
+        """Context manager exit - save changes once, or roll them back on error"""
+        self._in_session = False
+        if exc_type is not None and self._checkpoint is not None:
+            self.log.rollback(self.word_list, self._checkpoint)
+            self._stats = None
+        elif self.save_on_change and self.has_unsaved_changes():
+            self.save_to_file()
+            output.note("Changes saved automatically")
+        self._checkpoint = None
+        self.log.end()
         return False
 
+    def has_unsaved_changes(self):
+        return self.log.unsaved
+
+    def _changed(self, operation):
+        """Log a change and save it now unless a session is batching them"""
+        self.log.record(operation)
+        self._autosave()
+
+    def _autosave(self):
+        if self.save_on_change and not self._in_session:
+            self.save_to_file()
+
+    def undo(self):
+        """Revert the last change; returns False if there was none"""
+        operation = self.log.undo(self.word_list)
+        if operation is None:
+            output.result({"undone": None}, "Nothing to undo")
+            return False
+        self._stats = None
+        output.result({"undone": str(operation)}, f"Undid {operation}")
+        self._autosave()
+        return True
+
+    def redo(self):
+        """Apply the last undone change again; returns False if there was none"""
+        operation = self.log.redo(self.word_list)
+        if operation is None:
+            output.result({"redone": None}, "Nothing to redo")
+            return False
+        self._stats = None
+        output.result({"redone": str(operation)}, f"Redid {operation}")
+        self._autosave()
+        return True
+
     @classmethod
     def for_testing(cls, test_word_list=None):
         """Create manager for testing that doesn't modify the original file"""
         if test_word_list is None:
+            from . import words
+
             test_word_list = words.word_list.copy()
         return cls(word_list=test_word_list, save_on_change=False)
 
-    def remove_invalid_words(self):
-        VOWELS = set("aeiouy")
-        original_count = len(self.word_list)
-        valid_words = [
-            word
-            for word in self.word_list
-            if len(word) == 5
-            and word.isalpha()
-            and any(char in VOWELS for char in word)
-        ]
-        removed_count = original_count - len(valid_words)
-
-        if removed_count:
-            print(f"Removed {removed_count} invalid words")
-            self.word_list[:] = valid_words
-            if self.save_on_change:
-                self.save_to_file()
+    def remove_invalid_words(
+        self,
+        dry_run=False,
+        jobs=None,
+        blocklist_file=None,
+        patterns=(),
+        pipeline=None,
+    ):
+        """Drop words failing the validation pipeline in one pass.
+
+        The default pipeline checks length, letters and vowels, plus the
+        words in blocklist_file and regexes every word must match. With
+        dry_run the list is left alone and every word that would go is
+        listed with the rule it fails. Returns the ValidationReport.
+        """
+        if pipeline is None:
+            blocklist = Blocklist.from_file(blocklist_file) if blocklist_file else None
+            pipeline = default_pipeline(self.word_length, blocklist, patterns or ())
+        with timings.phase("filter"):
+            report = pipeline.run(self.word_list, jobs)
+        removed_count = len(report)
+        timings.count("words_scanned", len(self.word_list))
+        timings.count("words_rejected", removed_count)
+
+        reasons = report.counts()
+        reason_lines = [f"  {reason}: {count:,}" for reason, count in reasons]
+        if dry_run:
+            def print_rejected(rejected):
+                print(f"Would remove {removed_count:,} invalid words")
+                for line in reason_lines:
+                    print(line)
+                for word, reason in rejected:
+                    print(f"- {word}  ({reason})")
+
+            output.records(
+                "rejected",
+                report.rejected,
+                print_rejected,
+                record=lambda item: {"word": item[0], "reason": item[1]},
+                fields={"count": removed_count, "reasons": dict(reasons)},
+            )
+        elif removed_count:
+            output.result(
+                {"removed": removed_count, "reasons": dict(reasons)},
+                f"Removed {removed_count} invalid words",
+                *reason_lines,
+            )
+            removed = removed_positions(self.word_list, report.valid)
+            self.word_list[:] = report.valid
+            words = report.removed
+            self._track(lambda stats: stats.remove(words, self.word_list))
+            self._changed(Remove(removed))
         else:
-            print("No invalid words found")
+            output.result({"removed": 0, "reasons": {}}, "No invalid words found")
+        return report
+
+    def frequency(self):
+        """Letter frequency analysis of the list, cached per list version"""
+        name = f"{self.lexicon.name}-{self.lexicon.length}"
+        return letter_frequency(self.word_list, name if self.save_on_change else None)
 
     def find_scarce_letters(self, num=3):
-        target_list = self.word_list
-        letters_counts = Counter("".join(target_list))
-        least_used_letters = letters_counts.most_common()[: -num - 1 : -1]
-        for letter, count in least_used_letters:
-            print(f"  {letter.upper()}: {count} occurrences")
+        def print_scarce(scarce):
+            for letter, count in scarce:
+                print(f"  {letter.upper()}: {count} occurrences")
+
+        output.records(
+            "letters",
+            self.frequency().bottom(num),
+            print_scarce,
+            record=lambda item: {"letter": item[0], "count": item[1]},
+        )
 
     def remove_duplicates(self):
         target_list = self.word_list
         original_count = len(target_list)
-        seen = set()
-        target_list[:] = [
-            word for word in target_list if not (word in seen or seen.add(word))
-        ]
+        if isinstance(target_list, WordStore):
+            removed = target_list.dedup()
+        else:
+            seen = set()
+            kept = []
+            removed = []
+            for i, word in enumerate(target_list):
+                if word in seen:
+                    removed.append((i, word))
+                else:
+                    seen.add(word)
+                    kept.append(word)
+            target_list[:] = kept
+        operation = Remove(removed)
+        if removed:
+            self._track(lambda stats: stats.remove(operation.words, target_list))
         removed_count = original_count - len(target_list)
-        print(f"Removed {removed_count} duplicate words")
-        print(f"Word list: {len(target_list)} unique words")
-        if self.save_on_change:
-            self.save_to_file()
+        output.result(
+            {"removed": removed_count, "words": len(target_list)},
+            f"Removed {removed_count} duplicate words",
+            f"Word list: {len(target_list)} unique words",
+        )
+        if removed:
+            self._changed(operation)
 
     def sort_words(self):
         target_list = self.word_list
-        target_list.sort()
-        print("Word list sorted")
-        if self.save_on_change:
-            self.save_to_file()
+        operation = Sort.capture(target_list)
+        changed = operation.order is not None
+        if changed:
+            if isinstance(target_list, WordStore):
+                target_list.sort(operation.order)  # reuse the order kept for undo
+            else:
+                target_list.sort()
+            self._track(lambda stats: stats.mark_sorted(target_list))
+        output.result({"sorted": True, "words": len(target_list)}, "Word list sorted")
+        if changed:
+            self._changed(operation)
 
     def add_word(self, word):
         target_list = self.word_list
         if word not in target_list:
             target_list.append(word)
-            print(f"Added '{word}' to word list")
-            if self.save_on_change:
-                self.save_to_file()
+            self._track(lambda stats: stats.add(word))
+            output.result({"word": word, "added": True}, f"Added '{word}' to word list")
+            self._changed(Append([word]))
             return True
         else:
-            print(f"'{word}' already exists in word list")
+            output.result(
+                {"word": word, "added": False}, f"'{word}' already exists in word list"
+            )
             return False
 
+    def import_words(self, lines, chunk_size=10_000):
+        """Add every valid, new word from a text stream with a single save"""
+        start = time.perf_counter()
+        # A WordStore answers membership itself without a set of every word
+        existing = self.word_list
+        if not isinstance(existing, WordStore):
+            existing = set(existing)
+        known = set()
+        added = []
+        seen_count = invalid_count = 0
+        for chunk in iter_words(lines, chunk_size):
+            seen_count += len(chunk)
+            for word in chunk:
+                if word in known or word in existing:
+                    continue
+                if not is_valid_word(word, self.word_length):
+                    invalid_count += 1
+                    continue
+                known.add(word)
+                added.append(word)
+
+        timings.count("words_scanned", seen_count)
+        timings.count("words_rejected", invalid_count)
+        if added:
+            self.word_list.extend(added)
+            self._track(lambda stats: stats.extend(added))
+            self._changed(Append(added))
+        elapsed = time.perf_counter() - start
+        duplicate_count = seen_count - invalid_count - len(added)
+        rate = seen_count / elapsed if elapsed else 0
+        output.result(
+            {
+                "added": len(added),
+                "duplicates": duplicate_count,
+                "invalid": invalid_count,
+                "read": seen_count,
+                "seconds": elapsed,
+            },
+            f"Imported {len(added):,} new words "
+            f"({duplicate_count:,} duplicates, {invalid_count:,} invalid)",
+            f"Read {seen_count:,} words in {elapsed:.2f}s ({rate:,.0f} words/sec)",
+        )
+        return len(added)
+
     def save_to_file(self):  # pragma: no cover
         if not self.save_on_change:
             return
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        words_file = os.path.join(script_dir, "words.py")
-
-        with open(words_file, "w") as f:
-            f.write("word_list = [\n")
-            for i, word in enumerate(words.word_list):
-                if i % 10 == 0 and i > 0:
-                    f.write("\n")
-                f.write(f" '{word}',")
-            f.write("\n]\n")
+        # Appends go to the storage journal; anything else rewrites the list
+        with timings.phase("save"):
+            self.storage.save(self.word_list, self.log.pending_additions())
+        self.log.mark_saved()
+        self._from_storage = True
+        # Statistics kept current in this run carry over to the next one
+        key = (id(self.word_list), len(self.word_list))
+        stats = self._stats
+        if stats is not None and stats.counts is not None and self._stats_key == key:
+            if digest := self._stored_digest():
+                save_stats(stats_cache_path(self.lexicon), digest, stats)
 
     def show_stats(self):
-        target_list = self.word_list
-        print("Word list statistics:")
-        print(f"  Total words:    {len(target_list):>5,}")
-        print(f"  Unique words:   {len(set(target_list)):>5,}")
-        print(f"  Duplicates:     {len(target_list) - len(set(target_list)):>5,}")
-        print(
-            f"  List sorted:    {'Yes' if target_list == sorted(target_list) else 'No':>5}"
+        stats = self.stats
+        output.result(
+            stats.to_dict(),
+            "Word list statistics:",
+            f"  Total words:    {stats.total:>5,}",
+            f"  Unique words:   {stats.unique:>5,}",
+            f"  Duplicates:     {stats.duplicates:>5,}",
+            f"  List sorted:    {'Yes' if stats.is_sorted else 'No':>5}",
+        )
+
+    def show_frequency(self, top=None, bottom=None, by=None, position=None):
+        """Print the position matrix, or a ranking of one table"""
+        frequency = self.frequency()
+        if by is None:
+            by = "letters" if position is None else "position"
+        if position is not None:
+            position -= 1
+        if top is not None or bottom is not None:
+            if top is not None:
+                ranked = frequency.top(top, by, position)
+            else:
+                ranked = frequency.bottom(bottom, by, position)
+
+            def print_ranking(ranking):
+                for key, count in ranking:
+                    print(f"  {key.upper()}: {count:,}")
+
+            name = "bigram" if by == "bigrams" else "letter"
+            output.records(
+                "ranking",
+                ranked,
+                print_ranking,
+                record=lambda item: {name: item[0], "count": item[1]},
+                fields={"by": by},
+            )
+            return
+
+        totals = frequency.letter_counts()
+        rows = (
+            (letter, counts, totals[letter], frequency.documents.get(letter, 0))
+            for letter, counts in frequency.positions.items()
+            if totals[letter] or letter in ascii_lowercase
+        )
+
+        def print_matrix(rows):
+            header = "".join(f"{i:>8}" for i in range(1, frequency.width + 1))
+            print(f"Letter frequency by position ({frequency.word_count:,} words):")
+            print(f"  {'':<3}{header}{'total':>9}{'words':>9}")
+            for letter, counts, total, words_with in rows:
+                cells = "".join(f"{count:>8,}" for count in counts)
+                print(f"  {letter.upper():<3}{cells}{total:>9,}{words_with:>9,}")
+
+        columns = ("letter", "positions", "total", "words")
+        output.records(
+            "letters",
+            rows,
+            print_matrix,
+            record=lambda row: dict(zip(columns, row)),
+            fields={"words": frequency.word_count},
         )
@@ -0,0 +1,222 @@
+import os
+import re
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from itertools import compress, islice
+from operator import not_
+
+VOWELS = frozenset("aeiouy")
+# Words per task when validation is split across processes
+CHUNK_SIZE = 50_000
+# Lists shorter than this are validated in-process by default
+PARALLEL_MIN = 200_000
+
+
+class ValidationError(ValueError):
+    pass
+
+
+class Rule(ABC):
+    """A check every valid word must pass; name says why a word failed it.
+
+    flags() checks many words at once. Rules override it with C-level
+    maps where they can, which keeps the per-word Python overhead out of
+    large passes.
+    """
+
+    name = "rule"
+
+    @abstractmethod
+    def __call__(self, word):
+        """Whether word passes the check"""
+
+    def flags(self, words):
+        """One truthy value per word that passes, falsy per word that fails"""
+        return map(self, words)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class Length(Rule):
+    def __init__(self, length):
+        self.length = length
+        self.name = f"not {length} letters"
+
+    def __call__(self, word):
+        return len(word) == self.length
+
+    def flags(self, words):
+        return map(self.length.__eq__, map(len, words))
+
+
+class Alphabetic(Rule):
+    name = "not alphabetic"
+
+    def __call__(self, word):
+        return word.isalpha()
+
+    def flags(self, words):
+        return map(str.isalpha, words)
+
+
+class HasVowel(Rule):
+    name = "no vowel"
+
+    def __init__(self, vowels=VOWELS):
+        self.vowels = frozenset(vowels)
+
+    def __call__(self, word):
+        return not self.vowels.isdisjoint(word)
+
+    def flags(self, words):
+        return map(not_, map(self.vowels.isdisjoint, words))
+
+
+class Blocklist(Rule):
+    name = "blocklisted"
+
+    def __init__(self, words):
+        self.words = frozenset(word.lower() for word in words)
+
+    def __call__(self, word):
+        return word not in self.words
+
+    def flags(self, words):
+        return map(not_, map(self.words.__contains__, words))
+
+    @classmethod
+    def from_file(cls, path):
+        """Blocklist of the whitespace-separated words in a text file"""
+        with open(path) as f:
+            return cls(word for line in f for word in line.split())
+
+
+class Regex(Rule):
+    """Words must match the whole pattern"""
+
+    def __init__(self, pattern):
+        try:
+            self.pattern = re.compile(pattern)
+        except re.error as e:
+            raise ValidationError(f"Invalid pattern '{pattern}': {e}") from None
+        self.name = f"does not match '{pattern}'"
+
+    def __call__(self, word):
+        return self.pattern.fullmatch(word) is not None
+
+    def flags(self, words):
+        return map(self.pattern.fullmatch, words)
+
+
+class ValidationReport:
+    """Outcome of one validation pass: the words kept and why others failed"""
+
+    def __init__(self, valid, rejected):
+        self.valid = valid
+        self.rejected = rejected
+
+    def __len__(self):
+        return len(self.rejected)
+
+    @property
+    def removed(self):
+        return [word for word, _ in self.rejected]
+
+    def counts(self):
+        """Rejected words per reason, most common first"""
+        return Counter(reason for _, reason in self.rejected).most_common()
+
+
+_pipeline = None
+
+
+def _init_worker(pipeline):
+    global _pipeline
+    _pipeline = pipeline
+
+
+def _split(words):
+    return _pipeline.split(words)
+
+
+class Pipeline:
+    """Rules applied in order to a stream of words in a single pass.
+
+    A word is rejected by the first rule it fails, so cheap rules that
+    reject the most should come first. Rules must be picklable for the
+    pipeline to run across processes.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+
+    def __repr__(self):
+        return f"Pipeline({list(self.rules)!r})"
+
+    def reason(self, word):
+        """Name of the first rule the word fails, or None if it is valid"""
+        for rule in self.rules:
+            if not rule(word):
+                return rule.name
+        return None
+
+    def split(self, words):
+        """Return (valid words, [(word, reason), ...]) for a list of words"""
+        remaining = words
+        rejected = []
+        for rule in self.rules:
+            flags = list(rule.flags(remaining))
+            if all(flags):
+                continue
+            failed = compress(remaining, map(not_, flags))
+            rejected.extend((word, rule.name) for word in failed)
+            remaining = list(compress(remaining, flags))
+        return remaining, rejected
+
+    def iter_chunks(self, words, jobs=1):
+        """Yield split() results for successive chunks of words, in order.
+
+        With more than one job the chunks are validated by worker processes,
+        with at most two per worker read from words and waiting at a time.
+        Any iterable works, so a large input never has to be in memory twice.
+        """
+        words = iter(words)
+        chunks = iter(lambda: list(islice(words, CHUNK_SIZE)), [])
+        if jobs <= 1:
+            yield from map(self.split, chunks)
+            return
+        # Imported here so in-process validation never loads multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            jobs, initializer=_init_worker, initargs=(self,)
+        ) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_split, chunk))
+                if len(pending) >= jobs * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def run(self, words, jobs=None):
+        """Validate every word into a ValidationReport"""
+        if jobs is None:
+            parallel = len(words) >= PARALLEL_MIN
+            jobs = (os.cpu_count() or 1) if parallel else 1
+        valid = []
+        rejected = []
+        for chunk_valid, chunk_rejected in self.iter_chunks(words, jobs):
+            valid.extend(chunk_valid)
+            rejected.extend(chunk_rejected)
+        return ValidationReport(valid, rejected)
+
+
+def default_pipeline(length, blocklist=None, patterns=()):
+    """The rules "ww clean" applies, plus an optional Blocklist and patterns"""
+    rules = [Length(length), Alphabetic(), HasVowel()]
+    if blocklist is not None:
+        rules.append(blocklist)
+    rules.extend(Regex(pattern) for pattern in patterns)
+    return Pipeline(rules)
@@ -0,0 +1,29 @@
+import pytest
+
+
+class RecordingStorage:
+    """Storage keeping a record of each save instead of writing it"""
+
+    def __init__(self, word_list):
+        self.word_list = word_list
+        self.saves = []
+
+    def load(self):
+        return list(self.word_list)
+
+    def save(self, word_list, added=None):
+        self.saves.append(None if added is None else list(added))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep tests clear of the user's directories and daemon settings"""
+    monkeypatch.setenv("WW_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("WW_HISTORY_DIR", str(tmp_path / "history"))
+    monkeypatch.delenv("WW_NO_DAEMON", raising=False)
+
+
+@pytest.fixture
+def recording_storage():
+    """Makes storages whose saves are None for a rewrite, else the words added"""
+    return RecordingStorage
@@ -0,0 +1,122 @@
+import json
+
+from src.wordle_manager import index as index_module
+from src.wordle_manager.bench import (
+    MANAGER_OPS,
+    MATCH_PATTERNS,
+    _load_mask_index,
+    bench_manager,
+    bench_match,
+    bench_selection,
+    check_startup,
+    print_import_profile,
+    profile_startup,
+    synthetic_words,
+    time_manager_op,
+)
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.main import main
+from src.wordle_manager.utils import WordListManager, is_valid_word
+
+
+def test_synthetic_words_are_repeatable():
+    word_list = synthetic_words(1000, seed=3)
+    assert word_list == synthetic_words(1000, seed=3)
+    assert len(word_list) == 1000
+    assert len(set(word_list)) < 1000
+    assert any(not is_valid_word(word) for word in word_list)
+
+
+def test_bench_manager_times_every_op():
+    results = bench_manager(sizes=(100, 200), repeat=1)
+    assert list(results) == ["100", "200"]
+    for timings in results.values():
+        assert list(timings) == list(MANAGER_OPS)
+        assert all(t["median_s"] >= 0 for t in timings.values())
+
+
+def test_validation_is_timed_without_a_process_pool(monkeypatch):
+    calls = []
+
+    def remove_invalid_words(self, **kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(WordListManager, "remove_invalid_words", remove_invalid_words)
+    time_manager_op(["crane"], "remove_invalid_words", repeat=2)
+    assert calls == [{"jobs": 1}, {"jobs": 1}]
+
+
+def test_stale_mask_index_is_rebuilt(monkeypatch):
+    rebuilt = []
+    real_load_index = index_module.load_index
+
+    def load_index(*args, **kwargs):
+        rebuilt.append(True)
+        return real_load_index(*args, **kwargs)
+
+    real_load_index()  # the index file has to exist before it can be stale
+    monkeypatch.setattr(index_module, "source_digest", lambda: b"changed")
+    monkeypatch.setattr(index_module, "load_index", load_index)
+    _load_mask_index()
+    assert rebuilt == [True]
+
+
+def test_bench_selection_covers_one_to_six_words():
+    index = WordIndex.from_words(["crane", "bumpy", "sight", "flock", "geese"])
+    results = bench_selection(repeat=1, index=index)
+    assert len(results) == 12
+    assert "n=6 -u" in results
+
+
+def test_bench_match_reports_throughput():
+    index = WordIndex.from_words(["crane", "arise", "skies", "being", "arced"])
+    results = bench_match(repeat=1, index=index)
+    assert results["words"] == 5
+    assert results["????s"]["matches"] == 1
+    assert results[".*(ing|ed)"]["matches"] == 2
+    for text in MATCH_PATTERNS:
+        assert results[text]["matches_per_s"] >= 0
+
+
+def test_bench_command_writes_json(monkeypatch, tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    argv = ["ww", "bench", "--sizes", "100", "--repeat", "1", "--no-startup"]
+    monkeypatch.setattr("sys.argv", argv + ["-o", str(output)])
+    main()
+    report = json.loads(output.read_text())
+    assert capsys.readouterr().out == ""
+    assert set(report) == {"environment", "selection", "match", "manager"}
+    assert list(report["manager"]) == ["100"]
+
+
+def test_help_does_not_load_word_list_or_commands():
+    modules = {name for name, *_ in profile_startup(["--help"])}
+    assert "wordle_manager.cli" in modules
+    for heavy in (
+        "wordle_manager.words",
+        "wordle_manager.utils",
+        "wordle_manager.selection",
+        "wordle_manager.bench",
+        "multiprocessing",
+        "random",
+    ):
+        assert heavy not in modules
+
+
+def test_print_import_profile_ranks_direct_imports(capsys):
+    entries = [
+        ("json.decoder", 300, 300, 1),
+        ("json", 200, 500, 0),
+        ("wordle_manager.cli", 100, 900, 0),
+    ]
+    print_import_profile(entries, ["--help"], top=1)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Imports for 'ww --help': 3 modules, 0.6 ms"
+    assert len(lines) == 3
+    assert lines[2].endswith("wordle_manager.cli")
+
+
+def test_check_startup_compares_with_targets():
+    results = check_startup(repeat=1, targets={"help": 10.0})
+    assert list(results) == ["help"]
+    assert results["help"]["ok"]
@@ -24,3 +24,22 @@ def test_parse_args_basic_actions(monkeypatch, sys_argv, expected_action):
     assert args.action == expected_action
     assert not hasattr(args, "num")
     assert not hasattr(args, "word")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-n", "3", "--budget", "500"],
+        ["--max-overlap", "0"],
+        ["--budget", "5", "stats"],
+    ],
+)
+def test_optimize_options_require_optimize(argv, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+    assert "only apply with --optimize" in capsys.readouterr().err
+
+
+def test_optimize_budget_defaults_to_50_ms():
+    assert parse_args(["--optimize"]).budget == 50
+    assert parse_args(["--optimize", "--budget", "5"]).budget == 5
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from src.wordle_manager.constraints import (
+    ConstraintError,
+    Constraints,
+    bit_ids,
+    letter_bitsets,
+)
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.search import DisjointSearch, word_mask
+from src.wordle_manager.selection import select_words
+
+SAMPLE_WORDS = sorted(
+    ["crane", "bumpy", "sight", "flock", "geese", "dough", "witch", "jumps", "vexed"]
+)
+
+
+@pytest.fixture
+def index():
+    return WordIndex.from_words(SAMPLE_WORDS)
+
+
+def words_of(index, bits):
+    return [index.word(i) for i in bit_ids(bits)]
+
+
+def test_bit_ids():
+    assert bit_ids(0) == []
+    assert bit_ids(0b1011) == [0, 1, 3]
+    assert bit_ids(1 << 70 | 1 << 8) == [8, 70]
+
+
+def test_letter_and_position_bitsets(index):
+    bitsets = letter_bitsets(index)
+    assert words_of(index, bitsets.containing("u")) == ["bumpy", "dough", "jumps"]
+    assert words_of(index, bitsets.at(1, "u")) == ["bumpy", "jumps"]
+    assert bitsets.containing("z") == 0
+    assert letter_bitsets(index) is bitsets
+
+
+def test_parse():
+    constraints = Constraints.parse("Q,z", "ea", "?r??.", ["e5", "s1"])
+    assert constraints.required == "qz"
+    assert constraints.excluded == "ae"
+    assert constraints.placed == ((1, "r"),)
+    assert constraints.misplaced == ((0, "s"), (4, "e"))
+    assert not Constraints.parse()
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (("q1",), "letters a-z"),
+        ((None, None, "?r!"), "Unexpected '!'"),
+        ((None, None, None, ["e"]), "such as 'e5'"),
+        ((None, None, None, ["e0"]), "count from 1"),
+    ],
+)
+def test_parse_errors(args, message):
+    with pytest.raises(ConstraintError, match=message):
+        Constraints.parse(*args)
+
+
+def test_candidates(index):
+    bitsets = letter_bitsets(index)
+    excluded = Constraints.parse(exclude="e")
+    assert "geese" not in words_of(index, excluded.candidates(bitsets, 5))
+    misplaced = Constraints.parse(not_at=["u2"])
+    assert "dough" in words_of(index, misplaced.candidates(bitsets, 5))
+    assert "jumps" not in words_of(index, misplaced.candidates(bitsets, 5))
+    # A word holding the placed letter anywhere else can never be used
+    placed = Constraints.parse(pattern="??u??")
+    assert "bumpy" not in words_of(index, placed.candidates(bitsets, 5))
+    assert "crane" in words_of(index, placed.candidates(bitsets, 5))
+    with pytest.raises(ConstraintError, match="past the end"):
+        Constraints.parse(pattern="?????x").candidates(bitsets, 5)
+
+
+def test_required_and_excluded_overlap(index):
+    conflict = Constraints.parse(require="e", exclude="e")
+    assert conflict.candidates(letter_bitsets(index), 5) == 0
+
+
+def test_search_covers_required_letters():
+    search = DisjointSearch(SAMPLE_WORDS)
+    required = word_mask("vj")
+    for seed in range(10):
+        words = search.find(2, random.Random(seed), required)
+        assert word_mask("".join(words)) & required == required
+    assert search.find(2, required=word_mask("vjq")) is None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_select_words_meets_constraints(index, seed):
+    constraints = Constraints.parse("j", "r", "?u???")
+    selection = select_words(3, seed=seed, index=index, constraints=constraints)
+    letters = "".join(selection.words)
+    assert selection.complete
+    assert "j" in letters and "r" not in letters
+    assert [w for w in selection.words if "u" in w][0][1] == "u"
+
+
+def test_select_words_impossible_constraints(index):
+    constraints = Constraints.parse(require="z")
+    selection = select_words(2, seed=1, index=index, constraints=constraints)
+    assert selection.words == ()
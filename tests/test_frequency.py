@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from src.wordle_manager import frequency as frequency_module
+from src.wordle_manager.frequency import (
+    FrequencyError,
+    LetterFrequency,
+    content_hash,
+    frequency_cache_path,
+    letter_frequency,
+)
+from src.wordle_manager.utils import WordListManager
+
+SAMPLE_WORDS = ["crane", "adieu", "geese", "crane"]
+
+
+@pytest.fixture
+def frequency():
+    return LetterFrequency.from_words(SAMPLE_WORDS)
+
+
+def test_position_matrix(frequency):
+    assert len(frequency.positions) == 26
+    assert frequency.positions["c"] == [2, 0, 0, 0, 0]
+    assert frequency.positions["e"] == [0, 1, 1, 1, 3]
+    assert frequency.width == 5
+
+
+def test_document_frequency_counts_words_once(frequency):
+    assert frequency.documents["e"] == 4
+    assert frequency.letter_counts()["e"] == 6
+
+
+def test_bigrams(frequency):
+    assert frequency.bigrams["cr"] == 2
+    assert frequency.bigrams["ee"] == 1
+    assert "ec" not in frequency.bigrams
+
+
+def test_top_and_bottom(frequency):
+    assert frequency.top(2) == [("e", 6), ("a", 3)]
+    assert frequency.bottom(2) == [("d", 1), ("g", 1)]
+    assert frequency.top(1, "position", 4) == [("e", 3)]
+    assert frequency.bottom(1, "documents") == [("d", 1)]
+
+
+def test_bad_queries(frequency):
+    with pytest.raises(FrequencyError, match="needs a position"):
+        frequency.top(1, "position")
+    with pytest.raises(FrequencyError, match="between 1 and 5, got 6"):
+        frequency.top(1, "position", 5)
+    with pytest.raises(FrequencyError, match="Unknown table"):
+        frequency.top(1, "vowels")
+
+
+def test_content_hash_tracks_order_and_content():
+    assert content_hash(["crane", "adieu"]) == content_hash(["crane", "adieu"])
+    assert content_hash(["crane", "adieu"]) != content_hash(["adieu", "crane"])
+    assert content_hash(["crane"]) != content_hash(["crane", "crane"])
+
+
+def test_cached_per_list_version(monkeypatch):
+    monkeypatch.setattr(frequency_module, "_cached_frequencies", {})
+    word_list = ["crane", "adieu"]
+    first = letter_frequency(word_list, "sample-5")
+    assert letter_frequency(word_list, "sample-5") is first
+
+    with open(frequency_cache_path("sample-5")) as f:
+        assert json.load(f)["key"] == content_hash(word_list)
+
+    # A fresh process reads the analysis back from disk
+    monkeypatch.setattr(frequency_module, "_cached_frequencies", {})
+    monkeypatch.setattr(LetterFrequency, "from_words", None)
+    assert letter_frequency(word_list, "sample-5").to_dict() == first.to_dict()
+
+
+def test_changed_list_is_analyzed_again(monkeypatch):
+    monkeypatch.setattr(frequency_module, "_cached_frequencies", {})
+    word_list = ["crane"]
+    assert letter_frequency(word_list, "sample-5").top(1) == [("a", 1)]
+    word_list.append("geese")
+    assert letter_frequency(word_list, "sample-5").top(1) == [("e", 4)]
+
+
+def test_find_scarce_letters_uses_rarest_first(capsys):
+    manager = WordListManager.for_testing(["crane", "adieu", "crane"])
+    manager.find_scarce_letters(num=2)
+    assert capsys.readouterr().out == "  D: 1 occurrences\n  I: 1 occurrences\n"
+
+
+def test_show_frequency_matrix_and_ranking(capsys):
+    manager = WordListManager.for_testing(["crane", "adieu"])
+    manager.show_frequency()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Letter frequency by position (2 words):"
+    assert lines[2].split() == ["A", "1", "0", "1", "0", "0", "2", "2"]
+
+    manager.show_frequency(top=1, position=5)
+    assert capsys.readouterr().out == "  E: 1\n"
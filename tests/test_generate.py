@@ -0,0 +1,62 @@
+import pytest
+
+from src.wordle_manager.generate import iter_disjoint_sets
+from src.wordle_manager.lexicons import Lexicon, get_lexicon
+from src.wordle_manager.main import main
+from src.wordle_manager.storage import TextStorage
+
+SAMPLE_WORDS = ["crane", "bumpy", "sight", "flock", "nacre", "dough", "witch", "jumps"]
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    path = tmp_path / "sample-5.txt"
+    path.write_text("\n".join(SAMPLE_WORDS) + "\n")
+    return Lexicon("sample", 5, TextStorage(str(path)), str(tmp_path / "sample-5.idx"))
+
+
+def is_disjoint(words):
+    return len(set("".join(words))) == sum(len(set(word)) for word in words)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sets_are_distinct_and_disjoint(lexicon, jobs):
+    sets = list(iter_disjoint_sets(lexicon, 2, 5, jobs=jobs, seed=7))
+    assert len(sets) == 5
+    assert len({tuple(sorted(words)) for words in sets}) == 5
+    assert all(is_disjoint(words) for words in sets)
+
+
+def test_stops_when_no_more_distinct_sets(lexicon):
+    sets = list(iter_disjoint_sets(lexicon, 3, 1000, jobs=1, seed=1, max_attempts=200))
+    assert 0 < len(sets) < 1000
+    assert all(is_disjoint(words) for words in sets)
+
+
+def test_impossible_size_yields_nothing(lexicon):
+    assert list(iter_disjoint_sets(lexicon, 6, 3, jobs=1)) == []
+
+
+def test_seed_makes_output_repeatable(lexicon):
+    first = list(iter_disjoint_sets(lexicon, 2, 4, jobs=1, seed=3))
+    second = list(iter_disjoint_sets(lexicon, 2, 4, jobs=1, seed=3))
+    assert first == second
+
+
+def test_main_generate_reports_shortfall(lexicon, monkeypatch, capsys):
+    monkeypatch.setattr("src.wordle_manager.main.get_lexicon", lambda *a: lexicon)
+    monkeypatch.setattr(
+        "sys.argv", ["ww", "5", "generate", "--count", "2", "--jobs", "1"]
+    )
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Found 0 distinct sets of 5 words" in captured.err
+
+
+def test_bundled_list_generates_four_word_sets():
+    sets = list(iter_disjoint_sets(get_lexicon(), 4, 3, unique_letters=True, jobs=1))
+    assert len(sets) == 3
+    assert all(is_disjoint(words) and len(words) == 4 for words in sets)
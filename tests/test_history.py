@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.wordle_manager.history import (
+    History,
+    HistoryError,
+    history_path,
+    id_bitset,
+    schedule,
+)
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.lexicons import get_lexicon
+from src.wordle_manager.main import main
+from src.wordle_manager.selection import select_words
+
+WORDS = ["abbey", "crane", "fight", "jumpy", "slate", "tears", "vowel", "zesty"]
+DAY = date(2026, 1, 1)
+
+
+@pytest.fixture
+def index():
+    return WordIndex.from_words(WORDS)
+
+
+@pytest.fixture
+def history(tmp_path):
+    return History(str(tmp_path / "default-5.history"))
+
+
+def test_record_appends_and_reloads(history):
+    history.record([(DAY, "crane")])
+    history.record([(DAY + timedelta(1), "slate"), (DAY + timedelta(2), "fight")])
+    reloaded = History(history.path)
+    assert reloaded.entries == history.entries
+    assert [word for _, word in reloaded.entries] == ["crane", "slate", "fight"]
+    assert reloaded.last_date() == DAY + timedelta(2)
+
+
+def test_torn_last_line_is_ignored_and_dropped(history):
+    history.record([(DAY, "crane")])
+    with open(history.path, "a") as f:
+        f.write("2026-01-02 sla")
+    assert History(history.path).entries == [(DAY, "crane")]
+    History(history.path).record([(DAY + timedelta(1), "slate")])
+    with open(history.path) as f:
+        assert f.read() == "2026-01-01 crane\n2026-01-02 slate\n"
+
+
+def test_used_bits(index, history):
+    history.record([(DAY, "crane"), (DAY, "zesty"), (DAY, "other")])
+    bits = history.used_bits(index)
+    assert bits == id_bitset([1, 7], len(index))
+    assert bits == (1 << 1) | (1 << 7)
+
+
+def test_selection_skips_excluded_words(index, history):
+    history.record([(DAY, word) for word in WORDS if word != "jumpy"])
+    exclude = history.used_bits(index)
+    for exhaustive in (False, True):
+        selection = select_words(1, index=index, exhaustive=exhaustive, seed=1)
+        excluded = select_words(
+            1, index=index, exhaustive=exhaustive, seed=1, exclude=exclude
+        )
+        assert selection.words != () and excluded.words == ("jumpy",)
+
+
+def test_schedule_never_repeats_by_default(index, history):
+    history.record([(DAY, "crane"), (DAY, "slate")])
+    picks = schedule(index, history, 6, DAY + timedelta(1), seed=3)
+    assert [day for day, _ in picks] == [DAY + timedelta(i) for i in range(1, 7)]
+    words = [word for _, word in picks]
+    assert sorted(words) == sorted(set(WORDS) - {"crane", "slate"})
+    with pytest.raises(HistoryError, match="No word fits 2026-01-08"):
+        schedule(index, history, 7, DAY + timedelta(1), seed=3)
+
+
+def test_schedule_repeats_after_the_gap(index, history):
+    picks = schedule(index, history, 20, DAY, no_repeat_days=8, seed=1)
+    words = [word for _, word in picks]
+    assert sorted(words[:8]) == sorted(WORDS)
+    for i in range(8, 20):
+        assert words[i] not in words[i - 7 : i]
+
+
+def test_schedule_limits_shared_letters(index, history):
+    picks = schedule(index, history, 4, DAY, max_shared=1, seed=2)
+    letters = [set(word) for _, word in picks]
+    for i, word in enumerate(letters):
+        assert all(len(word & other) <= 1 for other in letters[:i])
+    with pytest.raises(HistoryError):
+        schedule(index, history, 8, DAY, max_shared=0, seed=2)
+
+
+def test_history_and_schedule_commands(monkeypatch, capsys):
+    history = History(history_path(get_lexicon()))
+
+    def ww(*argv):
+        monkeypatch.setattr("sys.argv", ["ww", *argv])
+        try:
+            main()
+        except SystemExit as e:
+            assert e.code == 1
+        return capsys.readouterr().out
+
+    assert ww("history", "--add", "Crane", "--date", "2026-01-01") == (
+        "  2026-01-01  crane\n"
+    )
+    assert ww("history", "--add", "zzzzz") == "Error: 'zzzzz' is not in the word list\n"
+    out = ww("--format", "ndjson", "schedule", "--days", "2", "--seed", "1", "--save")
+    # The last answer is in the past, so the schedule starts today
+    assert out.startswith(f'{{"date": "{date.today().isoformat()}", "word": ')
+    assert len(History(history.path).entries) == 3
+    assert "crane" not in ww("-n", "5", "--exhaustive", "--exclude-used", "--seed", "4")
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from src.wordle_manager import index as index_module
+from src.wordle_manager.index import (
+    WordIndex,
+    load_index,
+    shuffled_ids,
+    write_index,
+)
+from src.wordle_manager.utils import has_repeating_letters
+from src.wordle_manager.words import word_list
+
+
+@pytest.fixture
+def sample_index():
+    return WordIndex.from_words(["crane", "apple", "bumpy", "crane", "inv@l", "xyz"])
+
+
+def test_records_are_sorted_unique_and_valid(sample_index):
+    assert sample_index.words() == ["apple", "bumpy", "crane"]
+    assert list(sample_index) == sample_index.words()
+    assert len(sample_index) == 3
+
+
+def test_masks_and_flags_match_words(sample_index):
+    for i, word in enumerate(sample_index):
+        expected = sum(1 << (ord(c) - 97) for c in set(word))
+        assert sample_index.masks[i] == expected
+        assert sample_index.has_repeats(i) is has_repeating_letters(word)
+    assert sample_index.unique_ids() == [1, 2]
+
+
+def test_membership_uses_binary_search(sample_index):
+    assert "crane" in sample_index
+    assert "apple" in sample_index
+    assert "zebra" not in sample_index
+    assert "cran" not in sample_index
+    assert sample_index.position("bumpy") == 1
+
+
+def test_getitem_bounds(sample_index):
+    assert sample_index[-1] == "crane"
+    with pytest.raises(IndexError):
+        sample_index[3]
+
+
+def test_round_trip_through_file(tmp_path):
+    path = tmp_path / "words.idx"
+    write_index(["zebra", "adieu"], path=str(path), digest=b"x" * 16)
+    loaded = WordIndex.from_file(str(path))
+    assert loaded.words() == ["adieu", "zebra"]
+    assert loaded.digest == b"x" * 16
+
+
+def test_rejects_foreign_files():
+    with pytest.raises(ValueError):
+        WordIndex(b"NOPE" + b"\0" * 32)
+
+
+def test_load_index_matches_bundled_list():
+    index = load_index()
+    assert index.words() == sorted(word_list)
+    assert load_index() is index
+
+
+def test_load_index_rebuilds_when_stale(tmp_path):
+    path = tmp_path / "words.idx"
+    write_index(["zebra"], path=str(path), digest=b"stale" + b"\0" * 11)
+
+    index = load_index(str(path))
+
+    assert len(index) == len(word_list)
+    assert WordIndex.from_file(str(path)).digest == index_module.source_digest()
+
+
+def test_shuffled_ids_is_a_permutation():
+    rng = random.Random(3)
+    assert sorted(shuffled_ids(100, rng)) == list(range(100))
+    assert sorted(shuffled_ids([5, 7, 9], rng)) == [5, 7, 9]
@@ -0,0 +1,89 @@
+from collections import Counter
+
+import pytest
+
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.letterindex import LetterQueryError, letter_index
+from src.wordle_manager.lexicons import get_lexicon
+from src.wordle_manager.main import main
+
+WORDS = ["stare", "tears", "rates", "crane", "crate", "trace", "geese", "eerie"]
+
+
+@pytest.fixture
+def letters():
+    return letter_index(WordIndex.from_words(WORDS))
+
+
+def test_anagrams(letters):
+    assert letters.anagrams("TEARS") == ["rates", "stare", "tears"]
+    assert letters.anagrams("rate") == []
+    assert letters.anagrams("eeegs") == ["geese"]
+
+
+@pytest.mark.parametrize(
+    "pool, expected",
+    [
+        ("acert", ["crate", "trace"]),
+        ("acenrt", ["crane", "crate", "trace"]),
+        ("egs", []),  # geese needs three e's
+        ("egsee", ["geese"]),
+        ("eeeirr", ["eerie"]),
+    ],
+)
+def test_spellable(letters, pool, expected):
+    assert letters.spellable(pool) == expected
+
+
+def test_neighbors(letters):
+    assert letters.neighbors("crane") == ["crate"]
+    assert letters.neighbors("trate") == ["crate", "trace"]
+    assert letters.neighbors("xxxxx") == []
+
+
+def test_queries_match_scanning_the_list():
+    index = get_lexicon().index
+    words = index.words()
+    letters = letter_index(index)
+    assert letter_index(index) is letters
+
+    for query in ["tears", "lemon", "abbey"]:
+        signature = sorted(query)
+        assert letters.anagrams(query) == [w for w in words if sorted(w) == signature]
+
+    pool = Counter("aelrstpon")
+    assert letters.spellable("aelrstpon") == [
+        w for w in words if not Counter(w) - pool
+    ]
+    assert letters.spellable("abcdefghijklmnopqrstuvwxyz") == [
+        w for w in words if len(set(w)) == len(w)
+    ]
+
+    for word in ["crane", "zzzzz"]:
+        assert letters.neighbors(word) == [
+            w for w in words if sum(a != b for a, b in zip(w, word)) == 1
+        ]
+
+
+@pytest.mark.parametrize("query", ["", "ab1"])
+def test_rejects_non_letters(letters, query):
+    with pytest.raises(LetterQueryError, match="letters a-z"):
+        letters.anagrams(query)
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["anagrams", "reast"], "Anagrams of 'reast' (6): ['aster', 'earst'"),
+        (["spellable", "aceeklrt"], "Words spelled from 'aceeklrt' ("),
+        (["neighbors", "crane"], "Neighbors of 'crane' (3): ['crank', 'crate'"),
+        (["anagrams", "a-b"], "Error: anagrams takes letters a-z, got 'a-b'"),
+    ],
+)
+def test_lookup_commands(monkeypatch, capsys, argv, expected):
+    monkeypatch.setattr("sys.argv", ["ww", *argv])
+    try:
+        main()
+    except SystemExit as e:
+        assert e.code == 1
+    assert capsys.readouterr().out.startswith(expected)
@@ -0,0 +1,85 @@
+import pytest
+
+from src.wordle_manager import lexicons
+from src.wordle_manager.lexicons import (
+    BUNDLED,
+    LexiconNotFoundError,
+    get_lexicon,
+    list_lexicons,
+)
+from src.wordle_manager.main import main, run
+from src.wordle_manager.utils import WordListManager
+
+
+@pytest.fixture
+def lexicon_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("WW_LEXICON_DIR", str(tmp_path))
+    monkeypatch.setattr(lexicons, "_lexicons", {})
+    (tmp_path / "big-6.txt").write_text("planet\nbridge\nsquawk\nmonkey\nabc\n")
+    (tmp_path / "big-7.txt").write_text("example\n")
+    (tmp_path / "kids-4.txt").write_text("frog\ncake\n")
+    return tmp_path
+
+
+def test_default_lexicon_is_bundled(lexicon_dir):
+    assert get_lexicon() is BUNDLED
+    assert get_lexicon("default", 5) is BUNDLED
+
+
+def test_list_lexicons_reads_file_names_only(lexicon_dir):
+    assert list_lexicons() == [
+        ("big", 6),
+        ("big", 7),
+        ("default", 5),
+        ("kids", 4),
+    ]
+    assert not list(lexicon_dir.glob("*.idx"))
+
+
+def test_lexicon_index_is_built_lazily_per_length(lexicon_dir):
+    six = get_lexicon("big", 6)
+    assert not (lexicon_dir / "big-6.idx").exists()
+
+    assert six.index.words() == ["bridge", "monkey", "planet", "squawk"]
+    assert six.index.width == 6
+    assert (lexicon_dir / "big-6.idx").exists()
+    assert not (lexicon_dir / "big-7.idx").exists()
+
+
+def test_single_length_is_inferred(lexicon_dir):
+    assert get_lexicon("kids").length == 4
+
+
+def test_ambiguous_or_missing_lexicon(lexicon_dir):
+    with pytest.raises(LexiconNotFoundError, match="several word lengths"):
+        get_lexicon("big")
+    with pytest.raises(LexiconNotFoundError):
+        get_lexicon("missing", 6)
+
+
+def test_run_selects_from_lexicon(lexicon_dir, capsys):
+    run(2, lexicon="kids")
+    output = capsys.readouterr().out
+    assert "'frog'" in output or "'cake'" in output
+
+
+def test_manager_validates_lexicon_length(lexicon_dir):
+    manager = WordListManager(lexicon="big", length=6, save_on_change=False)
+    manager.remove_invalid_words()
+    assert manager.word_list == ["planet", "bridge", "squawk", "monkey"]
+
+
+def test_manager_appends_to_lexicon_file(lexicon_dir):
+    with WordListManager(lexicon="kids") as manager:
+        manager.add_word("lamb")
+    assert (lexicon_dir / "kids-4.txt").read_text() == "frog\ncake\nlamb\n"
+
+
+def test_main_reports_unknown_lexicon(lexicon_dir, monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["ww", "--lexicon", "missing"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 1
+    assert "Error: No 5-letter lexicon named 'missing'" in capsys.readouterr().out
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.wordle_manager import words
-from src.wordle_manager.main import main
+from src.wordle_manager.main import main, run_exhaustive
 from src.wordle_manager.utils import WordListManager, has_repeating_letters
 
 
@@ -34,7 +34,7 @@ def mock_word_list_manager():
 
 @pytest.fixture
 def mock_parse_args():
-    mock_args = MagicMock()
+    mock_args = MagicMock(lexicon=None, length=None)
     return mock_args
 
 
@@ -46,7 +46,12 @@ def mock_parse_args():
             "run",
             lambda: None,  # No additional setup needed
             lambda mock_run, mock_manager: mock_run.assert_called_once_with(
-                5, unique_letters=False
+                5,
+                unique_letters=False,
+                lexicon=None,
+                length=None,
+                seed=None,
+                constraints=None,
             ),
             id="run_with_number",
         ),
@@ -65,6 +70,18 @@ def mock_parse_args():
             mock_manager: mock_manager.find_scarce_letters.assert_called_once_with(5),
             id="find_scarce_action",
         ),
+        pytest.param(
+            ["script_name", "freq", "--top", "3"],
+            "freq",
+            lambda: MagicMock(
+                action="freq", top=3, bottom=None, by=None, position=None, json=False
+            ),
+            lambda mock_run,
+            mock_manager: mock_manager.show_frequency.assert_called_once_with(
+                top=3, bottom=None, by=None, position=None
+            ),
+            id="freq_action",
+        ),
         pytest.param(
             ["script_name", "dedup"],
             "dedup",
@@ -103,7 +120,7 @@ def test_main_actions(
             "src.wordle_manager.main.parse_args", lambda: mock_parse_args_result
         )
         monkeypatch.setattr(
-            "src.wordle_manager.main.WordListManager", lambda: mock_word_list_manager
+            "src.wordle_manager.main.WordListManager", lambda **kwargs: mock_word_list_manager
         )
     else:
         # For "run" action, mock the run function
@@ -139,7 +156,7 @@ def test_main_clean_action(
     mock_parse_args.action = "clean"
     monkeypatch.setattr("src.wordle_manager.main.parse_args", lambda: mock_parse_args)
     monkeypatch.setattr(
-        "src.wordle_manager.main.WordListManager", lambda: mock_word_list_manager
+        "src.wordle_manager.main.WordListManager", lambda **kwargs: mock_word_list_manager
     )
     # Ensure sys.argv doesn't trigger the run() branch
     monkeypatch.setattr("sys.argv", ["script", "clean"])
@@ -169,7 +186,14 @@ def test_main_unique_letters_flag(monkeypatch):
 
     main()
 
-    mock_run.assert_called_once_with(3, unique_letters=True)
+    mock_run.assert_called_once_with(
+        3,
+        unique_letters=True,
+        lexicon=None,
+        length=None,
+        seed=None,
+        constraints=None,
+    )
 
 
 def test_main_numeric_arg_with_unique_letters_flag(monkeypatch):
@@ -179,7 +203,64 @@ def test_main_numeric_arg_with_unique_letters_flag(monkeypatch):
 
     main()
 
-    mock_run.assert_called_once_with(2, unique_letters=True)
+    mock_run.assert_called_once_with(
+        2,
+        unique_letters=True,
+        lexicon=None,
+        length=None,
+        seed=None,
+        constraints=None,
+    )
+
+
+def test_main_import_from_file(tmp_path, mock_word_list_manager, monkeypatch):
+    word_file = tmp_path / "new_words.txt"
+    word_file.write_text("adieu\ntough\n")
+    monkeypatch.setattr(
+        "src.wordle_manager.main.WordListManager", lambda **kwargs: mock_word_list_manager
+    )
+    monkeypatch.setattr("sys.argv", ["script_name", "import", str(word_file)])
+
+    main()
+
+    (stream,), _ = mock_word_list_manager.import_words.call_args
+    assert stream.name == str(word_file)
+
+
+def test_main_import_from_stdin(mock_word_list_manager, monkeypatch):
+    monkeypatch.setattr(
+        "src.wordle_manager.main.WordListManager", lambda **kwargs: mock_word_list_manager
+    )
+    monkeypatch.setattr("sys.stdin", ["adieu\n"])
+    monkeypatch.setattr("sys.argv", ["script_name", "import", "-"])
+
+    main()
+
+    mock_word_list_manager.import_words.assert_called_once_with(["adieu\n"])
+
+
+def test_main_exhaustive_flag(monkeypatch):
+    mock_run_exhaustive = MagicMock()
+    monkeypatch.setattr("src.wordle_manager.main.run_exhaustive", mock_run_exhaustive)
+    monkeypatch.setattr("sys.argv", ["script_name", "4", "--exhaustive"])
+
+    main()
+
+    mock_run_exhaustive.assert_called_once_with(
+        4,
+        unique_letters=False,
+        lexicon=None,
+        length=None,
+        seed=None,
+        constraints=None,
+    )
+
+
+def test_run_exhaustive_reports_impossible_set(capsys):
+    run_exhaustive(6, unique_letters=True)
+
+    captured = capsys.readouterr()
+    assert "No set of 6 words" in captured.out
 
 
 @pytest.mark.parametrize(
@@ -197,3 +278,22 @@ def test_main_numeric_arg_with_unique_letters_flag(monkeypatch):
 def test_has_repeating_letters(word, expected):
     assert has_repeating_letters(word) is expected
     assert has_repeating_letters("spicy") is False
+
+
+def test_main_optimize_flag(monkeypatch):
+    mock_run_optimized = MagicMock()
+    monkeypatch.setattr("src.wordle_manager.main.run_optimized", mock_run_optimized)
+    monkeypatch.setattr(
+        "sys.argv", ["script_name", "4", "--optimize", "--max-overlap", "1"]
+    )
+
+    main()
+
+    mock_run_optimized.assert_called_once_with(
+        4,
+        unique_letters=False,
+        lexicon=None,
+        length=None,
+        budget=50,
+        max_overlap=1,
+    )
@@ -0,0 +1,130 @@
+import re
+
+import pytest
+
+from src.wordle_manager.bench import synthetic_words
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.lexicons import get_lexicon
+from src.wordle_manager.main import main
+from src.wordle_manager.match import (
+    Dawg,
+    Pattern,
+    PatternError,
+    match_words,
+    word_dawg,
+)
+
+WORDS = ["arise", "arced", "being", "crane", "crate", "skies", "sting", "trace"]
+
+
+@pytest.fixture
+def index():
+    return WordIndex.from_words(WORDS)
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("cra?e", ["crane", "crate"]),
+        ("C_A.E", ["crane", "crate"]),
+        ("[^st]r???", ["arced", "arise", "crane", "crate"]),
+        ("[a-c]????", ["arced", "arise", "being", "crane", "crate"]),
+        ("????", []),
+        ("zzzzz", []),
+    ],
+)
+def test_wildcard_patterns(index, pattern, expected):
+    assert match_words(index, pattern) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        (".*ing", ["being", "sting"]),
+        ("^(cr|tr).*$", ["crane", "crate", "trace"]),
+        ("a.*e", ["arise"]),
+        ("[a-z]+(ed|es)", ["arced", "skies"]),
+        ("s(k|t)i(es|ng)", ["skies", "sting"]),
+        (r"\w{3}", []),
+        ("(.)\\1...", []),  # backreferences fall back to re
+    ],
+)
+def test_regex_patterns(index, pattern, expected):
+    assert match_words(index, pattern) == expected
+
+
+def test_regex_flag_reads_wildcards_as_regex(index):
+    assert match_words(index, "?rane") == ["crane"]
+    with pytest.raises(PatternError, match="Invalid pattern"):
+        match_words(index, "?rane", regex=True)
+
+
+@pytest.mark.parametrize("pattern", ["(", "cr[a", "[z-a]..."])
+def test_invalid_patterns(index, pattern):
+    with pytest.raises(PatternError):
+        match_words(index, pattern)
+
+
+def test_pattern_plans():
+    assert Pattern("a?e??").positions is not None
+    assert Pattern("[aeiou]{2}...").positions is not None
+    assert Pattern(".*ing").positions is None
+    assert Pattern("(?=a)....").fallback is not None
+    backward = Pattern(".*ing").reversed()
+    assert backward.matches("gni") and backward.matches("gnieb")
+    assert not backward.matches("ing")
+
+
+def test_dawg_shares_suffixes():
+    dawg = Dawg(["bat", "cat", "rat"])
+    assert dawg.word_count == 3
+    assert len(dawg) == 4  # b, c and r share one "at" tail
+    assert dawg.match(Pattern("?at")) == ["bat", "cat", "rat"]
+
+
+def test_dawgs_are_built_once_per_index(index):
+    assert word_dawg(index) is word_dawg(index)
+    assert word_dawg(index, reverse=True) is not word_dawg(index)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "a?e??",
+        "[^st]r...",
+        "????s",
+        "(re|un).*",
+        ".*(ing|ed)",
+        "a.*e",
+        "[aeiou]{2}...",
+        r"\w{5}",
+        "b(a|e|i)+.{0,2}",
+        "[^aeiou]{5}",
+    ],
+)
+@pytest.mark.parametrize("words", ["lexicon", "synthetic"])
+def test_matches_scanning_with_re(pattern, words):
+    if words == "lexicon":
+        index = get_lexicon().index
+    else:
+        index = WordIndex.from_words(synthetic_words(5000))
+    regex = re.compile(pattern.replace("?", ".") if "{" not in pattern else pattern)
+    expected = [w for w in index.words() if regex.fullmatch(w)]
+    assert match_words(index, pattern) == expected
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["match", "a?e??"], "Matches for 'a?e??' (9): ['adept', 'agent'"),
+        (["match", "--regex", "qu.*ck"], "Matches for 'qu.*ck' ("),
+        (["match", "(ab"], "Error: Invalid pattern '(ab'"),
+    ],
+)
+def test_match_command(monkeypatch, capsys, argv, expected):
+    monkeypatch.setattr("sys.argv", ["ww", *argv])
+    try:
+        main()
+    except SystemExit as e:
+        assert e.code == 1
+    assert capsys.readouterr().out.startswith(expected)
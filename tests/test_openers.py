@@ -0,0 +1,102 @@
+from collections import Counter
+from math import log2
+
+import pytest
+
+from src.wordle_manager import openers
+from src.wordle_manager.lexicons import Lexicon
+from src.wordle_manager.openers import (
+    best_openers,
+    entropy,
+    numpy_entropies,
+    parallel_entropies,
+    rank_openers,
+    row_entropies,
+)
+from src.wordle_manager.solver import (
+    load_pattern_table,
+    pattern_table_path,
+    score,
+)
+from src.wordle_manager.storage import TextStorage
+
+SAMPLE_WORDS = ["abbey", "apple", "crane", "eerie", "geese", "kebab", "llama", "speed"]
+
+
+@pytest.fixture
+def lexicon(tmp_path, monkeypatch):
+    monkeypatch.setenv("WW_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "sample-5.txt"
+    path.write_text("\n".join(SAMPLE_WORDS) + "\n")
+    return Lexicon("sample", 5, TextStorage(str(path)), str(tmp_path / "sample-5.idx"))
+
+
+def test_entropy_of_even_split():
+    assert entropy([1, 1, 1, 1], 4) == pytest.approx(2.0)
+    assert entropy([4], 4) == 0.0
+    assert entropy([], 0) == 0.0
+    assert entropy([2, 1, 1], 4) == pytest.approx(1.5)
+
+
+def test_pure_python_entropies(lexicon):
+    table = load_pattern_table(lexicon)
+    crane = lexicon.index.position("crane")
+    buckets = Counter(score("crane", answer) for answer in SAMPLE_WORDS)
+    expected = sum(c / 8 * log2(8 / c) for c in buckets.values())
+    assert row_entropies(table, [crane]) == [pytest.approx(expected)]
+
+
+def test_numpy_matches_pure_python(lexicon):
+    pytest.importorskip("numpy")
+    table = load_pattern_table(lexicon)
+    assert numpy_entropies(table) == pytest.approx(
+        row_entropies(table, range(table.count))
+    )
+
+
+def test_parallel_matches_pure_python(lexicon):
+    table = load_pattern_table(lexicon)
+    result = parallel_entropies(table, pattern_table_path(lexicon), jobs=2)
+    assert result == pytest.approx(row_entropies(table, range(table.count)))
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_rank_openers_uses_the_pool_for_many_jobs(lexicon, monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    pools = []
+    real_pool = openers.ProcessPoolExecutor
+
+    def pool(*args, **kwargs):
+        pools.append(args)
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(openers, "PARALLEL_MIN", 0)
+    monkeypatch.setattr(openers, "ProcessPoolExecutor", pool)
+    serial = rank_openers(lexicon, jobs=1, use_numpy=use_numpy)
+    assert pools == []
+    assert rank_openers(lexicon, jobs=2, use_numpy=use_numpy) == serial
+    assert [args[0] for args in pools] == [2]
+
+
+def test_rank_openers_sorted_best_first(lexicon):
+    ranking = rank_openers(lexicon, jobs=1, use_numpy=False)
+    assert sorted(word for word, _ in ranking) == sorted(SAMPLE_WORDS)
+    bits = [b for _, b in ranking]
+    assert bits == sorted(bits, reverse=True)
+
+
+def test_best_openers_are_cached_per_word_list(lexicon, monkeypatch):
+    calls = []
+    real_rank_openers = openers.rank_openers
+    monkeypatch.setattr(
+        openers, "rank_openers", lambda *a: calls.append(a) or real_rank_openers(*a)
+    )
+
+    first = best_openers(lexicon, top=3)
+    assert best_openers(lexicon, top=3) == first
+    assert len(calls) == 1
+
+    lexicon.storage.save(SAMPLE_WORDS + ["zesty"], added=["zesty"])
+    best_openers(lexicon, top=3)
+    assert len(calls) == 2
@@ -0,0 +1,148 @@
+import pytest
+
+from src.wordle_manager import output
+from src.wordle_manager.oplog import LOG_LIMIT, OperationLog, removed_positions
+from src.wordle_manager.store import WordStore
+from src.wordle_manager.utils import WordListManager
+
+WORDS = ["crane", "adieu", "xyz", "crane", "bumpy"]
+
+
+@pytest.fixture(params=[False, True], ids=["list", "store"])
+def manager(request):
+    return WordListManager(
+        word_list=list(WORDS), save_on_change=False, compact=request.param
+    )
+
+
+@pytest.mark.parametrize(
+    "operation, args",
+    [
+        ("remove_duplicates", ()),
+        ("sort_words", ()),
+        ("remove_invalid_words", ()),
+        ("add_word", ("zonal",)),
+        ("import_words", (["quaff adieu", "b4d"],)),
+    ],
+)
+def test_undo_and_redo_every_operation(manager, capsys, operation, args):
+    getattr(manager, operation)(*args)
+    changed = list(manager.word_list)
+
+    assert manager.undo()
+    assert manager.word_list == WORDS
+    assert manager.stats.total == len(WORDS)
+
+    assert manager.redo()
+    assert manager.word_list == changed
+    assert not manager.redo()
+
+
+def test_undo_steps_back_through_history(manager, capsys):
+    manager.add_word("zonal")
+    manager.sort_words()
+    manager.remove_duplicates()
+    for _ in range(3):
+        manager.undo()
+    assert manager.word_list == WORDS
+    assert not manager.undo()
+    assert capsys.readouterr().out.splitlines()[-4:] == [
+        "Undid removal of 1 word",
+        "Undid sort",
+        "Undid add 1 word",
+        "Nothing to undo",
+    ]
+
+
+def test_undo_and_redo_results_as_json(manager, capsys):
+    manager.add_word("zonal")
+    capsys.readouterr()
+    with output.using("ndjson"):
+        manager.undo()
+        manager.undo()
+        manager.redo()
+    assert capsys.readouterr().out.splitlines() == [
+        '{"undone": "add 1 word"}',
+        '{"undone": null}',
+        '{"redone": "add 1 word"}',
+    ]
+
+
+def test_new_change_clears_redo(manager, capsys):
+    manager.add_word("zonal")
+    manager.undo()
+    manager.add_word("quaff")
+    assert not manager.redo()
+    assert list(manager.word_list) == WORDS + ["quaff"]
+
+
+def test_changes_that_change_nothing_are_not_logged(recording_storage, capsys):
+    storage = recording_storage(sorted(set(WORDS)))
+    manager = WordListManager(storage=storage)
+    manager.remove_duplicates()
+    manager.sort_words()
+    assert len(manager.log) == 0
+    assert storage.saves == []
+    assert not manager.undo()
+
+
+def test_session_rolls_back_on_error(manager, capsys):
+    manager.add_word("zonal")
+    with pytest.raises(RuntimeError):
+        with manager:
+            manager.sort_words()
+            manager.add_word("quaff")
+            raise RuntimeError("stop")
+    assert manager.word_list == WORDS + ["zonal"]
+    assert len(manager.log) == 1
+
+
+def test_appends_are_saved_incrementally(recording_storage, capsys):
+    storage = recording_storage(WORDS)
+    manager = WordListManager(storage=storage)
+    manager.add_word("zonal")
+    with manager:
+        manager.add_word("quaff")
+        manager.add_word("fjord")
+    assert storage.saves == [["zonal"], ["quaff", "fjord"]]
+    assert not manager.has_unsaved_changes()
+
+
+def test_other_changes_rewrite_the_list(recording_storage, capsys):
+    storage = recording_storage(WORDS)
+    manager = WordListManager(storage=storage)
+    with manager:
+        manager.add_word("zonal")
+        manager.sort_words()
+    manager.add_word("quaff")
+    manager.undo()  # the saved append is gone, so the file must be rewritten
+    assert storage.saves == [None, ["quaff"], None]
+
+
+def test_undoing_unsaved_changes_leaves_nothing_to_save(recording_storage, capsys):
+    storage = recording_storage(WORDS)
+    manager = WordListManager(storage=storage)
+    with manager:
+        manager.add_word("zonal")
+        manager.undo()
+    assert storage.saves == []
+
+
+def test_log_keeps_recent_operations(capsys):
+    manager = WordListManager.for_testing([])
+    for i in range(LOG_LIMIT + 5):
+        manager.add_word(f"w{i}")
+    assert len(manager.log) == LOG_LIMIT
+
+
+def test_removed_positions():
+    kept = ["crane", "adieu", "bumpy"]
+    assert removed_positions(WORDS, kept) == [(2, "xyz"), (3, "crane")]
+    assert removed_positions(WordStore(WORDS), WORDS) == []
+
+
+def test_empty_log():
+    log = OperationLog()
+    assert log.undo([]) is None
+    assert log.redo([]) is None
+    assert log.pending_additions() == []
@@ -0,0 +1,99 @@
+from itertools import combinations
+
+import pytest
+
+from src.wordle_manager import optimize
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.optimize import (
+    CoverageSearch,
+    letter_weights,
+    optimize_coverage,
+)
+from src.wordle_manager.search import LETTER_BITS, word_mask
+
+SAMPLE_WORDS = [
+    "crane",
+    "bumpy",
+    "sight",
+    "flock",
+    "geese",
+    "dough",
+    "witch",
+    "jumps",
+    "salet",
+    "pride",
+]
+
+
+@pytest.fixture
+def index():
+    return WordIndex.from_words(sorted(SAMPLE_WORDS))
+
+
+def brute_force_score(words, num_words, max_overlap=None):
+    masks = {word_mask(word) for word in words}
+    weights = letter_weights(word_mask(word) for word in words)
+    search = CoverageSearch(masks, weights)
+    best = 0.0
+    for combo in combinations(masks, num_words):
+        covered = overlap = 0
+        for mask in combo:
+            overlap += (mask & covered).bit_count()
+            covered |= mask
+        if max_overlap is None or overlap <= max_overlap:
+            best = max(best, search.weight(covered))
+    return best / search.total
+
+
+def test_letter_weights_are_document_shares():
+    weights = letter_weights([word_mask("geese"), word_mask("crane")])
+    assert weights[LETTER_BITS["e"].bit_length() - 1] == 1.0
+    assert weights[LETTER_BITS["g"].bit_length() - 1] == 0.5
+    assert weights[LETTER_BITS["z"].bit_length() - 1] == 0.0
+
+
+def test_weight_matches_sum_of_letters():
+    weights = [i / 100 for i in range(26)]
+    search = CoverageSearch([], weights)
+    mask = word_mask("quiz") | word_mask("back")
+    expected = sum(weights[i] for i in range(26) if mask >> i & 1)
+    assert search.weight(mask) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("num_words", [1, 2, 3])
+def test_finds_optimal_coverage(index, num_words):
+    coverage = optimize_coverage(index, num_words, budget=5.0)
+    assert coverage.optimal
+    assert len(coverage.words) == num_words
+    assert coverage.score == pytest.approx(brute_force_score(SAMPLE_WORDS, num_words))
+
+
+@pytest.mark.parametrize("max_overlap", [0, 1, 2])
+def test_overlap_limit_is_respected(index, max_overlap):
+    coverage = optimize_coverage(index, 3, budget=5.0, max_overlap=max_overlap)
+    assert coverage.optimal
+    letters = sum(word_mask(word).bit_count() for word in coverage.words)
+    assert letters - coverage.used_mask.bit_count() <= max_overlap
+    assert coverage.score == pytest.approx(
+        brute_force_score(SAMPLE_WORDS, 3, max_overlap)
+    )
+
+
+def test_unique_letters_skips_repeating_words(index):
+    coverage = optimize_coverage(index, 4, unique_letters=True, budget=5.0)
+    assert "geese" not in coverage.words
+    assert all(len(set(word)) == len(word) for word in coverage.words)
+
+
+def test_out_of_time_returns_best_found(index, monkeypatch):
+    monkeypatch.setattr(optimize, "CHECK_EVERY", 1)
+    coverage = optimize_coverage(index, 3, budget=0)
+    assert not coverage.optimal
+    assert len(coverage.words) == 3
+    assert 0 < coverage.score <= 1
+
+
+def test_empty_index():
+    coverage = optimize_coverage(WordIndex.from_words([]), 3)
+    assert coverage.words == ()
+    assert coverage.score == 0.0
@@ -0,0 +1,170 @@
+import json
+
+import pytest
+
+from src.wordle_manager import output
+from src.wordle_manager.main import main
+from src.wordle_manager.match import PatternError
+from src.wordle_manager.utils import WordListManager
+
+
+def run_ww(monkeypatch, capsys, *argv):
+    monkeypatch.setattr("sys.argv", ["ww", *argv])
+    try:
+        main()
+    except SystemExit as e:
+        assert e.code == 1
+    return capsys.readouterr()
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("text", "Removed 2 words\nDone\n"),
+        ("json", '{\n  "removed": 2\n}\n'),
+        ("ndjson", '{"removed": 2}\n'),
+    ],
+)
+def test_result_in_each_format(capsys, name, expected):
+    with output.using(name):
+        output.result({"removed": 2}, "Removed 2 words", "Done")
+    assert capsys.readouterr().out == expected
+    assert output.current() == "text"
+
+
+@pytest.mark.parametrize("items", [[], ["crane", "slate"]])
+def test_records_stream_as_json(capsys, items):
+    with output.using("json"):
+        output.records(
+            "words", iter(items), print, record=lambda w: {"word": w}, fields={"n": 1}
+        )
+    document = json.loads(capsys.readouterr().out)
+    assert document == {"n": 1, "words": [{"word": w} for w in items]}
+
+
+def test_records_as_ndjson_and_text(capsys):
+    with output.using("ndjson"):
+        output.records("words", ["crane", "slate"], print, fields={"n": 1})
+    assert capsys.readouterr().out == '{"n": 1}\n"crane"\n"slate"\n'
+    output.records("words", ["crane"], lambda words: print("Words:", words))
+    assert capsys.readouterr().out == "Words: ['crane']\n"
+
+
+@pytest.mark.parametrize("count", [0, 2])
+def test_records_close_the_document_on_error(monkeypatch, capsys, count):
+    def items():
+        yield from ["crane", "slate"][:count]
+        raise PatternError("bad pattern")
+
+    def dispatch(args, get_manager=None):
+        output.records("words", items(), print, fields={"n": 1})
+
+    monkeypatch.setattr("src.wordle_manager.main.dispatch", dispatch)
+    monkeypatch.setattr("sys.argv", ["ww", "--format", "json", "stats"])
+    with pytest.raises(SystemExit):
+        main()
+    document = json.loads(capsys.readouterr().out)
+    assert document == {
+        "n": 1,
+        "words": ["crane", "slate"][:count],
+        "error": "bad pattern",
+    }
+
+
+def test_records_are_written_as_they_arrive(capsys):
+    seen = []
+
+    def items():
+        for word in ["crane", "slate"]:
+            yield word
+            seen.append(capsys.readouterr().out)
+
+    with output.using("ndjson"):
+        output.records("words", items(), print, flush=True)
+    assert seen == ['"crane"\n', '"slate"\n']
+
+
+def test_notes_and_errors_leave_json_stdout_parseable(capsys):
+    with output.using("json"):
+        output.note("Changes saved automatically")
+        output.error("bad pattern")
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {"error": "bad pattern"}
+    assert captured.err == "Changes saved automatically\n"
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["-n", "2", "--seed", "7"], {"requested": 2, "words": ["fiber", "gloom"]}),
+        (["match", "cra?e"], {"pattern": "cra?e", "count": 3}),
+        (["anagrams", "reast"], {"query": "reast", "count": 6}),
+        (["solve", "crane:ggggg"], {"count": 1, "candidates": [{"word": "crane"}]}),
+        (["find-scarce", "--num", "1"], {"letters": [{"letter": "q", "count": 24}]}),
+        (["match", "("], {"error": "Invalid pattern '(': missing ), "}),
+    ],
+)
+def test_commands_write_json(monkeypatch, capsys, argv, expected):
+    document = json.loads(run_ww(monkeypatch, capsys, "--format", "json", *argv).out)
+    for key, value in expected.items():
+        if key == "error":
+            assert document[key].startswith(value)
+        else:
+            assert document[key] == value
+
+
+def test_commands_write_ndjson(monkeypatch, capsys):
+    out = run_ww(monkeypatch, capsys, "--format", "ndjson", "freq", "--top", "2").out
+    assert [json.loads(line) for line in out.splitlines()] == [
+        {"by": "letters"},
+        {"letter": "e", "count": 1107},
+        {"letter": "a", "count": 915},
+    ]
+    out = run_ww(monkeypatch, capsys, "--format", "ndjson", "freq").out
+    header, *rows = [json.loads(line) for line in out.splitlines()]
+    assert header == {"words": 2000}
+    assert len(rows) == 26
+    assert rows[0] == {
+        "letter": "a",
+        "positions": [174, 283, 275, 130, 53],
+        "total": 915,
+        "words": 847,
+    }
+
+
+@pytest.mark.parametrize("command", ["stats", "freq"])
+def test_json_flag_is_an_alias_for_the_json_format(monkeypatch, capsys, command):
+    flag = run_ww(monkeypatch, capsys, command, "--json").out
+    assert flag == run_ww(monkeypatch, capsys, "--format", "json", command).out
+    assert json.loads(flag)
+    out = run_ww(monkeypatch, capsys, "--format", "ndjson", command, "--json").out
+    assert all(json.loads(line) for line in out.splitlines())
+    assert not out.startswith("{\n")
+
+
+def test_generate_defaults_to_ndjson(monkeypatch, capsys):
+    argv = ["-n", "2", "generate", "--count", "2", "--seed", "1", "--jobs", "1"]
+    lines = run_ww(monkeypatch, capsys, *argv).out.splitlines()
+    assert [json.loads(line)["words"] for line in lines] == [
+        ["algae", "quirk"],
+        ["beset", "quark"],
+    ]
+    text = run_ww(monkeypatch, capsys, "--format", "text", *argv).out
+    assert text == "algae quirk\nbeset quark\n"
+
+
+def test_manager_results_as_json(capsys):
+    manager = WordListManager(
+        word_list=["crane", "crane", "slate"], save_on_change=False
+    )
+    with output.using("ndjson"):
+        manager.remove_duplicates()
+        manager.add_word("crane")
+        manager.remove_invalid_words(dry_run=True, patterns=["s.*"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines == [
+        {"removed": 1, "words": 2},
+        {"word": "crane", "added": False},
+        {"count": 1, "reasons": {"does not match 's.*'": 1}},
+        {"word": "crane", "reason": "does not match 's.*'"},
+    ]
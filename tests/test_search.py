@@ -0,0 +1,86 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from src.wordle_manager.search import (
+    DisjointSearch,
+    find_disjoint_set,
+    find_disjoint_sets,
+    mask_to_letters,
+    word_mask,
+)
+from src.wordle_manager.words import word_list
+
+SAMPLE_WORDS = ["crane", "bumpy", "sight", "flock", "nacre", "dough", "mamma"]
+
+
+def brute_force_sets(word_list, num_words):
+    return {
+        frozenset(combo)
+        for combo in combinations(word_list, num_words)
+        if len(set("".join(combo))) == sum(len(set(word)) for word in combo)
+    }
+
+
+def test_word_mask_round_trip():
+    assert word_mask("apple") == word_mask("pale")
+    assert mask_to_letters(word_mask("crane")) == "acenr"
+
+
+@pytest.mark.parametrize("num_words", [1, 2, 3, 4])
+def test_find_disjoint_sets_matches_brute_force(num_words):
+    found = {frozenset(s) for s in find_disjoint_sets(SAMPLE_WORDS, num_words)}
+    assert found == brute_force_sets(SAMPLE_WORDS, num_words)
+
+
+def test_anagrams_are_expanded():
+    found = list(find_disjoint_sets(["crane", "nacre", "bumpy"], 2))
+    assert sorted(map(sorted, found)) == [["bumpy", "crane"], ["bumpy", "nacre"]]
+
+
+def test_count_matches_enumeration():
+    search = DisjointSearch(SAMPLE_WORDS)
+    assert search.count(3) == len(list(search.iter_sets(3)))
+
+
+def test_unique_letters_excludes_repeats():
+    search = DisjointSearch(SAMPLE_WORDS, unique_letters=True)
+    assert "mamma" not in [w for words in search.words_by_mask.values() for w in words]
+
+
+def test_find_returns_none_when_impossible():
+    assert find_disjoint_set(SAMPLE_WORDS, 6) is None
+    assert find_disjoint_set(word_list, 6, unique_letters=True) is None
+
+
+def test_find_five_words_in_bundled_list():
+    selected = find_disjoint_set(word_list, 5, rng=random.Random(0))
+    assert selected is not None
+    assert len(selected) == 5
+    letters = "".join(selected)
+    assert len(set(letters)) == sum(len(set(word)) for word in selected)
+
+
+def test_find_is_reproducible_with_seeded_rng():
+    first = find_disjoint_set(word_list, 4, rng=random.Random(42))
+    second = find_disjoint_set(word_list, 4, rng=random.Random(42))
+    assert first == second
+
+
+def test_words_with_accented_letters_are_skipped():
+    search = DisjointSearch(["éclat", "crane", "bumpy"])
+    assert sorted(w for words in search.words_by_mask.values() for w in words) == [
+        "bumpy",
+        "crane",
+    ]
+    assert sorted(search.find(2)) == ["bumpy", "crane"]
+
+
+def test_dead_ends_are_shared_between_searches():
+    search = DisjointSearch(word_list, unique_letters=True)
+    dead = set()
+    assert next(search.iter_mask_sets(6, dead=dead), None) is None
+    # The whole search failed, so a second pass stops at the root
+    assert (0, 0, 6) in dead
+    assert search.find(6, rng=random.Random(0)) is None
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from src.wordle_manager import selection as selection_module
+from src.wordle_manager.index import WordIndex
+from src.wordle_manager.selection import Selection, select_words
+
+SAMPLE_WORDS = ["crane", "bumpy", "sight", "flock", "geese", "dough", "witch", "jumps"]
+
+
+@pytest.fixture
+def index():
+    return WordIndex.from_words(sorted(SAMPLE_WORDS))
+
+
+def is_disjoint(words):
+    return len(set("".join(words))) == sum(len(word) for word in words)
+
+
+def test_same_seed_gives_same_selection(index):
+    first = select_words(3, seed=42, index=index)
+    second = select_words(3, seed=42, index=index)
+    assert first == second
+    assert is_disjoint(first.words)
+
+
+def test_random_instance_is_reproducible(index):
+    first = select_words(3, rng=random.Random(5), index=index)
+    second = select_words(3, rng=random.Random(5), index=index)
+    assert first == second
+
+
+def test_seeded_selection_is_cached(index, monkeypatch):
+    calls = []
+    select = selection_module._select
+
+    def counting(*args):
+        calls.append(args)
+        return select(*args)
+
+    monkeypatch.setattr(selection_module, "_cached_selections", {})
+    monkeypatch.setattr(selection_module, "_select", counting)
+    select_words(2, seed=1, index=index)
+    select_words(2, seed=1, index=index)
+    select_words(2, seed=2, index=index)
+    assert len(calls) == 2
+
+
+def test_cache_tells_in_memory_indexes_apart(monkeypatch):
+    monkeypatch.setattr(selection_module, "_cached_selections", {})
+    first = WordIndex.from_words(["crane", "moist", "plumb"])
+    second = WordIndex.from_words(["beech", "fjord", "gawky"])
+    assert select_words(2, seed=1, index=first, exhaustive=True).words
+    selection = select_words(2, seed=1, index=second, exhaustive=True)
+    assert set(selection.words) <= {"beech", "fjord", "gawky"}
+    assert len(selection_module._cached_selections) == 2
+
+
+def test_unique_letters_skips_repeats(index):
+    for seed in range(20):
+        assert "geese" not in select_words(4, True, seed=seed, index=index).words
+
+
+def test_used_letters_and_coverage():
+    selection = Selection(("crane",), 0, 1)
+    assert selection.used_letters == "_" * 26
+    selection = select_words(1, seed=0, index=WordIndex.from_words(["crane"]))
+    assert selection.words == ("crane",)
+    assert selection.used_letters == "A_C_E________N___R________"
+    assert selection.coverage == 5 / 26
+    assert selection.complete
+
+
+def test_exhaustive_finds_full_set(index):
+    selection = select_words(3, True, seed=3, index=index, exhaustive=True)
+    assert selection.complete
+    assert is_disjoint(selection.words)
+
+
+def test_exhaustive_returns_empty_selection_when_impossible(index):
+    selection = select_words(6, seed=3, index=index, exhaustive=True)
+    assert selection.words == ()
+    assert not selection.complete
+    assert selection.coverage == 0
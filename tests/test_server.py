@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from src.wordle_manager.client import forward, request
+from src.wordle_manager.lexicons import Lexicon
+from src.wordle_manager.main import main, run_command
+from src.wordle_manager.server import Daemon, DaemonError, stop_daemon
+from src.wordle_manager.storage import TextStorage
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets"
+)
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # Unix socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory(prefix="ww") as directory:
+        path = f"{directory}/ww.sock"
+        monkeypatch.setenv("WW_SOCKET", path)
+        yield path
+
+
+@contextlib.contextmanager
+def serving(daemon):
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=asyncio.run, args=(daemon.serve_forever(ready.set),), daemon=True
+    )
+    thread.start()
+    assert ready.wait(5)
+    try:
+        yield daemon
+    finally:
+        stop_daemon(daemon.path)
+        thread.join(5)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    with serving(Daemon(run_command, socket_path)) as daemon:
+        yield daemon
+
+
+def test_answers_commands(daemon):
+    response = forward(["freq", "--top", "1"])
+    assert response["status"] == 0
+    assert response["stdout"].startswith("  E: ")
+    assert request({"command": "ping"})["served"] == 1
+
+
+def test_reports_errors_and_exit_status(daemon):
+    response = forward(["solve", "crane:xxgxq"])
+    assert response["status"] == 1
+    assert "Unknown feedback 'q'" in response["stdout"]
+    assert forward(["--lexicon", "nope", "stats"])["status"] == 1
+    assert forward(["bogus"])["status"] == 2
+
+
+def test_concurrent_clients(daemon):
+    results = []
+
+    def ask():
+        results.append(forward(["3", "--seed", "1"])["stdout"])
+
+    threads = [threading.Thread(target=ask) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert len(results) == 8
+    assert len(set(results)) == 1
+
+
+def test_slow_command_does_not_hold_up_others(socket_path):
+    started, release = threading.Event(), threading.Event()
+
+    def execute(args, get_manager):
+        print(f"{args.action} output")
+        if args.action == "stats":
+            started.set()
+            assert release.wait(5)
+
+    slow = []
+    with serving(Daemon(execute, socket_path)):
+        thread = threading.Thread(target=lambda: slow.append(forward(["stats"])))
+        thread.start()
+        assert started.wait(5)
+        assert request({"command": "ping"}, timeout=2)["served"] == 0
+        assert forward(["freq"])["stdout"] == "freq output\n"
+        release.set()
+        thread.join(5)
+    assert slow[0]["stdout"] == "stats output\n"
+
+
+def test_does_not_serve_changes(daemon):
+    assert forward(["add", "zonky"]) is None
+    assert forward(["dedup"]) is None
+
+
+def test_main_forwards_to_daemon(daemon, monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["ww", "stats"])
+    main()
+    assert "Total words:" in capsys.readouterr().out
+    assert daemon.served == 1
+
+
+def test_main_runs_locally_when_asked(daemon, monkeypatch, capsys):
+    monkeypatch.setenv("WW_NO_DAEMON", "1")
+    monkeypatch.setattr("sys.argv", ["ww", "stats"])
+    main()
+    assert "Total words:" in capsys.readouterr().out
+    assert daemon.served == 0
+
+
+def test_stale_word_list_stops_daemon(daemon, tmp_path, monkeypatch):
+    path = tmp_path / "sample-5.txt"
+    path.write_text("crane\nadieu\n")
+    lexicon = Lexicon("sample", 5, TextStorage(str(path)), str(tmp_path / "s.idx"))
+    monkeypatch.setattr(
+        "src.wordle_manager.server.get_lexicon", lambda *args: lexicon
+    )
+    assert forward(["stats"])["status"] == 0
+
+    path.write_text("crane\nadieu\nbumpy\n")
+    assert forward(["stats"]) is None
+    assert daemon.stale
+
+
+def test_refuses_second_daemon(daemon, socket_path):
+    with pytest.raises(DaemonError, match="already listening"):
+        Daemon(run_command, socket_path).claim_socket()
+
+
+def test_no_daemon(socket_path):
+    assert forward(["stats"]) is None
+    assert not stop_daemon()
+
+
+def test_replaces_socket_left_by_dead_daemon(socket_path):
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.bind(socket_path)  # bound but never listening
+    Daemon(run_command, socket_path).claim_socket()
+    assert not os.path.exists(socket_path)
@@ -0,0 +1,148 @@
+import json
+import os
+
+import pytest
+
+from src.wordle_manager import simulate as simulate_module
+from src.wordle_manager.lexicons import Lexicon
+from src.wordle_manager.main import main
+from src.wordle_manager.simulate import (
+    SimulationResult,
+    best_guess,
+    checkpoint_path,
+    play_tree,
+    simulate,
+)
+from src.wordle_manager.solver import TableSizeError, load_pattern_table, score
+from src.wordle_manager.storage import TextStorage
+
+SAMPLE_WORDS = [
+    "abbey", "apple", "crane", "eerie", "geese", "kebab", "llama", "speed",
+    "tears", "roate", "slate", "crate", "trace", "cater", "react", "blimp",
+]  # fmt: skip
+
+
+@pytest.fixture
+def lexicon(tmp_path, monkeypatch):
+    monkeypatch.setenv("WW_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "sample-5.txt"
+    path.write_text("\n".join(SAMPLE_WORDS) + "\n")
+    return Lexicon("sample", 5, TextStorage(str(path)), str(tmp_path / "sample-5.idx"))
+
+
+def play_one(table, words, answer, openers, max_guesses=6):
+    """Reference game, one answer at a time with score()"""
+    candidates = list(range(len(words)))
+    openers = list(openers)
+    for turn in range(1, max_guesses + 1):
+        if len(candidates) == 1:
+            guess = candidates[0]
+        elif openers:
+            guess = openers.pop(0)
+        else:
+            guess = best_guess(table, candidates)
+        pattern = score(words[guess], answer)
+        if words[guess] == answer:
+            return turn
+        candidates = [j for j in candidates if score(words[guess], words[j]) == pattern]
+    return 0
+
+
+@pytest.mark.parametrize("openers", [["crane"], ["blimp", "tears"], []])
+def test_tree_matches_playing_each_game(lexicon, openers):
+    table = load_pattern_table(lexicon)
+    words = lexicon.index.words()
+    opener_ids = [lexicon.index.position(word) for word in openers]
+    results = play_tree(table, list(range(len(words))), opener_ids)
+    assert sorted(results) == list(range(len(words)))
+    for j, answer in enumerate(words):
+        assert results[j] == play_one(table, words, answer, opener_ids)
+
+
+def test_best_guess_prefers_an_even_split(lexicon):
+    table = load_pattern_table(lexicon)
+    index = lexicon.index
+    ids = [index.position(word) for word in ["crate", "trace", "cater", "react"]]
+    # Every anagram splits the others apart, so the first one wins the tie
+    assert best_guess(table, ids) == ids[0]
+
+
+def test_result_summary():
+    result = SimulationResult.from_guesses("entropy", ["tears"], [1, 3, 3, 4, 0])
+    assert result.games == 5
+    assert result.solved == 4
+    assert result.average == pytest.approx(2.75)
+    assert result.failure_rate == pytest.approx(0.2)
+    assert result.distribution == {1: 1, 2: 0, 3: 2, 4: 1, 5: 0, 6: 0}
+
+
+@pytest.mark.parametrize("strategy", ["random", "coverage", "entropy"])
+def test_simulate_every_strategy(lexicon, strategy):
+    result = simulate(lexicon, strategy, num_words=2, seed=1, jobs=1)
+    assert result.games == len(SAMPLE_WORDS)
+    assert result.failed == 0
+    assert result.openers
+    assert not os.path.exists(checkpoint_path(lexicon, strategy))
+
+
+def test_too_few_guesses_fail(lexicon):
+    result = simulate(lexicon, "entropy", jobs=1, max_guesses=1)
+    assert result.distribution == {1: 1}
+    assert result.failed == len(SAMPLE_WORDS) - 1
+
+
+def test_parallel_matches_serial(lexicon):
+    serial = simulate(lexicon, "random", seed=3, jobs=1)
+    parallel = simulate(lexicon, "random", seed=3, jobs=2)
+    assert parallel == serial
+
+
+def test_interrupted_run_resumes(lexicon, monkeypatch):
+    calls = []
+    original = simulate_module.play_tree
+
+    def counted(*args, interrupt_at=None):
+        calls.append(args[1])
+        if len(calls) == interrupt_at:
+            raise KeyboardInterrupt
+        return original(*args)
+
+    monkeypatch.setattr(simulate_module, "play_tree", counted)
+    full = simulate(lexicon, "coverage", num_words=2, jobs=1)
+    groups = len(calls)
+
+    calls.clear()
+    monkeypatch.setattr(
+        simulate_module, "play_tree", lambda *args: counted(*args, interrupt_at=2)
+    )
+    with pytest.raises(KeyboardInterrupt):
+        simulate(lexicon, "coverage", num_words=2, jobs=1)
+    path = checkpoint_path(lexicon, "coverage")
+    with open(path) as f:
+        header, *finished = map(json.loads, f)
+    assert header["openers"] == list(full.openers)
+    assert finished
+
+    calls.clear()
+    monkeypatch.setattr(simulate_module, "play_tree", counted)
+    assert simulate(lexicon, "coverage", num_words=2, jobs=1) == full
+    assert len(calls) == groups - 1  # the finished group is not replayed
+    assert not os.path.exists(path)
+
+
+def test_large_lexicons_are_refused_up_front(lexicon, monkeypatch):
+    monkeypatch.setenv("WW_MAX_TABLE_WORDS", "10")
+    with pytest.raises(TableSizeError, match="16 words"):
+        simulate(lexicon, "entropy", jobs=1)
+    assert not os.path.exists(checkpoint_path(lexicon, "entropy"))
+
+
+def test_simulate_command(lexicon, monkeypatch, capsys):
+    monkeypatch.setattr("src.wordle_manager.main.get_lexicon", lambda *_: lexicon)
+    argv = ["ww", "-n", "2", "simulate", "--strategy", "random", "--seed", "2"]
+    monkeypatch.setattr("sys.argv", argv)
+    main()
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].startswith("Strategy: random (openers: ")
+    assert output[1] == f"  Games:           {len(SAMPLE_WORDS)}"
+    assert output[-1].startswith("    X:       0    0.0%")
@@ -0,0 +1,148 @@
+from itertools import product
+
+import pytest
+
+from src.wordle_manager.lexicons import Lexicon
+from src.wordle_manager.main import main
+from src.wordle_manager.solver import (
+    FeedbackError,
+    PatternRows,
+    PatternTable,
+    Solver,
+    TableSizeError,
+    build_pattern_table,
+    decode_pattern,
+    encode_feedback,
+    load_pattern_table,
+    parse_guess,
+    pattern_table_path,
+    score,
+    solve,
+)
+from src.wordle_manager.storage import TextStorage
+
+SAMPLE_WORDS = ["abbey", "apple", "crane", "eerie", "geese", "kebab", "llama", "speed"]
+
+
+@pytest.fixture
+def lexicon(tmp_path, monkeypatch):
+    monkeypatch.setenv("WW_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "sample-5.txt"
+    path.write_text("\n".join(SAMPLE_WORDS) + "\n")
+    return Lexicon("sample", 5, TextStorage(str(path)), str(tmp_path / "sample-5.idx"))
+
+
+@pytest.mark.parametrize(
+    "guess, answer, feedback",
+    [
+        ("crane", "crane", "ggggg"),
+        ("crane", "nacre", "yyyyg"),
+        ("speed", "abide", "xxyxy"),
+        ("speed", "erase", "yxyyx"),
+        ("geese", "eerie", "xgyxg"),
+        ("eerie", "geese", "ygxxg"),
+        ("llama", "apple", "yxyxx"),
+        ("kebab", "abbey", "xygyy"),
+    ],
+)
+def test_score_matches_wordle_rules(guess, answer, feedback):
+    assert decode_pattern(score(guess, answer), 5) == feedback
+
+
+def test_pattern_rows_match_pairwise_scores():
+    rows = PatternRows(SAMPLE_WORDS, 5)
+    for guess in SAMPLE_WORDS + ["eeeee", "zzzzz"]:
+        row = rows.row(guess)
+        assert list(row) == [score(guess, answer) for answer in SAMPLE_WORDS]
+
+
+def test_wide_words_use_wider_cells():
+    words = ["abcdefghij", "jihgfedcba"]
+    table = PatternTable(build_pattern_table(words, 10, b"\0" * 16))
+    assert table.pattern(0, 1) == score("abcdefghij", "jihgfedcba")
+    assert table.pattern(1, 1) == 3**10 - 1
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("crane:gyxxx", ("crane", 2 + 3)), ("CRANE=2.1-0", ("crane", 2 + 9))],
+)
+def test_parse_guess(text, expected):
+    assert parse_guess(text, 5) == expected
+
+
+@pytest.mark.parametrize("text", ["crane", "crane:gyx", "crane:gyxxz"])
+def test_parse_guess_rejects_bad_input(text):
+    with pytest.raises(FeedbackError):
+        parse_guess(text, 5)
+
+
+def test_encode_round_trip():
+    for digits in product("xyg", repeat=3):
+        text = "".join(digits)
+        assert decode_pattern(encode_feedback(text), 3) == text
+
+
+def test_table_is_cached_and_memory_mapped(lexicon):
+    table = load_pattern_table(lexicon)
+    path = pattern_table_path(lexicon)
+    cached = load_pattern_table(lexicon, rebuild=False)
+
+    assert cached is not None
+    assert cached.digest == table.digest
+    words = lexicon.index.words()
+    for g, guess in enumerate(words):
+        assert list(cached.row(g)) == [score(guess, answer) for answer in words]
+    assert path.endswith("sample-5.patterns")
+
+
+def test_table_is_rebuilt_when_list_changes(lexicon):
+    load_pattern_table(lexicon)
+    lexicon.storage.save(SAMPLE_WORDS + ["zesty"], added=["zesty"])
+    assert load_pattern_table(lexicon, rebuild=False) is None
+    assert load_pattern_table(lexicon).count == len(SAMPLE_WORDS) + 1
+
+
+def test_solver_filters_candidates(lexicon):
+    solver = Solver(lexicon.index, load_pattern_table(lexicon))
+    solver.apply("eerie", encode_feedback("ygxxg"))
+    assert solver.remaining() == ["geese"]
+
+
+def test_solve_accepts_guesses_outside_the_list(lexicon):
+    assert solve(lexicon, [("zzzzz", 0), ("aeiou", score("aeiou", "speed"))]) == [
+        "speed"
+    ]
+
+
+def test_large_tables_are_refused(lexicon, monkeypatch, capsys):
+    monkeypatch.setenv("WW_MAX_TABLE_WORDS", "5")
+    with pytest.raises(TableSizeError, match="for 8 words would take 0 MB"):
+        load_pattern_table(lexicon)
+    # solve scores the guesses itself instead
+    assert solve(lexicon, [("eerie", encode_feedback("ygxxg"))]) == ["geese"]
+
+    monkeypatch.setattr("src.wordle_manager.main.get_lexicon", lambda *a: lexicon)
+    monkeypatch.setattr("sys.argv", ["ww", "best-openers", "--no-cache"])
+    with pytest.raises(SystemExit):
+        main()
+    assert capsys.readouterr().out.startswith("Error: A pattern table for 8 words")
+
+
+def test_main_solve(lexicon, monkeypatch, capsys):
+    monkeypatch.setattr("src.wordle_manager.main.get_lexicon", lambda *a: lexicon)
+    monkeypatch.setattr("sys.argv", ["ww", "solve", "crane:xxyxy", "apple:gxxxy"])
+
+    main()
+
+    assert "Remaining candidates (1): ['abbey']" in capsys.readouterr().out
+
+
+def test_main_solve_bad_feedback_exits(lexicon, monkeypatch, capsys):
+    monkeypatch.setattr("src.wordle_manager.main.get_lexicon", lambda *a: lexicon)
+    monkeypatch.setattr("sys.argv", ["ww", "solve", "crane:oops!"])
+
+    with pytest.raises(SystemExit):
+        main()
+
+    assert "Error: Unknown feedback" in capsys.readouterr().out
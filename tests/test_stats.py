@@ -0,0 +1,103 @@
+import json
+from collections import Counter
+
+import pytest
+
+from src.wordle_manager import output
+from src.wordle_manager.stats import WordStats
+from src.wordle_manager.storage import TextStorage
+from src.wordle_manager.utils import WordListManager
+
+
+def fresh(word_list):
+    return WordStats.from_words(word_list).to_dict()
+
+
+def test_counts_and_histograms():
+    stats = WordStats.from_words(["crane", "adieu", "crane"])
+    assert (stats.total, stats.unique, stats.duplicates) == (3, 2, 1)
+    assert not stats.is_sorted
+    assert stats.positions[0] == Counter({"c": 2, "a": 1})
+    assert stats.letter_counts()["e"] == 3
+
+
+def test_empty_list():
+    stats = WordStats()
+    assert stats.to_dict() == {
+        "total": 0,
+        "unique": 0,
+        "duplicates": 0,
+        "sorted": True,
+        "letters": {},
+        "positions": [],
+    }
+
+
+@pytest.mark.parametrize(
+    "operation, args",
+    [
+        ("remove_duplicates", ()),
+        ("sort_words", ()),
+        ("remove_invalid_words", ()),
+        ("add_word", ("zonal",)),
+        ("import_words", (["quaff adieu", "b4d"],)),
+    ],
+)
+def test_manager_keeps_stats_current(capsys, operation, args):
+    manager = WordListManager.for_testing(["crane", "adieu", "xyz", "crane", "bumpy"])
+    manager.stats  # build before the change so it has to be updated in place
+    built = manager._stats
+
+    getattr(manager, operation)(*args)
+
+    assert manager._stats is built
+    assert manager.stats.to_dict() == fresh(manager.word_list)
+
+
+def test_remove_from_sorted_list_stays_sorted(capsys):
+    manager = WordListManager.for_testing(["adieu", "adieu", "crane"])
+    assert manager.stats.is_sorted
+    manager.remove_duplicates()
+    assert manager.stats.is_sorted
+
+
+def test_direct_edits_rebuild_stats():
+    manager = WordListManager.for_testing(["crane"])
+    assert manager.stats.total == 1
+    manager.word_list.append("adieu")
+    assert manager.stats.total == 2
+    manager.word_list = ["bumpy"]
+    assert manager.stats.to_dict() == fresh(["bumpy"])
+
+
+def test_show_stats_json(capsys):
+    manager = WordListManager.for_testing(["adieu", "crane"])
+    with output.using("json"):
+        manager.show_stats()
+    report = json.loads(capsys.readouterr().out)
+    assert report["total"] == 2
+    assert report["sorted"] is True
+    assert report["positions"][0] == {"a": 1, "c": 1}
+
+
+def test_stats_carry_over_between_runs(tmp_path, monkeypatch, capsys):
+    storage = TextStorage(str(tmp_path / "words.txt"))
+    storage.save(["crane", "adieu", "crane"])
+    first = WordListManager(storage=storage).stats.to_dict()
+    assert first == fresh(["crane", "adieu", "crane"])
+    longer = fresh(["crane", "adieu", "crane", "bumpy", "zonal"])
+
+    def rescan(word_list):
+        raise AssertionError("statistics were gathered again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(WordStats, "from_words", rescan)
+        manager = WordListManager(storage=storage)
+        assert manager.stats.to_dict() == first
+
+    # Restored statistics are rebuilt for a change, then saved with the list
+    manager.add_word("bumpy")
+    manager.stats
+    manager.add_word("zonal")
+    monkeypatch.setattr(WordStats, "from_words", rescan)
+    assert WordListManager(storage=storage).stats.to_dict() == longer
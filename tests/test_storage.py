@@ -0,0 +1,160 @@
+import pytest
+
+from src.wordle_manager.history import history_dir
+from src.wordle_manager.lexicons import lexicon_dir
+from src.wordle_manager.storage import (
+    JournalStorage,
+    ModuleStorage,
+    TextStorage,
+    atomic_write,
+    format_module,
+)
+from src.wordle_manager.utils import WordListManager
+
+
+@pytest.fixture
+def words_file(tmp_path):
+    path = tmp_path / "words.py"
+    path.write_text(format_module(["crane", "slate"]))
+    return path
+
+
+@pytest.fixture
+def journal(words_file, tmp_path):
+    return JournalStorage(
+        words_file=str(words_file), journal_file=str(tmp_path / "words.journal")
+    )
+
+
+def test_format_module_is_importable(tmp_path):
+    source = format_module([f"w{i:04d}" for i in range(25)])
+    namespace = {}
+    exec(source, namespace)
+    assert namespace["word_list"] == [f"w{i:04d}" for i in range(25)]
+
+
+def test_atomic_write_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "data.txt"
+    atomic_write(str(path), "first")
+    atomic_write(str(path), "second")
+    assert path.read_text() == "second"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.txt"]
+
+
+def test_atomic_write_cleans_up_after_a_failed_rename(tmp_path, monkeypatch):
+    path = tmp_path / "data.txt"
+    atomic_write(str(path), "first")
+    path.chmod(0o640)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patched:
+        patched.setattr("os.replace", fail)
+        with pytest.raises(OSError, match="disk full"):
+            atomic_write(str(path), "second")
+    assert [p.name for p in tmp_path.iterdir()] == ["data.txt"]
+    atomic_write(str(path), "third")
+    assert path.read_text() == "third"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_module_storage_round_trip(words_file):
+    storage = ModuleStorage(str(words_file))
+    storage.save(["adieu", "crane"])
+    assert storage.load() == ["adieu", "crane"]
+
+
+def test_journal_appends_without_rewriting_module(journal, words_file):
+    before = words_file.read_text()
+    journal.save(["crane", "slate", "adieu"], added=["adieu"])
+    journal.save(["crane", "slate", "adieu", "tough"], added=["tough"])
+
+    assert words_file.read_text() == before
+    assert journal.read_journal() == ["adieu", "tough"]
+    assert journal.load() == ["crane", "slate", "adieu", "tough"]
+
+
+def test_stream_yields_the_loaded_words(journal, tmp_path):
+    journal.save(["crane", "slate", "adieu"], added=["adieu"])
+    assert list(journal.stream()) == ["crane", "slate", "adieu"]
+    text = tmp_path / "words.txt"
+    text.write_text("crane slate\nadieu\n")
+    assert list(TextStorage(str(text)).stream()) == ["crane", "slate", "adieu"]
+
+
+def test_journal_ignores_torn_last_record(journal, tmp_path):
+    journal.save(["crane", "slate", "adieu"], added=["adieu"])
+    with open(journal.journal_file, "a") as f:
+        f.write("+tou")
+    assert journal.read_journal() == ["adieu"]
+
+    journal.save(["crane", "slate", "adieu", "tough"], added=["tough"])
+    assert journal.read_journal() == ["adieu", "tough"]
+
+
+def test_compaction_folds_journal_into_module(journal, tmp_path):
+    journal.compact_every = 3
+    journal.save(["crane", "slate", "adieu"], added=["adieu"])
+    journal.save(["crane", "slate", "adieu", "tough", "pinky"], added=["tough", "pinky"])
+
+    assert not (tmp_path / "words.journal").exists()
+    assert ModuleStorage(journal.words_file).load() == [
+        "crane",
+        "slate",
+        "adieu",
+        "tough",
+        "pinky",
+    ]
+
+
+def test_stale_journal_is_not_replayed(journal, words_file):
+    journal.save(["crane", "slate", "adieu"], added=["adieu"])
+    # Simulate a crash after the module was rewritten but before the
+    # journal was removed
+    words_file.write_text(format_module(["adieu", "crane", "slate"]))
+    assert journal.read_journal() == []
+
+
+def test_digest_changes_with_journal(journal):
+    before = journal.digest()
+    journal.save(["crane", "slate", "adieu"], added=["adieu"])
+    assert journal.digest() != before
+
+
+def test_lexicons_and_history_share_the_data_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    monkeypatch.delenv("WW_LEXICON_DIR", raising=False)
+    monkeypatch.delenv("WW_HISTORY_DIR")
+    assert lexicon_dir() == str(tmp_path / "wordle-words" / "lexicons")
+    assert history_dir() == str(tmp_path / "wordle-words" / "history")
+
+
+class TestManagerBatching:
+    def test_session_saves_once_on_exit(self, recording_storage):
+        storage = recording_storage(["crane"])
+        with WordListManager(storage=storage) as manager:
+            manager.add_word("adieu")
+            manager.add_word("tough")
+            assert storage.saves == []
+        assert storage.saves == [["adieu", "tough"]]
+
+    def test_rewrite_operations_save_full_list(self, recording_storage):
+        storage = recording_storage(["slate", "crane"])
+        with WordListManager(storage=storage) as manager:
+            manager.add_word("adieu")
+            manager.sort_words()
+        assert storage.saves == [None]
+
+    def test_saves_immediately_outside_session(self, recording_storage):
+        storage = recording_storage(["crane"])
+        manager = WordListManager(storage=storage)
+        manager.add_word("adieu")
+        manager.add_word("tough")
+        assert storage.saves == [["adieu"], ["tough"]]
+
+    def test_unchanged_session_does_not_save(self, recording_storage):
+        storage = recording_storage(["crane"])
+        with WordListManager(storage=storage) as manager:
+            manager.add_word("crane")
+        assert storage.saves == []
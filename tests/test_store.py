@@ -0,0 +1,155 @@
+import random
+import tracemalloc
+
+import pytest
+
+from src.wordle_manager import store as store_module
+from src.wordle_manager import utils
+from src.wordle_manager.bench import synthetic_words
+from src.wordle_manager.storage import TextStorage
+from src.wordle_manager.store import WordStore
+from src.wordle_manager.utils import WordListManager
+
+WORDS = ["crane", "adieu", "xyz", "crane", "bumpy", "naïve", "adieu"]
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    # Exercise the batch boundaries with a handful of words
+    monkeypatch.setattr(store_module, "BATCH", 3)
+
+
+def test_reads_like_a_list():
+    store = WordStore(WORDS)
+    assert len(store) == len(WORDS)
+    assert store == WORDS
+    assert list(store) == WORDS
+    assert store[0] == "crane"
+    assert store[-1] == "adieu"
+    assert store[2] == "xyz"
+    assert store[5] == "naïve"
+    assert store[1:4] == WORDS[1:4]
+    assert store[::2] == WORDS[::2]
+    with pytest.raises(IndexError):
+        store[len(WORDS)]
+
+
+def test_records_are_fixed_width():
+    store = WordStore(["ab", "abcd"])
+    assert store.width == 4
+    assert store.nbytes == 8
+    store.append("abcdef")
+    assert store.width == 6
+    assert list(store) == ["ab", "abcd", "abcdef"]
+
+
+@pytest.mark.parametrize("words", [sorted(set(WORDS)), WORDS])
+def test_membership(words):
+    store = WordStore(words)
+    for word in WORDS:
+        assert word in store
+    assert "zebra" not in store
+    assert "toolongword" not in store
+    assert 5 not in store
+
+
+def test_appends_keep_membership_index_current():
+    store = WordStore(["zonal", "crane"])
+    assert "crane" in store  # builds the index of the unsorted records
+    store.append("bumpy")
+    store.append("adieu")
+    assert all(word in store for word in ["zonal", "crane", "bumpy", "adieu"])
+    assert "quick" not in store
+
+
+def test_sort_in_place():
+    store = WordStore(WORDS)
+    store.sort()
+    assert list(store) == sorted(WORDS)
+    assert "bumpy" in store
+
+
+@pytest.mark.parametrize("presort", [False, True])
+def test_dedup_keeps_first_occurrences(presort):
+    words = sorted(WORDS) if presort else WORDS
+    store = WordStore(words)
+    removed = store.dedup()
+    assert list(store) == list(dict.fromkeys(words))
+    assert sorted(word for _, word in removed) == ["adieu", "crane"]
+    assert all(words[i] == word for i, word in removed)
+
+
+def test_delete_trailing_words():
+    store = WordStore(WORDS)
+    del store[4:]
+    assert store == WORDS[:4]
+    with pytest.raises(TypeError):
+        del store[1:2]
+
+
+def test_replace_every_word():
+    store = WordStore(WORDS)
+    store[:] = ["bumpy", "adieu"]
+    assert store == ["bumpy", "adieu"]
+    with pytest.raises(TypeError):
+        store[0] = "crane"
+
+
+def test_copy_is_independent():
+    store = WordStore(WORDS)
+    copy = store.copy()
+    copy.append("zonal")
+    assert "zonal" not in store
+    assert copy == WORDS + ["zonal"]
+
+
+@pytest.mark.parametrize(
+    "operation, args",
+    [
+        ("remove_duplicates", ()),
+        ("sort_words", ()),
+        ("remove_invalid_words", ()),
+        ("add_word", ("zonal",)),
+        ("add_word", ("crane",)),
+        ("import_words", (["quaff adieu", "b4d"],)),
+    ],
+)
+def test_manager_on_store_matches_list(capsys, operation, args):
+    plain = WordListManager.for_testing(list(WORDS))
+    compact = WordListManager(word_list=list(WORDS), save_on_change=False, compact=True)
+    assert isinstance(compact.word_list, WordStore)
+
+    getattr(plain, operation)(*args)
+    getattr(compact, operation)(*args)
+
+    assert compact.word_list == plain.word_list
+    assert compact.stats.to_dict() == plain.stats.to_dict()
+    assert compact.frequency().to_dict() == plain.frequency().to_dict()
+
+
+def test_large_lists_load_and_change_in_less_memory(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(store_module, "BATCH", 1024)
+    monkeypatch.setattr(utils, "COMPACT_MIN", 1000)
+    words = synthetic_words(20_000)
+    words += words[:5000]
+    random.Random(1).shuffle(words)
+    path = tmp_path / "large-5.txt"
+    path.write_text("\n".join(words) + "\n")
+    del words
+
+    def peak(compact):
+        tracemalloc.start()
+        try:
+            manager = WordListManager(
+                storage=TextStorage(str(path)), save_on_change=False, compact=compact
+            )
+            manager.remove_duplicates()
+            manager.sort_words()
+            return type(manager.word_list), tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    store_type, store_peak = peak(None)
+    list_type, list_peak = peak(False)
+    assert (store_type, list_type) == (WordStore, list)
+    assert store_peak < list_peak / 2
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from src.wordle_manager import timings
+from src.wordle_manager.main import main
+from src.wordle_manager.utils import WordListManager
+
+
+@pytest.fixture(autouse=True)
+def timings_off(monkeypatch):
+    monkeypatch.delenv(timings.ENV_VAR, raising=False)
+    yield
+    timings.stop()
+
+
+def test_disabled_phases_and_counts_do_nothing():
+    assert not timings.enabled()
+    with timings.phase("load"):
+        timings.count("words_scanned", 10)
+    assert timings.stop() is None
+
+
+def test_phases_accumulate():
+    recorded = timings.start()
+    for _ in range(2):
+        with timings.phase("load"):
+            timings.count("words_scanned", 5)
+    with pytest.raises(KeyError):
+        with timings.phase("save"):
+            raise KeyError("timed anyway")
+    report = recorded.to_dict("stats")
+    assert report["command"] == "stats"
+    assert report["phases"]["load"]["calls"] == 2
+    assert report["phases"]["save"]["calls"] == 1
+    assert report["counters"] == {"words_scanned": 10}
+    assert report["total_ms"] >= report["phases"]["load"]["ms"]
+
+
+@pytest.mark.parametrize(
+    "flag, path, env, expected",
+    [
+        (False, None, {}, None),
+        (True, None, {}, "-"),
+        (True, "t.json", {}, "t.json"),
+        (False, None, {"WW_TIMINGS": "1"}, "-"),
+        (False, None, {"WW_TIMINGS": "0"}, None),
+        (False, None, {"WW_TIMINGS": "out.json"}, "out.json"),
+    ],
+)
+def test_destination(flag, path, env, expected):
+    assert timings.destination(flag, path, env) == expected
+
+
+def test_selection_reports_phases_on_stderr(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["ww", "--timings", "-n", "2", "--seed", "1"])
+    main()
+    captured = capsys.readouterr()
+    assert captured.out.startswith("Selected words:")
+    report = json.loads(captured.err)
+    assert report["command"] == "select"
+    assert list(report["phases"]) == ["import", "load", "sample", "output"]
+    assert report["counters"]["words_scanned"] >= 2
+    assert not timings.enabled()
+
+
+def test_constrained_search_counts_backtracks(monkeypatch, capsys):
+    monkeypatch.setenv(timings.ENV_VAR, "1")
+    monkeypatch.setattr("sys.argv", ["ww", "-n", "2", "--require", "xq"])
+    main()
+    report = json.loads(capsys.readouterr().err)
+    assert {"filter", "search"} <= set(report["phases"])
+    assert report["counters"]["candidates"] > 0
+    assert "backtracks" in report["counters"]
+
+
+def test_manager_commands_append_to_file(monkeypatch, tmp_path, capsys):
+    output = tmp_path / "timings.jsonl"
+    monkeypatch.setattr(
+        "src.wordle_manager.main.WordListManager",
+        lambda **options: WordListManager.for_testing(["crane", "xyz", "adieu"]),
+    )
+    for action in (["clean", "--dry-run"], ["stats"]):
+        argv = ["ww", "--timings-file", str(output), *action]
+        monkeypatch.setattr("sys.argv", argv)
+        main()
+    reports = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [report["command"] for report in reports] == ["clean", "stats"]
+    assert reports[0]["counters"] == {"words_scanned": 3, "words_rejected": 1}
+    assert "filter" in reports[0]["phases"]
+    assert capsys.readouterr().err == ""
+
@@ -0,0 +1,133 @@
+import pytest
+
+from src.wordle_manager import validation
+from src.wordle_manager.utils import WordListManager, is_valid_word
+from src.wordle_manager.validation import (
+    Alphabetic,
+    Blocklist,
+    HasVowel,
+    Length,
+    Pipeline,
+    Regex,
+    Rule,
+    ValidationError,
+    default_pipeline,
+)
+
+WORDS = ["house", "inv@l", "xyz", "crwth", "plant", "hello", "house"]
+
+
+@pytest.mark.parametrize(
+    "rule, word, valid",
+    [
+        (Length(5), "house", True),
+        (Length(5), "xyz", False),
+        (Alphabetic(), "inv@l", False),
+        (HasVowel(), "crwth", False),
+        (HasVowel(), "myths", True),
+        (Blocklist(["Hello"]), "hello", False),
+        (Regex("[^p].*"), "plant", False),
+        (Regex("h"), "house", False),
+    ],
+)
+def test_rule_flags_match_single_checks(rule, word, valid):
+    assert bool(rule(word)) is valid
+    assert [bool(flag) for flag in rule.flags([word])] == [valid]
+
+
+def test_rules_must_define_the_check():
+    class Unchecked(Rule):
+        name = "unchecked"
+
+    with pytest.raises(TypeError):
+        Unchecked()
+
+
+def test_first_failing_rule_is_the_reason():
+    pipeline = Pipeline([Length(5), Alphabetic()])
+    assert pipeline.reason("ab@") == "not 5 letters"
+    assert pipeline.reason("inv@l") == "not alphabetic"
+    assert pipeline.reason("house") is None
+
+
+def test_run_keeps_order_and_reasons():
+    pipeline = default_pipeline(5, Blocklist(["hello"]), ["[^p].*"])
+    report = pipeline.run(WORDS, jobs=1)
+    assert report.valid == ["house", "house"]
+    assert sorted(report.rejected) == [
+        ("crwth", "no vowel"),
+        ("hello", "blocklisted"),
+        ("inv@l", "not alphabetic"),
+        ("plant", "does not match '[^p].*'"),
+        ("xyz", "not 5 letters"),
+    ]
+    assert len(report) == 5
+
+
+def test_default_pipeline_agrees_with_is_valid_word():
+    report = default_pipeline(5).run(WORDS)
+    assert report.valid == [word for word in WORDS if is_valid_word(word)]
+
+
+def test_chunks_stream_in_order(monkeypatch):
+    monkeypatch.setattr(validation, "CHUNK_SIZE", 2)
+    chunks = list(default_pipeline(5).iter_chunks(iter(WORDS)))
+    assert len(chunks) == 4
+    assert [word for valid, _ in chunks for word in valid] == [
+        "house",
+        "plant",
+        "hello",
+        "house",
+    ]
+
+
+def test_parallel_run_matches_serial(monkeypatch):
+    monkeypatch.setattr(validation, "CHUNK_SIZE", 3)
+    pipeline = default_pipeline(5, Blocklist(["hello"]))
+    parallel = pipeline.run(WORDS * 3, jobs=2)
+    serial = pipeline.run(WORDS * 3, jobs=1)
+    assert parallel.valid == serial.valid
+    assert parallel.rejected == serial.rejected
+
+
+def test_parallel_chunks_are_read_as_needed(monkeypatch):
+    monkeypatch.setattr(validation, "CHUNK_SIZE", 2)
+    read = []
+
+    def words():
+        for word in WORDS * 10:
+            read.append(word)
+            yield word
+
+    chunks = default_pipeline(5).iter_chunks(words(), jobs=2)
+    next(chunks)
+    # Only the window of two chunks per worker has been read
+    assert len(read) == 4 * 2
+    assert len(list(chunks)) == 34
+    assert len(read) == len(WORDS) * 10
+
+
+def test_invalid_regex_is_reported():
+    with pytest.raises(ValidationError, match="Invalid pattern"):
+        Regex("(")
+
+
+def test_dry_run_leaves_list_alone(tmp_path, capsys):
+    blocklist = tmp_path / "block.txt"
+    blocklist.write_text("hello\n")
+    manager = WordListManager.for_testing(list(WORDS))
+    report = manager.remove_invalid_words(dry_run=True, blocklist_file=blocklist)
+    assert manager.word_list == WORDS
+    assert len(report) == 4
+    output = capsys.readouterr().out
+    assert output.startswith("Would remove 4 invalid words\n")
+    assert "- hello  (blocklisted)" in output
+
+
+def test_clean_applies_patterns_and_updates_stats():
+    manager = WordListManager.for_testing(list(WORDS))
+    assert manager.stats.total == len(WORDS)
+    manager.remove_invalid_words(patterns=["[^p].*"])
+    assert manager.word_list == ["house", "hello", "house"]
+    assert manager.stats.total == 3
+    assert manager.stats.duplicates == 1
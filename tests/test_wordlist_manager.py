@@ -175,3 +175,36 @@ class TestRemoveInvalidWords:
             assert "inv@l" not in words.word_list  # Invalid: special character
             assert "xyz" not in words.word_list  # Invalid: no vowels
             assert "house" in words.word_list  # Valid: 5 letters, alpha, has vowels
+
+
+class TestImportWords:
+    def test_import_adds_valid_new_words_once(self, safe_testing_environment):
+        mock_save = safe_testing_environment
+        manager = WordListManager()
+        original_count = len(words.word_list)
+
+        added = manager.import_words(
+            ["Zonky quaff\n", "zonky\n", "crane\n", "inv@l brrrr\n", "\n", "toolong\n"]
+        )
+
+        assert added == 1
+        assert "zonky" in words.word_list
+        assert len(words.word_list) == original_count + 1
+        assert mock_save.call_count == 1
+
+    def test_import_reports_throughput(self, capsys):
+        manager = WordListManager.for_testing(["crane"])
+
+        manager.import_words(["adieu", "crane", "b4d"], chunk_size=2)
+
+        output = capsys.readouterr().out
+        assert "Imported 1 new words (1 duplicates, 1 invalid)" in output
+        assert "words/sec" in output
+        assert manager.word_list == ["crane", "adieu"]
+
+    def test_import_nothing_new_does_not_save(self, safe_testing_environment):
+        mock_save = safe_testing_environment
+        manager = WordListManager()
+
+        assert manager.import_words(["crane"]) == 0
+        assert not mock_save.called